@@ -6,19 +6,31 @@ from account.adapter.input.web.response.account_response import AccountResponse
 from account.adapter.input.web.request.update_account_request import UpdateAccountRequest
 from account.application.usecase.account_usecase import AccountUseCase
 from account.infrastructure.orm.account_orm import OAuthProvider
+from config.database.session import request_db_session
 from config.redis_config import get_redis
 from sosial_oauth.infrastructure.service.google_oauth2_service import GoogleOAuth2Service
 from util.log.log import Log
 from util.cache.ai_cache import AICache
 
-account_router = APIRouter()
+# 요청마다 AsyncSession 하나를 열어 repository 호출에서 공유
+account_router = APIRouter(dependencies=[Depends(request_db_session)])
 usecase = AccountUseCase().get_instance()
 redis_client = get_redis()
 logger = Log.get_logger()
 
+# 경로 파라미터 라우트보다 먼저 등록
+@account_router.get("/cache/stats")
+async def get_account_cache_stats(session_id: str = Depends(get_current_user)):
+    """계정 조회 캐시 적중률 (로그인 사용자만)"""
+    # get_current_user 는 쿠키가 없으면 GUEST 세션을 새로 만들어 주므로 GUEST는 별도로 거부
+    user_token = redis_client.hget(session_id, "USER_TOKEN")
+    if not user_token or user_token in (b"GUEST", "GUEST"):
+        raise HTTPException(status_code=401, detail="Login required")
+    return {"success": True, "stats": usecase.get_cache_stats()}
+
 @account_router.get("/{oauth_type}/{oauth_id}", response_model=AccountResponse)
-def get_account_by_oauth_id(oauth_type: str, oauth_id: str):
-    account = usecase.get_account_by_oauth_id(oauth_type, oauth_id)
+async def get_account_by_oauth_id(oauth_type: str, oauth_id: str):
+    account = await usecase.get_account_by_oauth_id(oauth_type, oauth_id)
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
     return AccountResponse(
@@ -43,7 +55,7 @@ async def update_account(
 ):
 
     # 기존 계정 조회 (세션 ID로)
-    existing_account = usecase.get_account_by_session_id(session_id)
+    existing_account = await usecase.get_account_by_session_id(session_id)
     if not existing_account:
         raise HTTPException(status_code=404, detail="Account not found")
 
@@ -61,7 +73,7 @@ async def update_account(
     )
     await usecase.update_account(updated_account)
 
-    updated_account = usecase.get_account_by_session_id(session_id)
+    updated_account = await usecase.get_account_by_session_id(session_id)
 
     return AccountResponse(
         session_id=updated_account.session_id,
@@ -82,13 +94,13 @@ async def update_account(
     )
 
 @account_router.delete("/{oauth_type}/{oauth_id}")
-def delete_account_by_oauth_id(oauth_type: str, oauth_id: str):
-    return usecase.delete_account_by_oauth_id(oauth_type, oauth_id)
+async def delete_account_by_oauth_id(oauth_type: str, oauth_id: str):
+    return await usecase.delete_account_by_oauth_id(oauth_type, oauth_id)
 
 @account_router.get("/me")
-def get_account_by_session_id(session_id: str = Depends(get_current_user)):
+async def get_account_by_session_id(session_id: str = Depends(get_current_user)):
 
-    return usecase.get_account_by_session_id(session_id)
+    return await usecase.get_account_by_session_id(session_id)
 
 @account_router.delete("/session_out")
 def delete_session_by_session_id(session_id: str = Depends(get_current_user)):
@@ -130,7 +142,7 @@ async def departure(request: Request, session_id: str | None = Cookie(None)):
         return response
 
     # session_id로 계정 조회
-    account = usecase.get_account_by_session_id(session_id)
+    account = await usecase.get_account_by_session_id(session_id)
     logger.debug("Account found")
 
     if not account:
@@ -159,7 +171,7 @@ async def departure(request: Request, session_id: str | None = Cookie(None)):
                 # GUEST 토큰이 아닌 경우에만 revoke 시도
                 if access_token != "GUEST":
                     logger.debug("Calling GoogleOAuth2Service.revoke_token()...")
-                    result = GoogleOAuth2Service.revoke_token(access_token)
+                    result = await GoogleOAuth2Service.revoke_token(access_token)
                     logger.debug(f"Google token revoke result: {result}")
                     logger.debug("Google token revoked successfully")
 
@@ -177,7 +189,7 @@ async def departure(request: Request, session_id: str | None = Cookie(None)):
         logger.debug("Non-Google account detected, skipping token revoke")
 
     # 계정 삭제 (향후 table이 account 외에 더 늘어날 경우 이쪽에 테이블 삭제 로직 추가)
-    deleted = usecase.delete_account_by_oauth_id(account.oauth_type, account.oauth_id)
+    deleted = await usecase.delete_account_by_oauth_id(account.oauth_type, account.oauth_id)
     logger.debug("Account deleted: %s", deleted)
 
     # Redis 세션 삭제
@@ -7,13 +7,21 @@ from account.domain.account import Account
 class AccountRepositoryPort(ABC):
 
     @abstractmethod
-    def get_account_by_oauth_id(self, session_id:str, oauth_type: str, user_oauth_id: str) -> Optional[Account]:
+    async def save(self, account: Account) -> Account:
         pass
 
     @abstractmethod
-    def get_account_by_session_id(self, session_id: str) -> Optional[Account]:
+    async def update(self, account: Account) -> Account:
         pass
 
     @abstractmethod
-    def delete_account_by_oauth_id(self, oauth_type: str, oauth_id: str) -> bool:
-        pass
\ No newline at end of file
+    async def get_account_by_oauth_id(self, oauth_type: str, user_oauth_id: str) -> Optional[Account]:
+        pass
+
+    @abstractmethod
+    async def get_account_by_session_id(self, session_id: str) -> Optional[Account]:
+        pass
+
+    @abstractmethod
+    async def delete_account_by_oauth_id(self, oauth_type: str, oauth_id: str) -> bool:
+        pass
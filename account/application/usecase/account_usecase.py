@@ -1,7 +1,7 @@
 from typing import Optional
 
 from account.domain.account import Account
-from account.infrastructure.repository.account_repository_impl import AccountRepositoryImpl
+from account.infrastructure.repository.cached_account_repository import CachedAccountRepository
 from account.adapter.input.web.request.update_account_request import UpdateAccountRequest
 from util.log.log import Log
 
@@ -12,7 +12,8 @@ class AccountUseCase:
     def __new__(cls, *args, **kwargs):
         if cls.__instance is None:
             cls.__instance = super().__new__(cls)
-            cls.__instance.account_repo = AccountRepositoryImpl.get_instance()
+            # 조회는 캐시(L1 → Redis)를 먼저 확인, 쓰기 시 캐시 무효화
+            cls.__instance.account_repo = CachedAccountRepository.get_instance()
         return cls.__instance
 
     @classmethod
@@ -25,7 +26,7 @@ class AccountUseCase:
         account = Account(session_id=session_id, oauth_id=oauth_id, oauth_type=oauth_type, nickname=nickname, name=name, profile_image=profile_image, email=email, phone_number=phone_number, active_status=active_status, role_id=role_id)
         return await self.account_repo.save(account)
     
-    def update_account(self, updated_account: UpdateAccountRequest):
+    async def update_account(self, updated_account: UpdateAccountRequest):
         session_id = updated_account.session_id
         nickname = updated_account.nickname
         profile_image = updated_account.profile_image
@@ -37,15 +38,14 @@ class AccountUseCase:
         logger.info(f"nickname={nickname}")
         
         # 기존 계정 조회
-        existing_account = self.account_repo.get_account_by_session_id(session_id)
+        existing_account = await self.account_repo.get_account_by_session_id(session_id)
         logger.info(f"existing_account={existing_account}")
         
         if existing_account is None:
             raise Exception("Account not found")
 
         # 기존 값과 업데이트 값 병합
-        updated_account = Account.update(
-            self,
+        updated_account = existing_account.update(
             session_id=session_id if session_id is not None else existing_account.session_id,
             nickname=nickname if nickname is not None else existing_account.nickname,
             profile_image=profile_image if profile_image is not None else existing_account.profile_image,
@@ -57,13 +57,20 @@ class AccountUseCase:
             target_period=target_period if target_period is not None else existing_account.target_period,
             target_amount=target_amount if target_amount is not None else existing_account.target_amount,
         )
-        return self.account_repo.update(updated_account)
+        return await self.account_repo.update(updated_account)
 
-    def get_account_by_oauth_id(self, oauth_type:str, oauth_id: str) -> Optional[Account]:
-        return self.account_repo.get_account_by_oauth_id(oauth_type, oauth_id)
+    async def update_profile(self, account: Account) -> Account:
+        # 로그인 시 OAuth 프로필(이름/이미지/이메일) 변경 반영
+        return await self.account_repo.update(account)
 
-    def get_account_by_session_id(self, session_id: str) -> Optional[Account]:
-        return self.account_repo.get_account_by_session_id(session_id)
+    async def get_account_by_oauth_id(self, oauth_type:str, oauth_id: str) -> Optional[Account]:
+        return await self.account_repo.get_account_by_oauth_id(oauth_type, oauth_id)
 
-    def delete_account_by_oauth_id(self, oauth_type: str, oauth_id: str) -> bool:
-        return self.account_repo.delete_account_by_oauth_id(oauth_type, oauth_id)
\ No newline at end of file
+    async def get_account_by_session_id(self, session_id: str) -> Optional[Account]:
+        return await self.account_repo.get_account_by_session_id(session_id)
+
+    async def delete_account_by_oauth_id(self, oauth_type: str, oauth_id: str) -> bool:
+        return await self.account_repo.delete_account_by_oauth_id(oauth_type, oauth_id)
+
+    def get_cache_stats(self) -> dict:
+        return self.account_repo.get_stats()
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Enum as SAEnum, Integer
+from sqlalchemy import Column, String, DateTime, Enum as SAEnum, Integer, UniqueConstraint
 from enum import Enum as PyEnum
 from datetime import datetime
 
@@ -15,6 +15,10 @@ class YN(PyEnum):
 
 class AccountORM(Base):
     __tablename__ = "account"
+    # 로그인 시 (oauth_type, oauth_id)로 조회 - 마이그레이션 m001과 동일
+    __table_args__ = (
+        UniqueConstraint("oauth_type", "oauth_id", name="uq_account_oauth_type_oauth_id"),
+    )
 
     session_id = Column(String(255), primary_key=True, nullable=False)
     oauth_id = Column(String(255), nullable=False)
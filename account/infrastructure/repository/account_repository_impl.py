@@ -2,14 +2,13 @@ from typing import Optional
 from account.application.port.account_repository_port import AccountRepositoryPort
 from account.domain.account import Account
 from account.infrastructure.orm.account_orm import AccountORM
-from config.database.session import get_db_session
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from config.database.session import db_session
+from sqlalchemy import and_, delete, select
 
 
 class AccountRepositoryImpl(AccountRepositoryPort):
     __instance = None
-    
+
 
     def __new__(cls, *args, **kwargs):
         if cls.__instance is None:
@@ -23,9 +22,26 @@ class AccountRepositoryImpl(AccountRepositoryPort):
             cls.__instance = cls()
         return cls.__instance
 
-    def __init__(self):
-        if not hasattr(self, 'db'):
-            self.db: Session = get_db_session()
+    @staticmethod
+    def _to_domain(orm_account: AccountORM) -> Account:
+        account = Account(
+            session_id=orm_account.session_id,
+            oauth_id=orm_account.oauth_id,
+            oauth_type=orm_account.oauth_type,
+            nickname=orm_account.nickname,
+            name=orm_account.name,
+            profile_image=orm_account.profile_image,
+            email=orm_account.email,
+            phone_number=orm_account.phone_number,
+            active_status=orm_account.active_status,
+            role_id=orm_account.role_id
+        )
+        account.automatic_analysis_cycle = orm_account.automatic_analysis_cycle or 0
+        account.target_period = orm_account.target_period or 0
+        account.target_amount = orm_account.target_amount or 0
+        account.created_at = orm_account.created_at
+        account.updated_at = orm_account.updated_at
+        return account
 
     async def save(self, account: Account) -> Account:
         orm_account = AccountORM(
@@ -44,90 +60,69 @@ class AccountRepositoryImpl(AccountRepositoryPort):
             target_amount=account.target_amount
         )
 
-        self.db.add(orm_account)
-        self.db.commit()
-        self.db.refresh(orm_account)
+        async with db_session() as db:
+            db.add(orm_account)
+            await db.commit()
+            await db.refresh(orm_account)
 
         account.created_at = orm_account.created_at
         account.updated_at = orm_account.updated_at
         return account
-    
+
     async def update(self, account: Account) -> Account:
-        # 기존 레코드 조회 (예: session_id 기준)
-        orm_account = self.db.query(AccountORM).filter_by(session_id=account.session_id).first()
-        if orm_account is None:
-            raise Exception("Account not found for update")
-
-        # 기존 ORM 객체의 속성을 도메인 객체 값으로 덮어쓰기
-        orm_account.nickname = account.nickname
-        orm_account.profile_image = account.profile_image
-        orm_account.email = account.email
-        orm_account.phone_number = account.phone_number
-        orm_account.active_status = account.active_status
-        orm_account.role_id = account.role_id
-        orm_account.automatic_analysis_cycle = account.automatic_analysis_cycle
-        orm_account.target_period = account.target_period
-        orm_account.target_amount = account.target_amount
-
-        self.db.add(orm_account)
-        self.db.commit()
-        self.db.refresh(orm_account)
+        async with db_session() as db:
+            # 기존 레코드 조회 (예: session_id 기준)
+            result = await db.execute(select(AccountORM).filter_by(session_id=account.session_id))
+            orm_account = result.scalars().first()
+            if orm_account is None:
+                raise Exception("Account not found for update")
+
+            # 기존 ORM 객체의 속성을 도메인 객체 값으로 덮어쓰기
+            orm_account.nickname = account.nickname
+            orm_account.name = account.name
+            orm_account.profile_image = account.profile_image
+            orm_account.email = account.email
+            orm_account.phone_number = account.phone_number
+            orm_account.active_status = account.active_status
+            orm_account.role_id = account.role_id
+            orm_account.automatic_analysis_cycle = account.automatic_analysis_cycle
+            orm_account.target_period = account.target_period
+            orm_account.target_amount = account.target_amount
+
+            await db.commit()
+            await db.refresh(orm_account)
 
         account.created_at = orm_account.created_at
         account.updated_at = orm_account.updated_at
         return account
 
-    def get_account_by_oauth_id(self, oauth_type: str, user_oauth_id: str) -> Optional[Account]:
-        orm_account = self.db.query(AccountORM).filter(AccountORM.oauth_type == oauth_type,
-                                                       AccountORM.oauth_id == user_oauth_id).first()
+    async def get_account_by_oauth_id(self, oauth_type: str, user_oauth_id: str) -> Optional[Account]:
+        async with db_session() as db:
+            result = await db.execute(select(AccountORM).filter(AccountORM.oauth_type == oauth_type,
+                                                                AccountORM.oauth_id == user_oauth_id))
+            orm_account = result.scalars().first()
         if orm_account:
-            account = Account(
-                session_id=orm_account.session_id,
-                oauth_id=orm_account.oauth_id,
-                oauth_type=orm_account.oauth_type,
-                nickname=orm_account.nickname,
-                name=orm_account.name,
-                profile_image=orm_account.profile_image,
-                email=orm_account.email,
-                phone_number=orm_account.phone_number,
-                active_status=orm_account.active_status,
-                role_id=orm_account.role_id
-            )
-            account.created_at = orm_account.created_at
-            account.updated_at = orm_account.updated_at
-            return account
+            return self._to_domain(orm_account)
         return None
 
-    def get_account_by_session_id(self, session_id: str) -> Optional[Account]:
-        
-        orm_account = self.db.query(AccountORM).filter(AccountORM.session_id == session_id).first()
-        
+    async def get_account_by_session_id(self, session_id: str) -> Optional[Account]:
+        async with db_session() as db:
+            result = await db.execute(select(AccountORM).filter(AccountORM.session_id == session_id))
+            orm_account = result.scalars().first()
         if orm_account:
-            account = Account(
-                session_id=orm_account.session_id,
-                oauth_id=orm_account.oauth_id,
-                oauth_type=orm_account.oauth_type,
-                nickname=orm_account.nickname,
-                name=orm_account.name,
-                profile_image=orm_account.profile_image,
-                email=orm_account.email,
-                phone_number=orm_account.phone_number,
-                active_status=orm_account.active_status,
-                role_id=orm_account.role_id
-            )
-            account.created_at = orm_account.created_at
-            account.updated_at = orm_account.updated_at
-            return account
+            return self._to_domain(orm_account)
         return None
 
-    def delete_account_by_oauth_id(self, oauth_type: str, oauth_id: str) -> bool:
-        deleted_count = self.db.query(AccountORM).filter(
-            and_(
-                AccountORM.oauth_type == oauth_type,
-                AccountORM.oauth_id == oauth_id
+    async def delete_account_by_oauth_id(self, oauth_type: str, oauth_id: str) -> bool:
+        async with db_session() as db:
+            result = await db.execute(
+                delete(AccountORM).where(
+                    and_(
+                        AccountORM.oauth_type == oauth_type,
+                        AccountORM.oauth_id == oauth_id
+                    )
+                )
             )
-        ).delete(synchronize_session=False)
-
-        self.db.commit()
+            await db.commit()
 
-        return deleted_count > 0
\ No newline at end of file
+        return result.rowcount > 0
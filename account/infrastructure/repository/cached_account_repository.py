@@ -0,0 +1,220 @@
+import json
+import os
+from datetime import datetime
+from typing import Optional
+
+from account.application.port.account_repository_port import AccountRepositoryPort
+from account.domain.account import Account
+from account.infrastructure.orm.account_orm import OAuthProvider, YN
+from account.infrastructure.repository.account_repository_impl import AccountRepositoryImpl
+from config.crypto import Crypto
+from config.redis_config import get_redis
+from util.cache.local_lru_cache import LocalLRUCache
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+
+class CachedAccountRepository(AccountRepositoryPort):
+    """
+    계정 조회 read-through 캐시 (프로세스 내 TTL 캐시 → Redis → MySQL)
+
+    - session_id / (oauth_type, oauth_id) 두 키로 같은 계정을 캐싱
+    - save / update / delete 시 두 키 모두 무효화
+    - Redis 값은 개인정보(이메일, 전화번호)가 있어 암호화 저장
+    - 다른 프로세스의 L1은 무효화되지 않으므로 L1 TTL은 짧게 유지
+    - CRYPTO_KEY / CRYPTO_IV 가 없으면(프로세스마다 임의 키) 다른 프로세스가 읽을 수 없으므로 Redis 단계는 사용하지 않음
+    """
+
+    SESSION_KEY_PREFIX = "account_cache:sid:"
+    OAUTH_KEY_PREFIX = "account_cache:oauth:"
+    REDIS_TTL = int(os.getenv("ACCOUNT_CACHE_TTL", 300))
+    L1_TTL = int(os.getenv("ACCOUNT_CACHE_L1_TTL", 30))
+    L1_MAX_BYTES = int(os.getenv("ACCOUNT_CACHE_L1_MAX_BYTES", 4 * 1024 * 1024))
+
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self):
+        if not hasattr(self, "repository"):
+            self.repository: AccountRepositoryPort = AccountRepositoryImpl.get_instance()
+            self.redis_client = get_redis()
+            self.crypto = Crypto.get_instance()
+            self.local_cache = LocalLRUCache(max_bytes=self.L1_MAX_BYTES, max_ttl=self.L1_TTL)
+            self.redis_enabled = Crypto.is_shared_key()
+            if not self.redis_enabled:
+                logger.warning("[WARN] CRYPTO_KEY / CRYPTO_IV not set - account cache uses in-process tier only")
+
+            self.redis_hits = 0
+            self.misses = 0
+
+    # -----------------------
+    # 키 / 직렬화
+    # -----------------------
+    @staticmethod
+    def _enum_value(value):
+        return value.value if hasattr(value, "value") else value
+
+    def _session_key(self, session_id: str) -> str:
+        return f"{self.SESSION_KEY_PREFIX}{session_id}"
+
+    def _oauth_key(self, oauth_type, oauth_id: str) -> str:
+        return f"{self.OAUTH_KEY_PREFIX}{self._enum_value(oauth_type)}:{oauth_id}"
+
+    def _serialize(self, account: Account) -> str:
+        return json.dumps({
+            "session_id": account.session_id,
+            "oauth_id": account.oauth_id,
+            "oauth_type": self._enum_value(account.oauth_type),
+            "nickname": account.nickname,
+            "name": account.name,
+            "profile_image": account.profile_image,
+            "email": account.email,
+            "phone_number": account.phone_number,
+            "active_status": self._enum_value(account.active_status),
+            "role_id": account.role_id,
+            "automatic_analysis_cycle": account.automatic_analysis_cycle,
+            "target_period": account.target_period,
+            "target_amount": account.target_amount,
+            "created_at": account.created_at.isoformat() if account.created_at else None,
+            "updated_at": account.updated_at.isoformat() if account.updated_at else None
+        }, ensure_ascii=False)
+
+    @staticmethod
+    def _deserialize(data: str) -> Account:
+        values = json.loads(data)
+        # DB에서 읽은 것과 같은 타입으로 복원 (router에서 OAuthProvider 비교)
+        oauth_type = values["oauth_type"]
+        active_status = values["active_status"]
+        account = Account(
+            session_id=values["session_id"],
+            oauth_id=values["oauth_id"],
+            oauth_type=OAuthProvider(oauth_type) if oauth_type in OAuthProvider.__members__ else oauth_type,
+            nickname=values["nickname"],
+            name=values["name"],
+            profile_image=values["profile_image"],
+            email=values["email"],
+            phone_number=values["phone_number"],
+            active_status=YN(active_status) if active_status in YN.__members__ else active_status,
+            role_id=values["role_id"]
+        )
+        account.automatic_analysis_cycle = values["automatic_analysis_cycle"]
+        account.target_period = values["target_period"]
+        account.target_amount = values["target_amount"]
+        account.created_at = datetime.fromisoformat(values["created_at"]) if values["created_at"] else None
+        account.updated_at = datetime.fromisoformat(values["updated_at"]) if values["updated_at"] else None
+        return account
+
+    # -----------------------
+    # 캐시 조회 / 저장 / 무효화
+    # -----------------------
+    def _get_cached(self, key: str) -> Optional[Account]:
+        data = self.local_cache.get(key)
+        if data is not None:
+            return self._deserialize(data)
+        if not self.redis_enabled:
+            return None
+
+        try:
+            stored = self.redis_client.get(key)
+            if stored is None:
+                return None
+            data = self.crypto.dec_data(stored)
+        except Exception as e:
+            logger.error(f"Account cache read error: {e}")
+            return None
+
+        self.redis_hits += 1
+        self.local_cache.set(key, data, self.L1_TTL)
+        return self._deserialize(data)
+
+    def _set_cached(self, account: Account) -> None:
+        data = self._serialize(account)
+        keys = [self._session_key(account.session_id), self._oauth_key(account.oauth_type, account.oauth_id)]
+        for key in keys:
+            self.local_cache.set(key, data, self.L1_TTL)
+        if not self.redis_enabled:
+            return
+
+        try:
+            encrypted = self.crypto.enc_data(data)
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key in keys:
+                pipe.setex(key, self.REDIS_TTL, encrypted)
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"Account cache write error: {e}")
+
+    def _invalidate(self, account: Account) -> None:
+        keys = [self._session_key(account.session_id), self._oauth_key(account.oauth_type, account.oauth_id)]
+        self.local_cache.delete(keys)
+        try:
+            self.redis_client.delete(*keys)
+        except Exception as e:
+            logger.error(f"Account cache invalidate error: {e}")
+
+    async def _read_through(self, key: str, load) -> Optional[Account]:
+        account = self._get_cached(key)
+        if account is not None:
+            return account
+
+        self.misses += 1
+        account = await load()
+        # 없는 계정은 캐싱하지 않음 (로그인 직후 생성되므로)
+        if account is not None:
+            self._set_cached(account)
+        return account
+
+    # -----------------------
+    # AccountRepositoryPort
+    # -----------------------
+    async def save(self, account: Account) -> Account:
+        saved = await self.repository.save(account)
+        self._invalidate(saved)
+        return saved
+
+    async def update(self, account: Account) -> Account:
+        updated = await self.repository.update(account)
+        self._invalidate(updated)
+        return updated
+
+    async def get_account_by_oauth_id(self, oauth_type: str, user_oauth_id: str) -> Optional[Account]:
+        return await self._read_through(
+            self._oauth_key(oauth_type, user_oauth_id),
+            lambda: self.repository.get_account_by_oauth_id(oauth_type, user_oauth_id)
+        )
+
+    async def get_account_by_session_id(self, session_id: str) -> Optional[Account]:
+        return await self._read_through(
+            self._session_key(session_id),
+            lambda: self.repository.get_account_by_session_id(session_id)
+        )
+
+    async def delete_account_by_oauth_id(self, oauth_type: str, oauth_id: str) -> bool:
+        # session_id 키도 지워야 하므로 삭제 전에 계정 조회
+        account = await self.get_account_by_oauth_id(oauth_type, oauth_id)
+        deleted = await self.repository.delete_account_by_oauth_id(oauth_type, oauth_id)
+        if account is not None:
+            self._invalidate(account)
+        return deleted
+
+    def get_stats(self) -> dict:
+        l1_stats = self.local_cache.get_stats()
+        lookups = l1_stats["hits"] + self.redis_hits + self.misses
+        return {
+            "redis_enabled": self.redis_enabled,
+            "l1": l1_stats,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_rate": round((l1_stats["hits"] + self.redis_hits) / lookups * 100, 2) if lookups else 0.0
+        }
@@ -1,37 +1,108 @@
 import os
+from contextlib import asynccontextmanager
+
 from dotenv import load_dotenv
+from sqlalchemy import text
 
 from account.adapter.input.web.account_router import account_router
-from config.database.session import Base, engine
-from documents_multi_agents.adapter.input.web.document_multi_agent_router import documents_multi_agents_router
+from config.database.session import async_engine, engine
+from config.redis_config import close_async_redis, get_redis
+from documents_multi_agents.adapter.input.web.document_multi_agent_router import documents_multi_agents_router, MAX_FILE_SIZE
+from documents_multi_agents.adapter.input.worker.analysis_worker import AnalysisWorkerPool
+from documents_multi_agents.infrastructure.service.pdf_text_extractor import PdfTextExtractor
 from kftc.adapter.input.web.kftc_router import kftc_router
 from sosial_oauth.adapter.input.web.google_oauth2_router import authentication_router
+from util.http.shared_http_client import SharedHttpClient
+from util.llm.llm_gateway import LLMGateway
+from util.log.log import Log
+from util.upload.upload_limit import MaxBodySizeMiddleware, MULTIPART_OVERHEAD
 
 load_dotenv()
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-
-app = FastAPI()
+logger = Log.get_logger()
 
 origins = [
     "http://localhost:3000",  # Next.js 프론트 엔드 URL
 ]
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=origins,       # 정확한 origin만 허용
-    allow_credentials=True,      # 쿠키 허용
-    allow_methods=["*"],         # 모든 HTTP 메서드 허용
-    allow_headers=["*"],         # 모든 헤더 허용
-)
 
-app.include_router(account_router, prefix="/account")
-app.include_router(authentication_router, prefix="/authentication")
-app.include_router(documents_multi_agents_router, prefix="/documents-multi-agents")
-app.include_router(documents_multi_agents_router, prefix="/flow")  # 프론트엔드 호환용
-app.include_router(kftc_router, prefix="/kftc")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    공유 리소스 수명 관리 (워커 프로세스마다 한 번)
+
+    - 시작: Redis / DB 커넥션 풀 예열, LLM 클라이언트 준비, 분석 워커 시작
+    - 종료: 워커 중지 후 HTTP / DB / Redis 커넥션과 PDF 프로세스 풀 정리
+    - 스키마 변경은 부팅 경로에서 하지 않음 (python -m config.database.migrate)
+    """
+    redis_client = get_redis()
+    llm_gateway = LLMGateway.get_instance()
+    http_client = SharedHttpClient.get_instance()
+    http_client.get()  # 외부 API(OAuth 등) 공유 클라이언트 생성
+    pdf_text_extractor = PdfTextExtractor.get_instance()
+    analysis_worker_pool = AnalysisWorkerPool()
+    app.state.analysis_worker_pool = analysis_worker_pool
+
+    # 첫 요청에서 커넥션을 맺지 않도록 미리 연결
+    try:
+        redis_client.ping()
+    except Exception as e:
+        logger.error(f"Redis warm-up failed: {e}")
+    try:
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    except Exception as e:
+        logger.error(f"DB warm-up failed: {e}")
+
+    # 문서 분석 작업 워커 (external 모드면 별도 프로세스에서 실행)
+    if AnalysisWorkerPool.is_embedded():
+        analysis_worker_pool.start()
+
+    logger.info("Application startup complete")
+    try:
+        yield
+    finally:
+        await analysis_worker_pool.stop()
+        await llm_gateway.aclose()
+        await http_client.aclose()
+        pdf_text_extractor.shutdown()
+        await async_engine.dispose()
+        engine.dispose()
+        redis_client.close()
+        await close_async_redis()
+        logger.info("Application shutdown complete")
+
+
+def create_app() -> FastAPI:
+    app = FastAPI(lifespan=lifespan)
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=origins,       # 정확한 origin만 허용
+        allow_credentials=True,      # 쿠키 허용
+        allow_methods=["*"],         # 모든 HTTP 메서드 허용
+        allow_headers=["*"],         # 모든 헤더 허용
+    )
+
+    # 업로드 본문 크기 제한 (multipart 파싱 전에 거절)
+    app.add_middleware(
+        MaxBodySizeMiddleware,
+        max_body_size=MAX_FILE_SIZE + MULTIPART_OVERHEAD,
+        path_suffixes=["/analyze", "/analyze/jobs"]
+    )
+
+    app.include_router(account_router, prefix="/account")
+    app.include_router(authentication_router, prefix="/authentication")
+    app.include_router(documents_multi_agents_router, prefix="/documents-multi-agents")
+    app.include_router(documents_multi_agents_router, prefix="/flow")  # 프론트엔드 호환용
+    app.include_router(kftc_router, prefix="/kftc")
+    return app
+
+
+app = create_app()
 
 # 앱 실행
 if __name__ == "__main__":
@@ -39,6 +110,4 @@ if __name__ == "__main__":
 
     host = os.getenv("APP_HOST")
     port = int(os.getenv("APP_PORT"))
-    Base.metadata.drop_all(bind=engine)
-    Base.metadata.create_all(bind=engine)
     uvicorn.run(app, host=host, port=port)
@@ -2,10 +2,40 @@ from Crypto.Cipher import AES
 from Crypto.Random import get_random_bytes
 from Crypto.Util.Padding import pad, unpad
 import base64
+import binascii
+import os
+from typing import List, Optional
 
-# 1. 키와 IV 생성 (안전을 위해 임의로 생성)
-key = get_random_bytes(16) # 128비트 키
-iv = get_random_bytes(16)  # 128비트 IV
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def _load_or_generate(env_name: str) -> bytes:
+    """
+    환경 변수(base64)에서 16바이트 값을 읽고, 없으면 임의로 생성
+
+    API 서버와 분석 워커처럼 여러 프로세스가 같은 암호문을 읽으려면
+    CRYPTO_KEY / CRYPTO_IV 를 동일하게 설정해야 한다.
+    """
+    value = os.getenv(env_name)
+    if value:
+        decoded = base64.b64decode(value)
+        if len(decoded) != 16:
+            raise ValueError(f"{env_name} must be 16 bytes (base64)")
+        return decoded
+    return get_random_bytes(16)
+
+
+# 1. 키와 IV 생성 (환경 변수가 없으면 안전을 위해 임의로 생성)
+key = _load_or_generate("CRYPTO_KEY") # 128비트 키
+iv = _load_or_generate("CRYPTO_IV")   # 128비트 IV
+
+# 프로세스 간 암호문 공유 가능 여부 (임의 생성 키는 이 프로세스에서만 복호화 가능)
+SHARED_KEY_CONFIGURED = bool(os.getenv("CRYPTO_KEY") and os.getenv("CRYPTO_IV"))
+
+# 배치 처리용 ECB 객체 (키 스케줄 1회 생성, 상태가 없어 재사용 가능)
+_ecb_cipher = AES.new(key, AES.MODE_ECB)
 
 class Crypto:
     __instance = None
@@ -25,6 +55,10 @@ class Crypto:
         self.key = key
         self.iv = iv
 
+    @staticmethod
+    def is_shared_key() -> bool:
+        return SHARED_KEY_CONFIGURED
+
     @staticmethod
     def enc_data(target_text: str):
         data_bytes = target_text.encode('utf-8')
@@ -50,4 +84,82 @@ class Crypto:
 
         # 8. 바이트를 문자열로 변환
         decrypted_data = decrypted_bytes.decode('utf-8')
-        return decrypted_data
\ No newline at end of file
+        return decrypted_data
+
+    @staticmethod
+    def _xor(a: bytes, b: bytes) -> bytes:
+        return (int.from_bytes(a, "big") ^ int.from_bytes(b, "big")).to_bytes(len(a), "big")
+
+    @staticmethod
+    def enc_data_batch(target_texts: List[str]) -> List[str]:
+        """
+        여러 문자열을 한 번에 암호화 (enc_data와 동일한 결과, 입력 순서 유지)
+
+        CBC는 블록 간 체이닝이 있으므로 "블록 위치" 단위로 묶어서
+        같은 위치의 블록들을 한 번의 ECB 호출로 암호화한다.
+        (대부분의 값은 1블록이라 ECB 호출 1회로 끝남)
+        """
+        block = AES.block_size
+        padded = [pad(text.encode('utf-8'), block) for text in target_texts]
+        encrypted = [bytearray() for _ in padded]
+
+        max_blocks = max((len(p) // block for p in padded), default=0)
+        for block_index in range(max_blocks):
+            start = block_index * block
+            targets = [i for i, p in enumerate(padded) if len(p) > start]
+
+            # 이전 암호문 블록(첫 블록은 IV)과 XOR 후 한 번에 암호화
+            plain = b"".join(padded[i][start:start + block] for i in targets)
+            chain = b"".join(
+                bytes(encrypted[i][start - block:start]) if block_index else iv
+                for i in targets
+            )
+            cipher_blocks = _ecb_cipher.encrypt(Crypto._xor(plain, chain))
+
+            for n, i in enumerate(targets):
+                encrypted[i] += cipher_blocks[n * block:(n + 1) * block]
+
+        return [base64.b64encode(bytes(e)).decode('utf-8') for e in encrypted]
+
+    @staticmethod
+    def dec_data_batch(target_texts: List[str]) -> List[Optional[str]]:
+        """
+        여러 암호문을 한 번에 복호화 (입력 순서 유지)
+
+        CBC 복호화는 블록 간 의존이 없으므로 전체 블록을 한 번의 ECB 호출로 처리한다.
+
+        Returns:
+            복호화 결과 목록 (복호화 실패한 항목은 None)
+        """
+        block = AES.block_size
+        results: List[Optional[str]] = [None] * len(target_texts)
+
+        valid = []
+        ciphertexts = []
+        for i, text in enumerate(target_texts):
+            try:
+                encrypted_bytes = base64.b64decode(text)
+            except (binascii.Error, ValueError, TypeError):
+                continue
+            if not encrypted_bytes or len(encrypted_bytes) % block:
+                continue
+            valid.append(i)
+            ciphertexts.append(encrypted_bytes)
+
+        if not ciphertexts:
+            return results
+
+        all_cipher = b"".join(ciphertexts)
+        all_chain = b"".join(iv + c[:-block] for c in ciphertexts)
+        all_plain = Crypto._xor(_ecb_cipher.decrypt(all_cipher), all_chain)
+
+        offset = 0
+        for i, c in zip(valid, ciphertexts):
+            padded_bytes = all_plain[offset:offset + len(c)]
+            offset += len(c)
+            try:
+                results[i] = unpad(padded_bytes, block).decode('utf-8')
+            except (ValueError, UnicodeDecodeError):
+                continue
+
+        return results
@@ -0,0 +1,66 @@
+"""
+DB 스키마 관리 (앱 부팅과 분리해서 배포 시 한 번 실행)
+
+    python -m config.database.migrate
+
+1. 없는 테이블 생성 (Base.metadata.create_all - 기존 테이블은 변경하지 않음)
+2. config/database/migrations/mNNN_*.py 중 아직 적용되지 않은 upgrade(conn) 순서대로 실행
+   (적용 이력은 schema_migrations 테이블에 기록)
+"""
+import importlib
+import pkgutil
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import text
+
+from config.database import migrations
+from config.database.session import Base, engine
+from util.log.log import Log
+
+# 테이블 생성을 위해 ORM 모델 등록
+import account.infrastructure.orm.account_orm  # noqa: F401
+import kftc.infrastructure.orm.kftc_transaction_orm  # noqa: F401
+
+logger = Log.get_logger()
+
+
+def _migration_names() -> List[str]:
+    return sorted(
+        module.name for module in pkgutil.iter_modules(migrations.__path__)
+        if module.name.startswith("m")
+    )
+
+
+def run_migrations() -> List[str]:
+    """적용하지 않은 마이그레이션 실행 후 적용한 버전 목록 반환"""
+    Base.metadata.create_all(bind=engine)
+
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE IF NOT EXISTS schema_migrations ("
+            "version VARCHAR(255) PRIMARY KEY, applied_at DATETIME NOT NULL)"
+        ))
+        applied = {row[0] for row in conn.execute(text("SELECT version FROM schema_migrations"))}
+
+    newly_applied = []
+    for name in _migration_names():
+        if name in applied:
+            continue
+
+        module = importlib.import_module(f"{migrations.__name__}.{name}")
+        with engine.begin() as conn:
+            module.upgrade(conn)
+            conn.execute(
+                text("INSERT INTO schema_migrations (version, applied_at) VALUES (:version, :applied_at)"),
+                {"version": name, "applied_at": datetime.utcnow()}
+            )
+        logger.info(f"Migration applied: {name}")
+        newly_applied.append(name)
+
+    return newly_applied
+
+
+if __name__ == "__main__":
+    applied_versions = run_migrations()
+    print(f"Applied {len(applied_versions)} migration(s): {applied_versions}")
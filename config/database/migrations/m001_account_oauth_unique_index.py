@@ -0,0 +1,23 @@
+"""
+account (oauth_type, oauth_id) 복합 유니크 인덱스 추가
+
+로그인 시 계정 조회 조건과 동일한 인덱스 - 테이블이 커져도 풀 스캔하지 않도록 한다.
+중복된 (oauth_type, oauth_id) 행이 있으면 인덱스 생성이 실패하므로 먼저 정리해야 한다.
+"""
+from sqlalchemy import inspect, text
+
+INDEX_NAME = "uq_account_oauth_type_oauth_id"
+
+
+def upgrade(conn) -> None:
+    inspector = inspect(conn)
+    if "account" not in inspector.get_table_names():
+        return
+
+    existing = {index["name"] for index in inspector.get_indexes("account")}
+    existing |= {constraint["name"] for constraint in inspector.get_unique_constraints("account")}
+    if INDEX_NAME in existing:
+        # create_all로 새로 만든 테이블에는 이미 포함되어 있음
+        return
+
+    conn.execute(text(f"ALTER TABLE account ADD UNIQUE INDEX {INDEX_NAME} (oauth_type, oauth_id)"))
@@ -1,4 +1,9 @@
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Optional
+
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 import os
 from dotenv import load_dotenv
@@ -13,15 +18,86 @@ DATABASE_URL = (
     f"@{os.getenv('MYSQL_HOST')}:{os.getenv('MYSQL_PORT')}/{os.getenv('MYSQL_DATABASE')}"
 )
 
+ASYNC_DATABASE_URL = (
+    f"mysql+aiomysql://{os.getenv('MYSQL_USER')}:{password}"
+    f"@{os.getenv('MYSQL_HOST')}:{os.getenv('MYSQL_PORT')}/{os.getenv('MYSQL_DATABASE')}"
+)
+
+# -----------------------
+# DB 프로필 (환경 변수)
+# -----------------------
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"  # SQL 로그 (개발용)
+DB_POOL_SIZE = int(os.getenv("MYSQL_POOL_SIZE", 10))
+DB_MAX_OVERFLOW = int(os.getenv("MYSQL_MAX_OVERFLOW", 20))
+DB_POOL_RECYCLE = int(os.getenv("MYSQL_POOL_RECYCLE", 1800))  # MySQL wait_timeout 보다 짧게
+DB_POOL_TIMEOUT = int(os.getenv("MYSQL_POOL_TIMEOUT", 10))  # 커넥션 대기 최대 시간(초)
+DB_CONNECT_TIMEOUT = int(os.getenv("MYSQL_CONNECT_TIMEOUT", 5))
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("MYSQL_STATEMENT_TIMEOUT_MS", 0))  # SELECT 최대 실행 시간 (기본 0 = 사용 안 함)
+
+# 세션마다 SELECT 실행 시간 제한 (MYSQL_STATEMENT_TIMEOUT_MS 를 지정한 경우만)
+# - MySQL 5.7.8+ 전용 (max_execution_time) - MariaDB는 이 변수를 거부하므로 켜면 커넥션이 실패함
+# - SELECT 문에만 적용되고 INSERT / UPDATE / DDL 등은 제한하지 않음
+_init_command = f"SET SESSION max_execution_time={DB_STATEMENT_TIMEOUT_MS}" if DB_STATEMENT_TIMEOUT_MS else None
+
+_pool_options = dict(
+    echo=DB_ECHO,
+    pool_pre_ping=True,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_timeout=DB_POOL_TIMEOUT
+)
+
+# 스키마 관리 등 동기 작업용
 engine = create_engine(
     DATABASE_URL,
-    echo=True,
-    pool_pre_ping=True
+    connect_args={"connect_timeout": DB_CONNECT_TIMEOUT, "init_command": _init_command},
+    **_pool_options
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 요청 처리용 비동기 엔진 (이벤트 루프를 막지 않음)
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    connect_args={"connect_timeout": DB_CONNECT_TIMEOUT, "init_command": _init_command},
+    **_pool_options
+)
+
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+
 Base = declarative_base()
 
+# 현재 요청에 묶인 세션 (요청 Task마다 별도 컨텍스트)
+_request_session: ContextVar[Optional[AsyncSession]] = ContextVar("request_db_session", default=None)
+
+
 def get_db_session():
     return SessionLocal()
+
+
+async def request_db_session() -> AsyncIterator[AsyncSession]:
+    """
+    FastAPI 의존성 - 요청마다 AsyncSession 하나를 열고 응답 후 닫는다.
+
+    router의 dependencies에 등록하면 해당 요청 안의 repository 호출이 모두 같은 세션을 사용한다.
+    """
+    async with AsyncSessionLocal() as session:
+        _request_session.set(session)
+        yield session
+
+
+@asynccontextmanager
+async def db_session() -> AsyncIterator[AsyncSession]:
+    """
+    repository용 세션 획득
+
+    요청 스코프 세션이 있으면 그대로 사용하고, 없으면(워커/스크립트 등) 이 블록 동안만 새 세션을 연다.
+    """
+    session = _request_session.get()
+    if session is not None:
+        yield session
+        return
+
+    async with AsyncSessionLocal() as session:
+        yield session
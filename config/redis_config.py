@@ -1,5 +1,6 @@
 import os
 import redis
+import redis.asyncio
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -23,3 +24,27 @@ def get_redis() -> redis.Redis:
             decode_responses=True
         )
     return _redis_instance
+
+
+# 블로킹 명령(BRPOP 등)용 asyncio 클라이언트 - 대기 중에도 스레드를 점유하지 않음
+_async_redis_instance = None
+
+def get_async_redis() -> redis.asyncio.Redis:
+    global _async_redis_instance
+    if _async_redis_instance is None:
+        _async_redis_instance = redis.asyncio.Redis(
+            host=REDIS_HOST,
+            port=REDIS_PORT,
+            db=REDIS_DB,
+            password=REDIS_PASSWORD,
+            decode_responses=True
+        )
+    return _async_redis_instance
+
+
+async def close_async_redis() -> None:
+    # 커넥션이 이벤트 루프에 묶이므로 루프 종료 전에 닫고 다음 루프에서 새로 생성
+    global _async_redis_instance
+    if _async_redis_instance is not None:
+        await _async_redis_instance.aclose()
+        _async_redis_instance = None
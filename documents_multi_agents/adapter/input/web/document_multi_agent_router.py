@@ -1,81 +1,138 @@
 from fastapi import APIRouter, Depends, UploadFile, HTTPException, Form, Response, Header, Request
-from openai import OpenAI
-from pypdf import PdfReader
-import asyncio
-import io
-import re
+from fastapi.responses import StreamingResponse
+import json
 import uuid
 
-from config.crypto import Crypto
 from config.redis_config import get_redis
 from account.adapter.input.web.session_helper import get_current_user
 from util.security.crsf import  verify_csrf_token
 
 from documents_multi_agents.adapter.input.web.request.insert_income_request import InsertDocumentRequest
+from documents_multi_agents.application.usecase.document_analysis_usecase import (
+    DocumentAnalysisUseCase,
+    DocumentAnalysisError,
+)
+from documents_multi_agents.domain.service.answer_cleaner import clean_answer, StreamingAnswerCleaner
+from documents_multi_agents.domain.service.category_rules import move_expense_like_income
+from documents_multi_agents.domain.service.item_deduplicator import deduplicate_items
+from documents_multi_agents.domain.service.document_qa_service import (
+    qa_on_document,
+    build_qa_prompt,
+    QA_MODEL,
+    QA_MAX_TOKENS,
+)
 from documents_multi_agents.domain.service.prompt_templates import PromptTemplates
+from documents_multi_agents.infrastructure.queue.analysis_job_queue_provider import get_analysis_job_queue
+from documents_multi_agents.infrastructure.repository.analysis_job_repository import AnalysisJobRepository
+from documents_multi_agents.infrastructure.repository.session_data_repository import (
+    SessionDataRepository,
+    request_session_data_memo,
+)
 from util.log.log import Log
 from util.cache.ai_cache import AICache
+from util.llm.llm_gateway import LLMGateway
+from util.upload.upload_limit import read_upload_file
 
 log_util = Log()
 logger = Log.get_logger()
-documents_multi_agents_router = APIRouter(tags=["documents_multi_agents_router"])
+# 요청마다 세션 데이터 복호화 결과를 한 번만 계산 (요청이 끝나면 비움)
+documents_multi_agents_router = APIRouter(
+    tags=["documents_multi_agents_router"],
+    dependencies=[Depends(request_session_data_memo)]
+)
 redis_client = get_redis()
-client = OpenAI()
-crypto = Crypto.get_instance()
+llm_gateway = LLMGateway.get_instance()
+session_data_repository = SessionDataRepository.get_instance()
+document_analysis_usecase = DocumentAnalysisUseCase.get_instance()
+analysis_job_repository = AnalysisJobRepository.get_instance()
+analysis_job_queue = get_analysis_job_queue()
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
 
 # -----------------------
-# PDF 텍스트 추출
+# QA 에이전트 - 스트리밍 (SSE)
 # -----------------------
-def extract_text_from_pdf_clean(file_bytes: bytes) -> str:
-    try:
-        reader = PdfReader(io.BytesIO(file_bytes))
-        texts = []
-        for page in reader.pages:
-            t = page.extract_text() or ""
-            t = re.sub(r'\s+', ' ', t)  # 공백 정리
-            t = re.sub(r'\d+\s*$', '', t)  # 페이지 번호 제거 (행 끝 숫자)
-            if t.strip():
-                texts.append(t.strip())
-        return "\n".join(texts)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"PDF parsing error: {str(e)}")
+def sse_event(data: dict, event: str | None = None) -> str:
+    message = f"event: {event}\n" if event else ""
+    return message + f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def stream_qa_on_document(
+        document: str,
+        question: str,
+        role: str,
+        cache_key: str,
+        session_id: str | None = None
+) -> StreamingResponse:
+    """
+    QA 응답을 SSE로 전달
 
+    - 캐시 히트: 저장된 응답을 바로 전송
+    - 캐시 미스: 모델 토큰을 전처리 규칙(clean_answer)을 점진 적용하며 전송하고,
+      스트림이 끝나면 전체 응답을 AICache에 저장
+    - 이벤트: data {"delta": "..."} 반복 → event "done" (실패 시 event "error")
+    """
+    async def event_stream():
+        cached_response = AICache.get_cached_response(cache_key)
+        if cached_response:
+            yield sse_event({"delta": cached_response, "cached": True})
+            yield sse_event({}, event="done")
+            return
 
-# -----------------------
-# GPT 호출 래퍼 (기존)
-# -----------------------
-async def ask_gpt(prompt: str, max_tokens=500):
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, lambda:
-    client.chat.completions.create(
-        model="gpt-4.1",
-        messages=[{"role": "user", "content": prompt}],
-        max_tokens=max_tokens,
-        temperature=0
-    ).choices[0].message.content
-                                      )
+        prompt = build_qa_prompt(document, question, role)
+        cleaner = StreamingAnswerCleaner()
+        raw_parts = []
+        try:
+            async for delta in llm_gateway.stream_chat(
+                    messages=[{"role": "user", "content": prompt}],
+                    model=QA_MODEL,
+                    max_tokens=QA_MAX_TOKENS,
+                    temperature=0,
+                    session_id=session_id
+            ):
+                raw_parts.append(delta)
+                text = cleaner.feed(delta)
+                if text:
+                    yield sse_event({"delta": text})
+
+            tail = cleaner.finish()
+            if tail:
+                yield sse_event({"delta": tail})
+        except Exception as e:
+            logger.error(f"[ERROR] Streaming failed: {str(e)}")
+            yield sse_event({"error": f"{type(e).__name__}: {str(e)}"}, event="error")
+            return
+
+        # 🔥 캐시 저장 (24시간) - 비스트리밍 응답과 동일한 형태로 저장
+        answer = clean_answer("".join(raw_parts).strip())
+        AICache.set_cached_response(cache_key, answer, ttl=86400, session_id=session_id)
+        yield sse_event({}, event="done")
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 # -----------------------
-# QA 에이전트 (문서 기반)
+# 업로드 요청 검증 공통
 # -----------------------
-@log_util.logging_decorator
-async def qa_on_document(document: str, question: str, role: str) -> str:
-    prompt = f"""
-다음은 문서 자료이다. 이 문서 내의 정보만 사용하여 질문에 답해라.
-답변 시 존댓말 사용을 유지해라.
-
-요약:
-{document}
+def verify_upload_request(request: Request, response: Response, session_id: str, x_csrf_token: str | None) -> None:
+    # 🔥 비회원(GUEST) 여부 확인
+    user_token = redis_client.hget(session_id, "USER_TOKEN")
+    is_guest = (user_token == b"GUEST" or user_token == "GUEST") if user_token else True
 
-질문:
-{question}
+    # CSRF 검증 (비회원은 선택적)
+    verify_csrf_token(request, x_csrf_token, required=not is_guest)
 
-규칙:
-{role}
-"""
-    return (await ask_gpt(prompt, max_tokens=2500)).strip()
+    # 쿠키에 session_id 명시적으로 설정
+    response.set_cookie(
+        key="session_id",
+        value=session_id,
+        max_age=24 * 60 * 60,
+        httponly=True,
+        samesite="lax"
+    )
 
 
 # -----------------------
@@ -91,193 +148,76 @@ async def analyze_document(
         session_id: str = Depends(get_current_user),
         x_csrf_token:  str | None = Header(None)
 ):
-    # 🔥 비회원(GUEST) 여부 확인
-    user_token = redis_client.hget(session_id, "USER_TOKEN")
-    is_guest = (user_token == b"GUEST" or user_token == "GUEST") if user_token else True
-    
-    # CSRF 검증 (비회원은 선택적)
-    verify_csrf_token(request, x_csrf_token, required=not is_guest)
+    verify_upload_request(request, response, session_id, x_csrf_token)
 
     try:
-        # 쿠키에 session_id 명시적으로 설정
-        response.set_cookie(
-            key="session_id",
-            value=session_id,
-            max_age=24 * 60 * 60,
-            httponly=True,
-            samesite="lax"
-        )
+        # 청크 단위로 읽으면서 해시 계산, 크기 초과 시 즉시 413
+        content, file_hash = await read_upload_file(file, MAX_FILE_SIZE)
 
-        content = await file.read()
-        if not content:
-            raise HTTPException(400, "Empty file upload")
-
-        if len(content) > MAX_FILE_SIZE:
-            raise HTTPException(413, "File too large")
-
-        text = extract_text_from_pdf_clean(content)
-        if not text:
-            raise HTTPException(400, "No text extracted")
-
-        logger.info(f"Extracted text length: {len(text)}")
-
-        # 2. QA (요약 기반)
-        # type_of_doc에 따라 프롬프트 분기
-        if "소득" in type_of_doc or "income" in type_of_doc.lower():
-            extraction_question = (
-                "PDF에서 소득 관련 항목과 금액만 추출해줘. "
-                "반드시 다음 형식으로만 답변: 항목명: 금액 (한 줄에 하나씩) "
-                "설명, 주석, 별표, 마크다운 등 절대 사용 금지 "
-                "예시: "
-                "급여: 3000000 "
-                "식대: 200000 "
-                "상여: 500000"
-            )
-            extraction_role = (
-                "소득 항목만 포함: 급여, 상여, 식대, 수당, 총급여, 이자소득, 배당소득 "
-                "절대 제외: 보험료, 세금, 공제액 등 차감/지출 항목 "
-                "추론 금지, 문서 내 데이터만 사용 "
-                "월별 구분 있으면 합계만 사용 "
-                "설명문, 주석 절대 금지 - 순수 데이터만 반환"
-            )
-        elif "지출" in type_of_doc or "expense" in type_of_doc.lower():
-            extraction_question = (
-                "PDF에서 지출 관련 항목과 금액만 추출해줘. "
-                "반드시 다음 형식으로만 답변: 항목명: 금액 (한 줄에 하나씩) "
-                "설명, 주석, 별표, 마크다운 등 절대 사용 금지 "
-                "예시: "
-                "국민연금보험료: 500000 "
-                "신용카드: 1000000 "
-                "건강보험료: 300000"
-            )
-            extraction_role = (
-                "지출 항목만 포함: 보험료, 카드사용액, 세금, 공과금, 대출, 월세, 통신비 "
-                "절대 제외: 급여, 소득, 수당 등 수입 항목 "
-                "추론 금지, 문서 내 데이터만 사용 "
-                "월별 구분 있으면 합계만 사용 "
-                "설명문, 주석 절대 금지 - 순수 데이터만 반환"
-            )
-        else:
-            # 타입을 모를 경우 기본 프롬프트
-            extraction_question = (
-                "PDF의 항목과 금액을 추출해줘. "
-                "형식: 항목명: 금액 (한 줄에 하나씩)"
-            )
-            extraction_role = (
-                "문서 내 모든 금액 찾기 "
-                "월별 구분 있으면 합계만 사용 "
-                "설명문 금지 - 순수 데이터만"
-            )
+        # PDF 추출 → 항목 추출 → 저장 → 카테고리 분류 (작업 워커와 동일한 파이프라인)
+        return await document_analysis_usecase.analyze(session_id, type_of_doc, content, file_hash=file_hash)
 
-        answer = await qa_on_document(text, extraction_question, extraction_role)
-
-        # AI 응답 전처리: 마크다운, 설명문 제거
-        answer = answer.replace("**", "")  # 볼드 제거
-        answer = answer.replace("*", "")  # 이탤릭 제거
-        answer = re.sub(r'※.*', '', answer)  # 주석 제거
-        answer = re.sub(r'---.*', '', answer, flags=re.DOTALL)  # 구분선 이후 제거
-
-        pattern = re.compile(r'([가-힣\w\s]+)\s*:\s*([\d,]+)')
-        matches = list(pattern.finditer(answer))
-
-        logger.info(f"[DEBUG] Pattern matches found: {len(matches)}")
-
-        # 추출된 항목들을 저장하고 동시에 수집
-        extracted_items = {}
-        duplicate_keywords = ["총급여", "총소득", "합계", "총합", "총액"]  # 중복 가능성 있는 키워드
-
-        try:
-            for match in matches:
-                field, value = match.groups()
-                field_clean = field.strip()
-                value_clean = value.replace(",", "").strip()
-
-                # 중복 체크: 같은 금액의 유사 항목이 이미 있으면 스킵
-                is_duplicate = False
-                for existing_field, existing_value in extracted_items.items():
-                    if value_clean == existing_value:  # 금액이 같고
-                        # 하나가 다른 하나의 "합계" 버전이면 중복으로 간주
-                        if any(keyword in field_clean for keyword in duplicate_keywords) or \
-                                any(keyword in existing_field for keyword in duplicate_keywords):
-                            is_duplicate = True
-                            logger.info(f"[DEBUG] Duplicate found: {field_clean} ")
-                            break
-
-                if is_duplicate:
-                    continue
-
-                # 암호화된 키/값 생성
-                encrypted_key = crypto.enc_data(f"{type_of_doc}:{field_clean}")
-                encrypted_value = crypto.enc_data(value_clean)
-
-                # Redis에 저장
-                redis_client.hset(
-                    session_id,
-                    encrypted_key,
-                    encrypted_value
-                )
-
-                # 저장 확인
-                saved_value = redis_client.hget(session_id, encrypted_key)
-                logger.info(f"Saved successfully: {saved_value is not None}")
-
-                # 응답용 데이터 수집
-                extracted_items[field_clean] = value_clean
-
-        except Exception as e:
-            logger.error(f"[ERROR] Failed to save to Redis: {str(e)}")
-            import traceback
-            traceback.print_exc()
-
-        redis_client.expire(session_id, 24 * 60 * 60)
-
-        # 🔥 새 문서 업로드 시 기존 캐시 무효화
-        # 사용자 데이터가 변경되었으므로 모든 AI 분석 캐시를 제거
-        logger.info(f"Invalidating cache for session: {session_id}")
-        invalidated_count = AICache.invalidate_user_cache(session_id)
-        logger.info(f"Invalidated {invalidated_count} cache entries")
-
-        logger.info(f"[DEBUG] Extracted items: {len(extracted_items)}")
-
-        if not extracted_items:
-            logger.warning("No items were extracted from PDF!")
-            return {
-                "success": False,
-                "message": "PDF에서 데이터를 추출하지 못했습니다. PDF 형식을 확인해주세요.",
-                "session_id": session_id,
-                "document_type": type_of_doc,
-                "extracted_count": 0,
-                "categorized_data": {}
-            }
-
-        # AI로 카테고리 분류
-        from documents_multi_agents.domain.service.financial_analyzer_service import FinancialAnalyzerService
+    except DocumentAnalysisError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
 
-        analyzer = FinancialAnalyzerService()
 
-        # type_of_doc에 따라 소득/지출 분류
-        categorized_data = {}
-        if "소득" in type_of_doc or "income" in type_of_doc.lower():
-            categorized_data = analyzer._categorize_income(extracted_items)
-        elif "지출" in type_of_doc or "expense" in type_of_doc.lower():
-            categorized_data = analyzer._categorize_expense(extracted_items)
-        else:
-            # 타입을 모를 경우 원본 데이터만 반환
-            categorized_data = {"raw_items": extracted_items}
+# -----------------------
+# API 엔드포인트
+# 문서 분석 작업 (비동기 처리)
+# -----------------------
+@documents_multi_agents_router.post("/analyze/jobs", status_code=202)
+@log_util.logging_decorator
+async def submit_analysis_job(
+        request: Request,
+        response: Response,
+        file: UploadFile,
+        type_of_doc: str = Form(...),
+        session_id: str = Depends(get_current_user),
+        x_csrf_token:  str | None = Header(None)
+):
+    """업로드 파일을 작업 큐에 넣고 바로 job_id 반환 (결과는 GET /analyze/jobs/{job_id})"""
+    verify_upload_request(request, response, session_id, x_csrf_token)
 
-        # 성공 응답 반환 (session_id 포함)
-        return {
-            "success": True,
-            "message": "분석 완료",
-            "session_id": session_id,  # 프론트엔드에서 사용할 수 있도록 명시적으로 반환
-            "document_type": type_of_doc,
-            "extracted_count": len(extracted_items),
-            "categorized_data": categorized_data
-        }
+    content, file_hash = await read_upload_file(file, MAX_FILE_SIZE)
+    if not content:
+        raise HTTPException(400, "Empty file upload")
 
+    try:
+        job_id = analysis_job_repository.create(session_id, type_of_doc, content, file_hash)
+        await analysis_job_queue.enqueue(job_id)
     except Exception as e:
         raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
 
+    return {
+        "success": True,
+        "job_id": job_id,
+        "status": AnalysisJobRepository.STATUS_QUEUED,
+        "session_id": session_id
+    }
+
+
+@documents_multi_agents_router.get("/analyze/jobs/{job_id}")
+async def get_analysis_job(job_id: str, session_id: str = Depends(get_current_user)):
+    """작업 상태 / 단계별 진행률 / 결과 조회"""
+    job = analysis_job_repository.get(job_id)
+    # 다른 세션의 작업은 존재 여부도 노출하지 않음
+    if job is None or job.get("session_id") != session_id:
+        raise HTTPException(404, "Job not found")
+
+    return {
+        "job_id": job_id,
+        "status": job.get("status"),
+        "stage": job.get("stage"),
+        "progress": job.get("progress"),
+        "document_type": job.get("document_type"),
+        "result": job.get("result"),
+        "error": job.get("error")
+    }
+
 
 # -----------------------
 # API 엔드포인트
@@ -287,47 +227,23 @@ async def analyze_document(
 @log_util.logging_decorator
 async def analyze_document(session_id: str = Depends(get_current_user)):
     try:
-        content = redis_client.hgetall(session_id)
-        pairs = []
-        for k_bytes, v_bytes in content.items():
-            try:
-                if k_bytes == "USER_TOKEN":
-                    continue
-
-                key_plain = crypto.dec_data(k_bytes)
-                val_plain = crypto.dec_data(v_bytes)
+        # 복호화된 세션 데이터 (요청 내 메모 + 버전 기반 L1)
+        data_str = session_data_repository.load(session_id).to_prompt_str()
 
-                # key_plain은 "type:field" 형태 — 원하는 대로 처리
-                _, field_name = key_plain.split(':', 1)
-                pairs.append(f"{field_name}: {val_plain}")
-
-            except ValueError as e:
-                # 복호화 실패 시 로깅/무시
-                continue
-
-        data_str = ", ".join(pairs)
-
-        # 🔥 캐시 확인
+        # 🔥 캐시 확인 (동일 요청이 동시에 들어오면 GPT 호출은 한 번만)
         cache_key = AICache.generate_cache_key(data_str, "future-assets")
-        cached_response = AICache.get_cached_response(cache_key)
-
-        if cached_response:
-            return cached_response
 
-        # 캐시 미스 - GPT 호출
-        question, role = PromptTemplates.get_future_assets_prompt()
-        answer = await qa_on_document(data_str, question, role)
+        async def generate_answer() -> str:
+            # 캐시 미스 - GPT 호출
+            question, role = PromptTemplates.get_future_assets_prompt()
+            answer = await qa_on_document(data_str, question, role, session_id=session_id)
 
-        # AI 응답 전처리: 마크다운, 설명문 제거
-        answer = answer.replace("**", "")  # 볼드 제거
-        answer = answer.replace("*", "")   # 이탤릭 제거
-        answer = re.sub(r'※.*', '', answer)  # 주석 제거
-        answer = re.sub(r'---.*', '', answer, flags=re.DOTALL)  # 구분선 이후 제거
+            # AI 응답 전처리: 마크다운, 설명문 제거
+            answer = clean_answer(answer)
+            return answer
 
         # 🔥 캐시 저장 (24시간)
-        AICache.set_cached_response(cache_key, answer, ttl=86400)
-
-        return answer
+        return await AICache.get_or_compute(cache_key, generate_answer, ttl=86400, session_id=session_id)
     except Exception as e:
         raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
 
@@ -340,47 +256,23 @@ async def analyze_document(session_id: str = Depends(get_current_user)):
 @log_util.logging_decorator
 async def analyze_document(session_id: str = Depends(get_current_user)):
     try:
-        content = redis_client.hgetall(session_id)
-        pairs = []
-        for k_bytes, v_bytes in content.items():
-            try:
-                if k_bytes == "USER_TOKEN":
-                    continue
-
-                key_plain = crypto.dec_data(k_bytes)
-                val_plain = crypto.dec_data(v_bytes)
-
-                # key_plain은 "type:field" 형태 — 원하는 대로 처리
-                _, field_name = key_plain.split(':', 1)
-                pairs.append(f"{field_name}: {val_plain}")
+        # 복호화된 세션 데이터 (요청 내 메모 + 버전 기반 L1)
+        data_str = session_data_repository.load(session_id).to_prompt_str()
 
-            except ValueError as e:
-                # 복호화 실패 시 로깅/무시
-                continue
-
-        data_str = ", ".join(pairs)
-
-        # 🔥 캐시 확인
+        # 🔥 캐시 확인 (동일 요청이 동시에 들어오면 GPT 호출은 한 번만)
         cache_key = AICache.generate_cache_key(data_str, "tax-credit")
-        cached_response = AICache.get_cached_response(cache_key)
-
-        if cached_response:
-            return cached_response
 
-        # 캐시 미스 - GPT 호출
-        question, role = PromptTemplates.get_tax_credit_prompt()
-        answer = await qa_on_document(data_str, question, role)
+        async def generate_answer() -> str:
+            # 캐시 미스 - GPT 호출
+            question, role = PromptTemplates.get_tax_credit_prompt()
+            answer = await qa_on_document(data_str, question, role, session_id=session_id)
 
-        # AI 응답 전처리: 마크다운, 설명문 제거
-        answer = answer.replace("**", "")  # 볼드 제거
-        answer = answer.replace("*", "")   # 이탤릭 제거
-        answer = re.sub(r'※.*', '', answer)  # 주석 제거
-        answer = re.sub(r'---.*', '', answer, flags=re.DOTALL)  # 구분선 이후 제거
+            # AI 응답 전처리: 마크다운, 설명문 제거
+            answer = clean_answer(answer)
+            return answer
 
         # 🔥 캐시 저장 (24시간)
-        AICache.set_cached_response(cache_key, answer, ttl=86400)
-
-        return answer
+        return await AICache.get_or_compute(cache_key, generate_answer, ttl=86400, session_id=session_id)
     except Exception as e:
         raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
 
@@ -393,47 +285,23 @@ async def analyze_document(session_id: str = Depends(get_current_user)):
 @log_util.logging_decorator
 async def analyze_document(session_id: str = Depends(get_current_user)):
     try:
-        content = redis_client.hgetall(session_id)
-        pairs = []
-        for k_bytes, v_bytes in content.items():
-            try:
-                if k_bytes == "USER_TOKEN":
-                    continue
-
-                key_plain = crypto.dec_data(k_bytes)
-                val_plain = crypto.dec_data(v_bytes)
-
-                # key_plain은 "type:field" 형태 — 원하는 대로 처리
-                _, field_name = key_plain.split(':', 1)
-                pairs.append(f"{field_name}: {val_plain}")
-
-            except ValueError as e:
-                # 복호화 실패 시 로깅/무시
-                continue
+        # 복호화된 세션 데이터 (요청 내 메모 + 버전 기반 L1)
+        data_str = session_data_repository.load(session_id).to_prompt_str()
 
-        data_str = ", ".join(pairs)
-
-        # 🔥 캐시 확인
+        # 🔥 캐시 확인 (동일 요청이 동시에 들어오면 GPT 호출은 한 번만)
         cache_key = AICache.generate_cache_key(data_str, "deduction-expectation")
-        cached_response = AICache.get_cached_response(cache_key)
 
-        if cached_response:
-            return cached_response
+        async def generate_answer() -> str:
+            # 캐시 미스 - GPT 호출
+            question, role = PromptTemplates.get_deduction_expectation_prompt()
+            answer = await qa_on_document(data_str, question, role, session_id=session_id)
 
-        # 캐시 미스 - GPT 호출
-        question, role = PromptTemplates.get_deduction_expectation_prompt()
-        answer = await qa_on_document(data_str, question, role)
-
-        # AI 응답 전처리: 마크다운, 설명문 제거
-        answer = answer.replace("**", "")  # 볼드 제거
-        answer = answer.replace("*", "")   # 이탤릭 제거
-        answer = re.sub(r'※.*', '', answer)  # 주석 제거
-        answer = re.sub(r'---.*', '', answer, flags=re.DOTALL)  # 구분선 이후 제거
+            # AI 응답 전처리: 마크다운, 설명문 제거
+            answer = clean_answer(answer)
+            return answer
 
         # 🔥 캐시 저장 (24시간)
-        AICache.set_cached_response(cache_key, answer, ttl=86400)
-
-        return answer
+        return await AICache.get_or_compute(cache_key, generate_answer, ttl=86400, session_id=session_id)
     except Exception as e:
         raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
 
@@ -446,25 +314,8 @@ async def analyze_document(session_id: str = Depends(get_current_user)):
 @log_util.logging_decorator
 async def analyze_document(session_id: str = Depends(get_current_user)):
     try:
-        content = redis_client.hgetall(session_id)
-        pairs = []
-        for k_bytes, v_bytes in content.items():
-            try:
-                if k_bytes == "USER_TOKEN":
-                    continue
-
-                key_plain = crypto.dec_data(k_bytes)
-                val_plain = crypto.dec_data(v_bytes)
-
-                # key_plain은 "type:field" 형태 — 원하는 대로 처리
-                _, field_name = key_plain.split(':', 1)
-                pairs.append(f"{field_name}: {val_plain}")
-
-            except ValueError as e:
-                # 복호화 실패 시 로깅/무시
-                continue
-
-        data_str = ", ".join(pairs)
+        # 복호화된 세션 데이터 (요청 내 메모 + 버전 기반 L1)
+        data_str = session_data_repository.load(session_id).to_prompt_str()
 
         answer = await qa_on_document(data_str,
                                       "주어진 문서 본문을 활용하여 연말정산에서 받을 수 있는 총 공제 예상 금액을 산출해줘. "
@@ -474,14 +325,12 @@ async def analyze_document(session_id: str = Depends(get_current_user)):
                                       "주어진 문서 본문의 자료를 토대로 질문에 답변하라."
                                       "추가적인 질문을 요구하는 문장은 제외하라."
                                       "-- 등으로 불필요한 줄나눔은 없게 하라."
-                                      "답변 앞 뒤로 쌍따움표 같은 것을 붙이지 마라."
+                                      "답변 앞 뒤로 쌍따움표 같은 것을 붙이지 마라.",
+                                      session_id=session_id
                                       )
 
         # AI 응답 전처리: 마크다운, 설명문 제거
-        answer = answer.replace("**", "")  # 볼드 제거
-        answer = answer.replace("*", "")  # 이탤릭 제거
-        answer = re.sub(r'※.*', '', answer)  # 주석 제거
-        answer = re.sub(r'---.*', '', answer, flags=re.DOTALL)  # 구분선 이후 제거
+        answer = clean_answer(answer)
 
         return answer
     except Exception as e:
@@ -491,47 +340,59 @@ async def analyze_document(session_id: str = Depends(get_current_user)):
 @log_util.logging_decorator
 async def analyze_document(now_mon: int, tar_mon: int, session_id: str = Depends(get_current_user)):
     try:
-        content = redis_client.hgetall(session_id)
-        pairs = []
-        for k_bytes, v_bytes in content.items():
-            try:
-                if k_bytes == "USER_TOKEN":
-                    continue
+        # 복호화된 세션 데이터 (요청 내 메모 + 버전 기반 L1)
+        data_str = session_data_repository.load(session_id).to_prompt_str()
 
-                key_plain = crypto.dec_data(k_bytes)
-                val_plain = crypto.dec_data(v_bytes)
-
-                # key_plain은 "type:field" 형태 — 원하는 대로 처리
-                _, field_name = key_plain.split(':', 1)
-                pairs.append(f"{field_name}: {val_plain}")
-
-            except ValueError as e:
-                # 복호화 실패 시 로깅/무시
-                continue
-
-        data_str = ", ".join(pairs)
-
-        answer = await qa_on_document(data_str,
-                                      f"주어진 문서 본문을 활용하여 현재 내 자산이 {now_mon}이고, "
-                                      f"내가 목표로 하는 금액이 {tar_mon}일 때"
-                                      "현재 자산이 목표 금액을 달성하기 위해 할 수 있는 방법을 분석 해줘. "
-                                      "이 때 목표를 단기, 중기, 장기 목표로 나누고 "
-                                      "각 목표를 달성하기 위한 방법으로 리스크가 없는 방법, 리스크가 있는 방법, 리스크가 큰 방법으로 나눠서 설명해줘. ",
-                                      "주어진 문서 본문의 자료를 토대로 질문에 답변하라."
-                                      "추가적인 질문을 요구하는 문장은 제외하라."
-                                      "-- 등으로 불필요한 줄나눔은 없게 하라."
-                                      )
+        question, role = PromptTemplates.get_financial_guide_prompt(now_mon, tar_mon)
+        answer = await qa_on_document(data_str, question, role, session_id=session_id)
 
         # AI 응답 전처리: 마크다운, 설명문 제거
-        answer = answer.replace("**", "")  # 볼드 제거
-        answer = answer.replace("*", "")  # 이탤릭 제거
-        answer = re.sub(r'※.*', '', answer)  # 주석 제거
-        answer = re.sub(r'---.*', '', answer, flags=re.DOTALL)  # 구분선 이후 제거
+        answer = clean_answer(answer)
 
         return answer
     except Exception as e:
         raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
 
+# -----------------------
+# API 엔드포인트 - 스트리밍(SSE) 버전
+# 캐시 키는 비스트리밍 엔드포인트와 공유
+# -----------------------
+@documents_multi_agents_router.get("/future-assets/stream")
+@log_util.logging_decorator
+async def stream_future_assets(session_id: str = Depends(get_current_user)):
+    data_str = session_data_repository.load(session_id).to_prompt_str()
+    cache_key = AICache.generate_cache_key(data_str, "future-assets")
+    question, role = PromptTemplates.get_future_assets_prompt()
+    return stream_qa_on_document(data_str, question, role, cache_key, session_id=session_id)
+
+
+@documents_multi_agents_router.get("/tax-credit/stream")
+@log_util.logging_decorator
+async def stream_tax_credit(session_id: str = Depends(get_current_user)):
+    data_str = session_data_repository.load(session_id).to_prompt_str()
+    cache_key = AICache.generate_cache_key(data_str, "tax-credit")
+    question, role = PromptTemplates.get_tax_credit_prompt()
+    return stream_qa_on_document(data_str, question, role, cache_key, session_id=session_id)
+
+
+@documents_multi_agents_router.get("/deduction-expectation/stream")
+@log_util.logging_decorator
+async def stream_deduction_expectation(session_id: str = Depends(get_current_user)):
+    data_str = session_data_repository.load(session_id).to_prompt_str()
+    cache_key = AICache.generate_cache_key(data_str, "deduction-expectation")
+    question, role = PromptTemplates.get_deduction_expectation_prompt()
+    return stream_qa_on_document(data_str, question, role, cache_key, session_id=session_id)
+
+
+@documents_multi_agents_router.get("/financial-guide/stream")
+@log_util.logging_decorator
+async def stream_financial_guide(now_mon: int, tar_mon: int, session_id: str = Depends(get_current_user)):
+    data_str = session_data_repository.load(session_id).to_prompt_str()
+    cache_key = AICache.generate_cache_key(f"{data_str}|{now_mon}|{tar_mon}", "financial-guide")
+    question, role = PromptTemplates.get_financial_guide_prompt(now_mon, tar_mon)
+    return stream_qa_on_document(data_str, question, role, cache_key, session_id=session_id)
+
+
 # -----------------------
 # API 엔드포인트 - 사용자 입력 폼 데이터
 # -----------------------
@@ -569,29 +430,16 @@ async def insert_document(
             redis_client.hset(session_id, "USER_TOKEN", "GUEST")
             redis_client.expire(session_id, 24 * 60 * 60)
 
-        # 암호화해서 저장 및 데이터 수집
-        extracted_items = {}
-        for field_key, field_value in request.data.items():
-            value_clean = field_value.replace(",", "").strip()
-
-            # 암호화된 키/값 생성
-            encrypted_key = crypto.enc_data(f"{request.document_type}:{field_key}")
-            encrypted_value = crypto.enc_data(value_clean)
-
-            redis_client.hset(
-                session_id,
-                encrypted_key,
-                encrypted_value
-            )
-
-            # 저장 확인
-            saved_value = redis_client.hget(session_id, encrypted_key)
-            logger.debug(f"[DEBUG] Saved successfully: {saved_value is not None}")
-
-            # 응답용 데이터 수집
-            extracted_items[field_key] = value_clean
+        # 데이터 수집 (/analyze와 같은 중복 제거 적용) 후 암호화해서 한 번에 저장
+        extracted_items = deduplicate_items(
+            (field_key, field_value.replace(",", "").strip())
+            for field_key, field_value in request.data.items()
+        )
 
-        redis_client.expire(session_id, session_expire_seconds)
+        saved = session_data_repository.save_items(
+            session_id, request.document_type, extracted_items, expire_seconds=session_expire_seconds
+        )
+        logger.debug(f"[DEBUG] Saved successfully: {saved}")
 
         # AI로 카테고리 분류
         from documents_multi_agents.domain.service.financial_analyzer_service import FinancialAnalyzerService
@@ -601,9 +449,9 @@ async def insert_document(
         # type에 따라 소득/지출 분류
         categorized_data = {}
         if "소득" in request.document_type or "income" in request.document_type.lower():
-            categorized_data = analyzer._categorize_income(extracted_items)
+            categorized_data = await analyzer._categorize_income(extracted_items, session_id=session_id)
         elif "지출" in request.document_type or "expense" in request.document_type.lower():
-            categorized_data = analyzer._categorize_expense(extracted_items)
+            categorized_data = await analyzer._categorize_expense(extracted_items, session_id=session_id)
         else:
             categorized_data = {"raw_items": extracted_items}
 
@@ -626,60 +474,21 @@ async def insert_document(
 @documents_multi_agents_router.get("/debug/redis-data")
 @log_util.logging_decorator
 async def debug_redis_data(session_id: str = Depends(get_current_user)):
-    """Redis에 저장된 원본 데이터 확인 (디버깅용)"""
+    """Redis에 저장된 세션 데이터 확인 (디버깅용, 복호화는 SessionDataRepository.load 사용)"""
     try:
-        raw_data = redis_client.hgetall(session_id)
+        session_data = session_data_repository.load(session_id)
 
-        result = {
+        return {
             "session_id": session_id,
-            "total_keys": len(raw_data),
-            "keys": []
+            "data_version": session_data.version,
+            # 전체 필드 수 (USER_TOKEN / DATA_VERSION 및 복호화 실패 필드 포함)
+            "total_keys": redis_client.hlen(session_id),
+            "decrypted_count": len(session_data.items),
+            "items": [
+                {"document_type": item.document_type, "field": item.field, "amount": item.amount}
+                for item in session_data.items
+            ]
         }
-
-        for key_bytes, value_bytes in raw_data.items():
-            try:
-                # bytes를 문자열로 변환
-                if isinstance(key_bytes, bytes):
-                    key_str = key_bytes.decode('utf-8')
-                else:
-                    key_str = str(key_bytes)
-
-                if isinstance(value_bytes, bytes):
-                    value_str = value_bytes.decode('utf-8')
-                else:
-                    value_str = str(value_bytes)
-
-                # USER_TOKEN은 암호화되지 않음
-                if key_str == "USER_TOKEN":
-                    result["keys"].append({
-                        "key": key_str,
-                        "value": "[REDACTED]",  # 보안을 위해 숨김
-                        "encrypted": False
-                    })
-                else:
-                    # 복호화 시도
-                    try:
-                        decrypted_key = crypto.dec_data(key_str)
-                        decrypted_value = crypto.dec_data(value_str)
-                        result["keys"].append({
-                            "key_encrypted": key_str[:50] + "...",
-                            "key_decrypted": decrypted_key,
-                            "value_decrypted": decrypted_value,
-                            "encrypted": True
-                        })
-                    except Exception as decrypt_err:
-                        result["keys"].append({
-                            "key": key_str[:50] + "...",
-                            "value": value_str[:50] + "...",
-                            "error": f"복호화 실패: {str(decrypt_err)}",
-                            "encrypted": False
-                        })
-            except Exception as e:
-                result["keys"].append({
-                    "error": f"키 처리 실패: {str(e)}"
-                })
-
-        return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -697,88 +506,24 @@ async def get_combined_result(session_id: str = Depends(get_current_user)):
     try:
         logger.debug("[DEBUG] /result called with session_id")
 
-        # Redis에서 모든 데이터 가져오기
-        encrypted_data = redis_client.hgetall(session_id)
+        # 복호화된 세션 데이터 조회
+        session_data = session_data_repository.load(session_id)
 
         # 🔥 버그 수정: USER_TOKEN만 있는 경우도 빈 데이터로 간주
-        if not encrypted_data or len(encrypted_data) <= 1:
+        if session_data.is_empty:
             raise HTTPException(
                 status_code=404,
                 detail="저장된 재무 데이터가 없습니다. 문서를 먼저 업로드해주세요."
             )
 
-        # 복호화 및 소득/지출 분리
-        income_items = {}
-        expense_items = {}
-
-        for key_bytes, value_bytes in encrypted_data.items():
-            try:
-                # bytes를 문자열로 변환
-                if isinstance(key_bytes, bytes):
-                    key_str = key_bytes.decode('utf-8')
-                else:
-                    key_str = str(key_bytes)
-
-                if isinstance(value_bytes, bytes):
-                    value_str = value_bytes.decode('utf-8')
-                else:
-                    value_str = str(value_bytes)
-
-                # USER_TOKEN 제외
-                if key_str == "USER_TOKEN":
-                    logger.debug("[DEBUG] Skipping USER_TOKEN")
-                    continue
-
-                key_plain = crypto.dec_data(key_str)
-                value_plain = crypto.dec_data(value_str)
-
-                # "타입:필드명" 형태 파싱
-                if ":" in key_plain:
-                    doc_type, field_name = key_plain.split(":", 1)
-
-                    if "소득" in doc_type or "income" in doc_type.lower():
-                        income_items[field_name] = value_plain
-                    elif "지출" in doc_type or "expense" in doc_type.lower():
-                        expense_items[field_name] = value_plain
-            except Exception as decrypt_error:
-                logger.error(
-                    f"[ERROR] Decryption failed for key: {key_str[:50] if 'key_str' in locals() else 'unknown'}")
-                logger.error(f"[ERROR] Error: {str(decrypt_error)}")
-                import traceback
-                traceback.print_exc()
-                continue
+        # 소득/지출 분리
+        income_items, expense_items = session_data.split_income_expense()
 
         logger.debug(f"[DEBUG] Total income_items: {len(income_items)}")
         logger.debug(f"[DEBUG] Total expense_items: {len(expense_items)}")
-        # 소득 항목 중 지출성 항목을 지출로 재분류
-        # 1. 보험료
-        insurance_keywords = ["보험료", "보험", "연금"]
-        # 2. 세금
-        tax_keywords = ["소득세", "지방소득세", "세액"]
-
-        items_to_move = []
-
-        for field_name, value in list(income_items.items()):
-            should_move = False
-
-            # 보험료 관련 항목 체크
-            if any(keyword in field_name for keyword in insurance_keywords):
-                # 공제 금액이 아닌 실제 보험료만 이동
-                if "공제" not in field_name and "대상" not in field_name:
-                    should_move = True
-
-            # 세금 관련 항목 체크
-            if any(keyword in field_name for keyword in tax_keywords):
-                # 공제 금액이 아닌 실제 세금만 이동
-                if "공제" not in field_name and "과세표준" not in field_name and "산출" not in field_name:
-                    should_move = True
-
-            if should_move:
-                items_to_move.append(field_name)
-
-        # 실제 이동
-        for field_name in items_to_move:
-            expense_items[field_name] = income_items.pop(field_name)
+        # 소득 항목 중 지출성 항목(보험료, 세금)을 지출로 재분류 - 키워드 오토마타로 항목당 한 번만 검사
+        moved_count = move_expense_like_income(income_items, expense_items)
+        logger.debug(f"[DEBUG] Moved {moved_count} expense-like items from income")
 
         logger.debug(f"[DEBUG] After reclassification - income: {len(income_items)}, expense: {len(expense_items)}")
 
@@ -787,8 +532,10 @@ async def get_combined_result(session_id: str = Depends(get_current_user)):
 
         analyzer = FinancialAnalyzerService()
 
-        income_categorized = analyzer._categorize_income(income_items) if income_items else {}
-        expense_categorized = analyzer._categorize_expense(expense_items) if expense_items else {}
+        # 소득/지출 분류 동시 실행
+        income_categorized, expense_categorized = await analyzer.categorize_income_and_expense(
+            income_items, expense_items, session_id=session_id
+        )
 
         # 요약 정보 계산 (안전한 타입 변환) - 한글 키 우선, 없으면 영문 키
         try:
@@ -841,41 +588,17 @@ async def get_combined_result(session_id: str = Depends(get_current_user)):
 @documents_multi_agents_router.get("/tax-credit/checklist")
 async def tax_credit_checklist_markdown(session_id: str = Depends(get_current_user)):
     try:
-        content = redis_client.hgetall(session_id)
+        session_data = session_data_repository.load(session_id)
 
-        if not content:
+        if session_data.is_empty:
             return "저장된 재무 데이터가 없습니다."
 
-        pairs = []
-        for k_bytes, v_bytes in content.items():
-            try:
-                if k_bytes == "USER_TOKEN":
-                    continue
-
-                key_plain = crypto.dec_data(
-                    k_bytes.decode("utf-8") if isinstance(k_bytes, bytes) else k_bytes
-                )
-                val_plain = crypto.dec_data(
-                    v_bytes.decode("utf-8") if isinstance(v_bytes, bytes) else v_bytes
-                )
-
-                # "지출:월세" → 월세
-                _, field_name = key_plain.split(":", 1)
-                pairs.append(f"{field_name}: {val_plain}")
+        data_str = session_data.to_prompt_str()
 
-            except Exception:
-                continue
-
-        data_str = ", ".join(pairs)
-
-        # 🔥 캐시 확인
+        # 🔥 캐시 확인 (동일 요청이 동시에 들어오면 GPT 호출은 한 번만)
         cache_key = AICache.generate_cache_key(data_str, "tax-credit-checklist")
-        cached_response = AICache.get_cached_response(cache_key)
 
-        if cached_response:
-            return cached_response
-
-        # 캐시 미스 - GPT 호출
+        # 캐시 미스 시 GPT 호출에 사용할 프롬프트
         tax_items_text = """
 1. 자녀 세액공제
 2. 연금계좌 세액공제
@@ -951,16 +674,16 @@ async def tax_credit_checklist_markdown(session_id: str = Depends(get_current_us
 
 """
 
-        answer = await qa_on_document(
-            data_str,
-            question,
-            "출력은 반드시 “설명 섹션 + 마크다운 표” 형태로만 작성하라."
-        )
+        async def generate_answer() -> str:
+            return await qa_on_document(
+                data_str,
+                question,
+                "출력은 반드시 “설명 섹션 + 마크다운 표” 형태로만 작성하라.",
+                session_id=session_id
+            )
 
         # 🔥 캐시 저장 (24시간)
-        AICache.set_cached_response(cache_key, answer, ttl=86400)
-
-        return answer
+        return await AICache.get_or_compute(cache_key, generate_answer, ttl=86400, session_id=session_id)
 
     except Exception as e:
         raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
@@ -996,3 +719,16 @@ async def clear_user_cache(session_id: str = Depends(get_current_user)):
         }
     except Exception as e:
         raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
+
+
+@documents_multi_agents_router.get("/llm/stats")
+@log_util.logging_decorator
+async def get_llm_stats(session_id: str = Depends(get_current_user)):
+    """LLM 게이트웨이 동시성/대기 지표 조회"""
+    try:
+        return {
+            "success": True,
+            "stats": llm_gateway.get_stats()
+        }
+    except Exception as e:
+        raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
@@ -0,0 +1,165 @@
+import asyncio
+import os
+from typing import List, Optional
+
+from config.redis_config import close_async_redis
+from documents_multi_agents.application.port.analysis_job_queue_port import AnalysisJobQueuePort
+from documents_multi_agents.application.usecase.document_analysis_usecase import (
+    DocumentAnalysisUseCase,
+    DocumentAnalysisError,
+)
+from documents_multi_agents.infrastructure.queue.analysis_job_queue_provider import get_analysis_job_queue
+from documents_multi_agents.infrastructure.repository.analysis_job_repository import AnalysisJobRepository
+from documents_multi_agents.infrastructure.service.pdf_text_extractor import PdfTextExtractor
+from util.llm.llm_gateway import LLMGateway
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+
+class AnalysisWorkerPool:
+    """
+    문서 분석 작업 워커 (큐 소비 asyncio Task 묶음)
+
+    - ANALYSIS_WORKER_MODE=embedded(기본): API 서버 프로세스 안에서 실행
+    - ANALYSIS_WORKER_MODE=external: API 서버는 큐에 넣기만 하고,
+      `python -m documents_multi_agents.adapter.input.worker.analysis_worker` 로 별도 실행
+      (Redis 큐 + 동일한 CRYPTO_KEY / CRYPTO_IV 필요)
+    """
+
+    DEQUEUE_TIMEOUT = 1.0
+
+    def __init__(self, queue: Optional[AnalysisJobQueuePort] = None, concurrency: Optional[int] = None):
+        self.queue = queue or get_analysis_job_queue()
+        self.concurrency = concurrency or int(os.getenv("ANALYSIS_WORKER_CONCURRENCY", 4))
+        self.job_repository = AnalysisJobRepository.get_instance()
+        self.usecase = DocumentAnalysisUseCase.get_instance()
+        self._tasks: List[asyncio.Task] = []
+        self._running = False
+
+    @staticmethod
+    def is_embedded() -> bool:
+        return os.getenv("ANALYSIS_WORKER_MODE", "embedded").lower() == "embedded"
+
+    def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._tasks = [
+            asyncio.create_task(self._run_loop(n), name=f"analysis-worker-{n}")
+            for n in range(self.concurrency)
+        ]
+        logger.info(f"Analysis workers started: {self.concurrency}")
+
+    async def stop(self) -> None:
+        self._running = False
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("Analysis workers stopped")
+
+    async def _run_loop(self, worker_no: int) -> None:
+        while self._running:
+            try:
+                job_id = await self.queue.dequeue(timeout=self.DEQUEUE_TIMEOUT)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[ERROR] analysis-worker-{worker_no} dequeue failed: {str(e)}")
+                await asyncio.sleep(self.DEQUEUE_TIMEOUT)
+                continue
+
+            if not job_id:
+                continue
+            try:
+                await self.process(job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # process는 예외를 올리지 않지만, 워커 Task가 죽지 않도록 한 번 더 방어
+                logger.error(f"[ERROR] analysis-worker-{worker_no} job {job_id} crashed: {str(e)}")
+
+    def _mark_failed(self, job_id: str, error: str) -> None:
+        try:
+            self.job_repository.mark_failed(job_id, error)
+        except Exception as e:
+            logger.error(f"[ERROR] Analysis job {job_id} mark_failed error: {str(e)}")
+
+    async def _requeue(self, job_id: str, job_input: Optional[tuple]) -> None:
+        """
+        워커 종료로 중단된 작업 처리
+
+        큐가 프로세스 밖에 유지되면(Redis) 입력을 되돌리고 다시 넣어 다른 워커가 처리하게 하고,
+        그렇지 않으면(in-memory) 되살릴 방법이 없으므로 실패로 기록한다.
+        (입력을 꺼내기 전에 중단됐으면 입력은 그대로 남아 있으므로 작업 ID만 다시 넣음)
+        """
+        if not self.queue.PERSISTENT:
+            self._mark_failed(job_id, "Worker stopped during analysis")
+            return
+        try:
+            if job_input is not None:
+                content, file_hash = job_input
+                self.job_repository.requeue(job_id, content, file_hash)
+            await self.queue.enqueue(job_id)
+            logger.info(f"Analysis job requeued on shutdown: {job_id}")
+        except Exception as e:
+            logger.error(f"[ERROR] Analysis job {job_id} requeue failed: {str(e)}")
+            self._mark_failed(job_id, "Worker stopped during analysis")
+
+    async def process(self, job_id: str) -> None:
+        """작업 하나 실행 (실패해도 예외를 올리지 않고 작업 상태에 기록)"""
+        job_input = None
+        try:
+            job = self.job_repository.get(job_id)
+            if job is None:
+                logger.warning(f"Analysis job expired before processing: {job_id}")
+                return
+
+            job_input = self.job_repository.pop_input(job_id)
+            if job_input is None:
+                self._mark_failed(job_id, "Job input expired")
+                return
+
+            content, file_hash = job_input
+            self.job_repository.mark_running(job_id)
+            result = await self.usecase.analyze(
+                job["session_id"],
+                job["document_type"],
+                content,
+                file_hash=file_hash,
+                on_progress=lambda stage, progress: self.job_repository.update_progress(job_id, stage, progress)
+            )
+            self.job_repository.mark_succeeded(job_id, result)
+        except asyncio.CancelledError:
+            await self._requeue(job_id, job_input)
+            raise
+        except DocumentAnalysisError as e:
+            self._mark_failed(job_id, e.message)
+            return
+        except Exception as e:
+            logger.error(f"[ERROR] Analysis job {job_id} failed: {str(e)}")
+            self._mark_failed(job_id, f"{type(e).__name__}: {str(e)}")
+            return
+
+        logger.info(f"Analysis job done: {job_id}")
+
+
+# 별도 워커 프로세스로 실행
+async def main():
+    pool = AnalysisWorkerPool()
+    if not pool.queue.PERSISTENT:
+        # in-memory 큐로 대체된 경우 API 서버가 넣은 작업을 받을 수 없음
+        raise RuntimeError("External analysis worker requires ANALYSIS_JOB_QUEUE=redis with CRYPTO_KEY / CRYPTO_IV set")
+    pool.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await pool.stop()
+        await LLMGateway.get_instance().aclose()
+        PdfTextExtractor.get_instance().shutdown()
+        await close_async_redis()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class AnalysisJobQueuePort(ABC):
+    """문서 분석 작업 큐 (작업 ID만 전달, 입력/상태는 AnalysisJobRepository에 저장)"""
+
+    # 프로세스가 종료돼도 큐에 넣은 작업이 남는지 (워커 종료 시 작업을 다시 넣을지 판단)
+    PERSISTENT = False
+
+    @abstractmethod
+    async def enqueue(self, job_id: str) -> None:
+        pass
+
+    @abstractmethod
+    async def dequeue(self, timeout: float) -> Optional[str]:
+        """timeout 초 동안 대기 후 작업이 없으면 None"""
+        pass
@@ -0,0 +1,178 @@
+import re
+from typing import Callable, Dict, Optional
+
+from documents_multi_agents.domain.service.answer_cleaner import clean_answer
+from documents_multi_agents.domain.service.document_qa_service import qa_on_document
+from documents_multi_agents.domain.service.financial_analyzer_service import FinancialAnalyzerService
+from documents_multi_agents.domain.service.item_deduplicator import deduplicate_items
+from documents_multi_agents.domain.service.prompt_templates import PromptTemplates
+from documents_multi_agents.infrastructure.repository.session_data_repository import SessionDataRepository
+from documents_multi_agents.infrastructure.service.pdf_text_extractor import PdfTextExtractor, PdfExtractionError
+from util.cache.ai_cache import AICache
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+ProgressCallback = Callable[[str, int], None]
+
+
+class DocumentAnalysisError(Exception):
+    """분석 입력 오류 (HTTP 응답 코드 포함)"""
+
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+
+
+class DocumentAnalysisUseCase:
+    """
+    문서 분석 파이프라인
+
+    PDF 텍스트 추출 → LLM 항목 추출 → 파싱/중복 제거 → 세션 저장 + 캐시 무효화 → 카테고리 분류
+
+    /analyze(동기 응답)와 분석 작업 워커가 같은 파이프라인을 사용하며,
+    단계별 진행률은 on_progress(stage, progress) 콜백으로 전달한다.
+    """
+
+    STAGE_PROGRESS = {
+        "pdf_parsing": 10,
+        "extraction": 30,
+        "parsing": 60,
+        "saving": 70,
+        "categorization": 80,
+    }
+
+    ITEM_PATTERN = re.compile(r'([가-힣\w\s]+)\s*:\s*([\d,]+)')
+
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+            cls.__instance.pdf_text_extractor = PdfTextExtractor.get_instance()
+            cls.__instance.session_data_repository = SessionDataRepository.get_instance()
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def _report(self, on_progress: Optional[ProgressCallback], stage: str) -> None:
+        if on_progress is None:
+            return
+        try:
+            on_progress(stage, self.STAGE_PROGRESS[stage])
+        except Exception as e:
+            # 진행률 기록 실패는 분석 결과에 영향 주지 않음
+            logger.error(f"[ERROR] Failed to report progress ({stage}): {str(e)}")
+
+    async def analyze(
+            self,
+            session_id: str,
+            document_type: str,
+            content: bytes,
+            file_hash: Optional[str] = None,
+            on_progress: Optional[ProgressCallback] = None
+    ) -> dict:
+        """
+        업로드된 PDF 분석
+
+        Args:
+            session_id: 세션 ID
+            document_type: 문서 타입 (소득/지출 등)
+            content: PDF 파일 바이트
+            file_hash: 파일 SHA-256 (업로드 중 이미 계산했다면 전달)
+            on_progress: 단계 진행 콜백 (stage, progress)
+
+        Returns:
+            /analyze 응답과 동일한 형태의 결과 dict
+        """
+        if not content:
+            raise DocumentAnalysisError("Empty file upload")
+
+        # 1. PDF 텍스트 추출 (프로세스 풀 + 파일 해시 캐시)
+        self._report(on_progress, "pdf_parsing")
+        try:
+            text = await self.pdf_text_extractor.extract_text(content, file_hash=file_hash)
+        except PdfExtractionError as e:
+            raise DocumentAnalysisError(f"PDF parsing error: {str(e)}")
+        if not text:
+            raise DocumentAnalysisError("No text extracted")
+
+        logger.info(f"Extracted text length: {len(text)}")
+
+        # 2. QA (요약 기반) - type_of_doc에 따라 프롬프트 분기
+        self._report(on_progress, "extraction")
+        extraction_question, extraction_role = PromptTemplates.get_extraction_prompt(document_type)
+        answer = await qa_on_document(text, extraction_question, extraction_role, session_id=session_id)
+
+        # AI 응답 전처리: 마크다운, 설명문 제거
+        answer = clean_answer(answer)
+
+        # 3. 항목 파싱 + 중복 제거
+        self._report(on_progress, "parsing")
+        extracted_items = self._parse_items(answer)
+
+        # 4. 저장 + 캐시 무효화
+        self._report(on_progress, "saving")
+        try:
+            # 암호화 후 HSET mapping + EXPIRE 한 번에 저장
+            saved = self.session_data_repository.save_items(session_id, document_type, extracted_items)
+            logger.info(f"Saved successfully: {saved}")
+        except Exception as e:
+            logger.error(f"[ERROR] Failed to save to Redis: {str(e)}")
+
+        # 🔥 새 문서 업로드 시 기존 캐시 무효화
+        # 사용자 데이터가 변경되었으므로 모든 AI 분석 캐시를 제거
+        logger.info(f"Invalidating cache for session: {session_id}")
+        invalidated_count = AICache.invalidate_user_cache(session_id)
+        logger.info(f"Invalidated {invalidated_count} cache entries")
+
+        logger.info(f"[DEBUG] Extracted items: {len(extracted_items)}")
+
+        if not extracted_items:
+            logger.warning("No items were extracted from PDF!")
+            return {
+                "success": False,
+                "message": "PDF에서 데이터를 추출하지 못했습니다. PDF 형식을 확인해주세요.",
+                "session_id": session_id,
+                "document_type": document_type,
+                "extracted_count": 0,
+                "categorized_data": {}
+            }
+
+        # 5. AI로 카테고리 분류 (type_of_doc에 따라 소득/지출 분류)
+        self._report(on_progress, "categorization")
+        analyzer = FinancialAnalyzerService()
+        if "소득" in document_type or "income" in document_type.lower():
+            categorized_data = await analyzer._categorize_income(extracted_items, session_id=session_id)
+        elif "지출" in document_type or "expense" in document_type.lower():
+            categorized_data = await analyzer._categorize_expense(extracted_items, session_id=session_id)
+        else:
+            # 타입을 모를 경우 원본 데이터만 반환
+            categorized_data = {"raw_items": extracted_items}
+
+        return {
+            "success": True,
+            "message": "분석 완료",
+            "session_id": session_id,  # 프론트엔드에서 사용할 수 있도록 명시적으로 반환
+            "document_type": document_type,
+            "extracted_count": len(extracted_items),
+            "categorized_data": categorized_data
+        }
+
+    def _parse_items(self, answer: str) -> Dict[str, str]:
+        matches = list(self.ITEM_PATTERN.finditer(answer))
+        logger.info(f"[DEBUG] Pattern matches found: {len(matches)}")
+
+        # 금액 기준 중복 제거 (합계성 항목과 개별 항목이 같은 금액이면 하나만 유지)
+        extracted_items = deduplicate_items(
+            (field.strip(), value.replace(",", "").strip())
+            for field, value in (match.groups() for match in matches)
+        )
+        if len(extracted_items) < len(matches):
+            logger.info(f"[DEBUG] Duplicates removed: {len(matches) - len(extracted_items)}")
+        return extracted_items
@@ -0,0 +1,45 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+
+def is_income_type(document_type: str) -> bool:
+    return "소득" in document_type or "income" in document_type.lower()
+
+
+def is_expense_type(document_type: str) -> bool:
+    return "지출" in document_type or "expense" in document_type.lower()
+
+
+@dataclass(frozen=True)
+class FinancialItem:
+    """복호화된 재무 항목 ("문서타입:항목명" → 금액)"""
+    document_type: str
+    field: str
+    amount: str
+
+
+@dataclass(frozen=True)
+class SessionFinancialData:
+    """세션에 저장된 재무 데이터 (복호화 완료)"""
+    session_id: str
+    version: Optional[str]
+    items: List[FinancialItem] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.items
+
+    def to_prompt_str(self) -> str:
+        """프롬프트용 "항목명: 금액, 항목명: 금액" 문자열"""
+        return ", ".join(f"{item.field}: {item.amount}" for item in self.items)
+
+    def split_income_expense(self) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """문서 타입 기준으로 (소득 항목, 지출 항목) 분리"""
+        income_items = {}
+        expense_items = {}
+        for item in self.items:
+            if is_income_type(item.document_type):
+                income_items[item.field] = item.amount
+            elif is_expense_type(item.document_type):
+                expense_items[item.field] = item.amount
+        return income_items, expense_items
@@ -0,0 +1,75 @@
+import re
+
+
+def clean_answer(answer: str) -> str:
+    """AI 응답 전처리: 마크다운, 설명문 제거"""
+    answer = answer.replace("**", "")  # 볼드 제거
+    answer = answer.replace("*", "")   # 이탤릭 제거
+    answer = re.sub(r'※.*', '', answer)  # 주석 제거
+    answer = re.sub(r'---.*', '', answer, flags=re.DOTALL)  # 구분선 이후 제거
+    return answer
+
+
+class StreamingAnswerCleaner:
+    """
+    clean_answer와 같은 규칙을 토큰 스트림에 점진적으로 적용
+
+    - '*' 는 모두 제거
+    - '※' 부터 줄 끝까지 제거 (줄바꿈은 유지)
+    - '---' 가 나오면 이후 전부 제거 (청크 경계에 걸친 '-'는 다음 청크까지 보류)
+    - 응답 앞쪽 공백 제거 (qa_on_document의 strip과 동일)
+    """
+
+    def __init__(self):
+        self._pending_dashes = 0
+        self._in_note = False
+        self._started = False
+        self._done = False
+
+    def feed(self, chunk: str) -> str:
+        if self._done:
+            return ""
+
+        out = []
+        for ch in chunk:
+            if ch == "*":
+                continue
+
+            if self._in_note:
+                if ch == "\n":
+                    self._in_note = False
+                    out.append(ch)
+                continue
+
+            if ch == "-":
+                self._pending_dashes += 1
+                if self._pending_dashes >= 3:
+                    # 구분선 이후는 모두 버림
+                    self._done = True
+                    self._pending_dashes = 0
+                    break
+                continue
+
+            if self._pending_dashes:
+                out.append("-" * self._pending_dashes)
+                self._pending_dashes = 0
+
+            if ch == "※":
+                self._in_note = True
+                continue
+
+            out.append(ch)
+
+        text = "".join(out)
+        if not self._started:
+            text = text.lstrip()
+            self._started = bool(text)
+        return text
+
+    def finish(self) -> str:
+        """스트림 종료 시 보류 중이던 '-' 반환"""
+        if self._done or not self._pending_dashes:
+            return ""
+        tail = "-" * self._pending_dashes
+        self._pending_dashes = 0
+        return tail
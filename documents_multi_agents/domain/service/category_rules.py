@@ -0,0 +1,142 @@
+from typing import Any, Dict, Optional, Tuple
+
+from util.text.keyword_matcher import KeywordClassifier, KeywordMatcher, KeywordRule
+
+
+# 소득 분류 규칙 (_categorize_income 프롬프트의 분류 기준과 동일, 위에서부터 우선 적용)
+INCOME_RULES: Tuple[KeywordRule, ...] = (
+    KeywordRule("변동소득", ("상여", "보너스", "성과급", "인센티브", "야근", "연장근로", "야간근로", "휴일근로")),
+    KeywordRule("기타소득", ("이자", "배당", "임대", "프리랜서")),
+    KeywordRule("고정소득", ("급여", "월급", "연봉", "기본급", "식대")),
+)
+
+# 지출 분류 규칙 (_categorize_expense 프롬프트의 분류 기준과 동일, 위에서부터 우선 적용)
+EXPENSE_RULES: Tuple[KeywordRule, ...] = (
+    # 모든 보험료는 고정지출 (보험금 수령 등은 제외)
+    KeywordRule("고정지출", ("보험",), exclude=("보험금", "환급", "연금저축")),
+    KeywordRule("저축 및 투자", ("적금", "예금", "청약", "주식", "펀드", "채권", "연금저축", "원금")),
+    KeywordRule("고정지출", (
+        "월세", "관리비", "주택담보대출", "통신", "휴대폰", "인터넷", "구독", "정기권", "학원", "등록금"
+    )),
+    # 카드 사용액은 변동지출
+    KeywordRule("변동지출", (
+        "카드", "현금영수증", "전통시장", "식비", "외식", "배달", "쇼핑", "의류", "잡화", "화장품",
+        "문화", "영화", "공연", "취미", "택시", "주유", "대중교통", "교통비", "의료비"
+    )),
+    KeywordRule("기타 및 예비비", ("경조사", "선물", "수리비")),
+)
+
+# 소득 문서에 섞여 들어온 지출성 항목 (공제 금액/과세표준 등은 제외)
+EXPENSE_LIKE_INCOME_CLASSIFIER = KeywordClassifier((
+    KeywordRule("보험료", ("보험료", "보험", "연금"), exclude=("공제", "대상")),
+    KeywordRule("세금", ("소득세", "지방소득세", "세액"), exclude=("공제", "과세표준", "산출")),
+))
+
+# 합계성 항목 키워드 (개별 항목과 금액이 같으면 중복 가능성 있음)
+AGGREGATE_KEYWORDS: Tuple[str, ...] = ("총급여", "총소득", "합계", "총합", "총액")
+AGGREGATE_MATCHER = KeywordMatcher.from_keywords(AGGREGATE_KEYWORDS)
+
+
+def is_aggregate_field(field: str) -> bool:
+    return AGGREGATE_MATCHER.contains_any(field)
+
+
+def move_expense_like_income(income_items: Dict[str, Any], expense_items: Dict[str, Any]) -> int:
+    """
+    소득 항목 중 보험료/세금 등 지출성 항목을 지출로 이동
+
+    Returns:
+        이동한 항목 수
+    """
+    items_to_move = [field for field in income_items if EXPENSE_LIKE_INCOME_CLASSIFIER.matches(field)]
+    for field in items_to_move:
+        expense_items[field] = income_items.pop(field)
+    return len(items_to_move)
+
+
+def parse_amount(value: Any) -> Optional[int]:
+    """금액 문자열/숫자를 정수로 변환 (변환 불가 시 None)"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value)
+    text = str(value).replace(",", "").strip()
+    return int(text) if text.isdigit() else None
+
+
+class RuleBasedCategorizer:
+    """
+    규칙 기반 소득/지출 분류기
+
+    - 알려진 항목은 LLM 호출 없이 즉시 분류
+    - 규칙에 없는 항목만 따로 모아 LLM으로 분류한 뒤 merge로 합침
+    - 카테고리별 합계 / 총액은 항상 로컬에서 계산
+    """
+
+    def __init__(self, rules: Tuple[KeywordRule, ...], categories: Tuple[str, ...], total_key: str):
+        # 모든 규칙 키워드를 하나의 오토마타로 컴파일 (항목명당 한 번만 훑음)
+        self.classifier = KeywordClassifier(rules)
+        self.categories = categories
+        self.total_key = total_key
+        # LLM이 알 수 없는 카테고리를 반환하면 마지막(기타) 카테고리로 합침
+        self.fallback_category = categories[-1]
+
+    def classify(self, field: str) -> Optional[str]:
+        return self.classifier.classify(field)
+
+    def split(self, items: Dict[str, Any]) -> Tuple[Dict[str, Dict[str, int]], Dict[str, Any]]:
+        """
+        항목을 규칙으로 분류
+
+        Returns:
+            (카테고리별 분류 결과, 규칙에 없는 항목)
+        """
+        categorized: Dict[str, Dict[str, int]] = {category: {} for category in self.categories}
+        unmatched: Dict[str, Any] = {}
+
+        for field, value in items.items():
+            amount = parse_amount(value)
+            category = self.classify(field) if amount is not None else None
+            if category is None:
+                unmatched[field] = value
+                continue
+            # 항목명의 언더스코어를 띄어쓰기로 변환 (LLM 응답 정리 규칙과 동일)
+            categorized[category][field.replace("_", " ")] = amount
+
+        return categorized, unmatched
+
+    def merge(self, categorized: Dict[str, Dict[str, int]], llm_result: Dict[str, Any]) -> None:
+        """LLM 분류 결과(카테고리 → {항목: 금액})를 규칙 분류 결과에 합침 (합계 키는 무시)"""
+        for category, entries in llm_result.items():
+            if category in ("카테고리별 합계", self.total_key) or not isinstance(entries, dict):
+                continue
+            target = categorized[category] if category in categorized else categorized[self.fallback_category]
+            for field, value in entries.items():
+                amount = parse_amount(value)
+                if amount is not None:
+                    target[field] = amount
+
+    def build_result(self, categorized: Dict[str, Dict[str, int]],
+                     uncategorized: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        분류 결과 + 카테고리별 합계 + 총액
+
+        분류되지 못한 항목(uncategorized)의 금액도 총액에는 포함한다.
+        """
+        totals = {category: sum(categorized[category].values()) for category in self.categories}
+        total = sum(totals.values())
+        for value in (uncategorized or {}).values():
+            total += parse_amount(value) or 0
+
+        result: Dict[str, Any] = {category: categorized[category] for category in self.categories}
+        result["카테고리별 합계"] = totals
+        result[self.total_key] = total
+        return result
+
+
+INCOME_CATEGORIZER = RuleBasedCategorizer(INCOME_RULES, ("고정소득", "변동소득", "기타소득"), "총소득")
+EXPENSE_CATEGORIZER = RuleBasedCategorizer(
+    EXPENSE_RULES, ("고정지출", "변동지출", "저축 및 투자", "기타 및 예비비"), "총지출"
+)
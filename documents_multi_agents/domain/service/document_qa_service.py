@@ -0,0 +1,46 @@
+from util.llm.llm_gateway import LLMGateway
+from util.log.log import Log
+
+log_util = Log()
+llm_gateway = LLMGateway.get_instance()
+
+QA_MODEL = "gpt-4.1"
+QA_MAX_TOKENS = 2500
+
+
+# -----------------------
+# GPT 호출 래퍼 (AsyncOpenAI 게이트웨이)
+# -----------------------
+async def ask_gpt(prompt: str, max_tokens=500, session_id: str | None = None):
+    return await llm_gateway.chat(
+        messages=[{"role": "user", "content": prompt}],
+        model=QA_MODEL,
+        max_tokens=max_tokens,
+        temperature=0,
+        session_id=session_id
+    )
+
+
+# -----------------------
+# QA 에이전트 (문서 기반)
+# -----------------------
+def build_qa_prompt(document: str, question: str, role: str) -> str:
+    return f"""
+다음은 문서 자료이다. 이 문서 내의 정보만 사용하여 질문에 답해라.
+답변 시 존댓말 사용을 유지해라.
+
+요약:
+{document}
+
+질문:
+{question}
+
+규칙:
+{role}
+"""
+
+
+@log_util.logging_decorator
+async def qa_on_document(document: str, question: str, role: str, session_id: str | None = None) -> str:
+    prompt = build_qa_prompt(document, question, role)
+    return (await ask_gpt(prompt, max_tokens=QA_MAX_TOKENS, session_id=session_id)).strip()
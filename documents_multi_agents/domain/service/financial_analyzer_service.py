@@ -1,14 +1,17 @@
-import os
+import asyncio
 import json
 import re
-import hashlib
-import os
 from typing import Dict, Any
-from openai import OpenAI
 from dotenv import load_dotenv
 
+from documents_multi_agents.domain.service.category_rules import (
+    RuleBasedCategorizer,
+    INCOME_CATEGORIZER,
+    EXPENSE_CATEGORIZER,
+)
 from util.log.log import Log
 from util.cache.ai_cache import AICache
+from util.llm.llm_gateway import LLMGateway
 
 load_dotenv()
 logger = Log.get_logger()
@@ -21,7 +24,7 @@ class FinancialAnalyzerService:
     """
 
     def __init__(self):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.llm = LLMGateway.get_instance()
 
     @staticmethod
     def _fix_json_string(json_str: str) -> str:
@@ -62,12 +65,13 @@ class FinancialAnalyzerService:
         return cleaned
 
     @log_util.logging_decorator
-    def categorize_financial_data(self, decrypted_data: Dict[str, str]) -> Dict[str, Any]:
+    async def categorize_financial_data(self, decrypted_data: Dict[str, str], session_id: str | None = None) -> Dict[str, Any]:
         """
         복호화된 재무 데이터를 AI로 분석하여 카테고리별로 분류
         
         Args:
             decrypted_data: 복호화된 데이터 {"소득:급여": "3000000", "지출:식비": "500000", ...}
+            session_id: LLM 세션별 동시성 제한에 사용할 세션 ID
             
         Returns:
             카테고리별로 분류된 데이터
@@ -89,12 +93,15 @@ class FinancialAnalyzerService:
                 elif "지출" in doc_type or "expense" in doc_type.lower():
                     expense_items[field] = value
 
-        # AI로 각각 분석
-        categorized_income = self._categorize_income(income_items) if income_items else {}
-        categorized_expense = self._categorize_expense(expense_items) if expense_items else {}
+        # AI로 소득/지출 동시 분석
+        categorized_income, categorized_expense = await self.categorize_income_and_expense(
+            income_items, expense_items, session_id=session_id
+        )
 
-        # 종합 분석 및 추천
-        recommendations = self._generate_recommendations(categorized_income, categorized_expense)
+        # 종합 분석 및 추천 (두 분류가 모두 끝나면 바로 시작)
+        recommendations = await self._generate_recommendations(
+            categorized_income, categorized_expense, session_id=session_id
+        )
 
         return {
             "income": categorized_income,
@@ -103,8 +110,106 @@ class FinancialAnalyzerService:
             "summary": self._generate_summary(categorized_income, categorized_expense)
         }
 
+    async def categorize_income_and_expense(
+            self,
+            income_items: Dict[str, str],
+            expense_items: Dict[str, str],
+            session_id: str | None = None
+    ) -> tuple[Dict[str, Any], Dict[str, Any]]:
+        """소득/지출 분류를 동시에 실행하고 (소득, 지출) 결과 반환"""
+        categorized_income, categorized_expense = await asyncio.gather(
+            self._categorize_income(income_items, session_id=session_id),
+            self._categorize_expense(expense_items, session_id=session_id)
+        )
+        return categorized_income, categorized_expense
+
+    async def _categorize_with_rules(
+            self,
+            items: Dict[str, str],
+            categorizer: RuleBasedCategorizer,
+            llm_categorize,
+            cache_key: str,
+            label: str,
+            session_id: str | None = None
+    ) -> Dict[str, Any]:
+        """
+        규칙 기반 분류 후 규칙에 없는 항목만 LLM으로 분류해서 합침
+
+        카테고리별 합계 / 총액은 LLM 응답을 쓰지 않고 로컬에서 계산한다.
+        """
+        # 🔥 캐시 확인
+        cached_response = AICache.get_cached_response(cache_key)
+        if cached_response:
+            try:
+                return json.loads(cached_response)
+            except json.JSONDecodeError:
+                logger.warning(f"[CACHE] Failed to parse cached {label} data, re-analyzing")
+
+        # 알려진 항목은 LLM 없이 즉시 분류
+        categorized, unmatched = categorizer.split(items)
+        if not unmatched:
+            logger.info(f"[RULE] All {len(items)} {label} items categorized without LLM")
+            return categorizer.build_result(categorized)
+
+        logger.info(f"[RULE] {label}: {len(items) - len(unmatched)}/{len(items)} items by rules, "
+                    f"{len(unmatched)} items to LLM")
+        try:
+            llm_result = await llm_categorize(unmatched, session_id=session_id)
+        except json.JSONDecodeError as json_err:
+            # JSON 파싱 실패 시 규칙 분류 결과 + 미분류 원본 데이터 반환
+            return {
+                "error": f"AI 응답을 파싱할 수 없습니다: {str(json_err)}",
+                "raw_items": unmatched,
+                **categorizer.build_result(categorized, unmatched)
+            }
+        except Exception as e:
+            logger.error(f"[ERROR] {label.capitalize()} categorization failed: {str(e)}")
+            return {
+                "error": str(e),
+                "raw_items": unmatched,
+                **categorizer.build_result(categorized, unmatched)
+            }
+
+        categorizer.merge(categorized, llm_result)
+        result = categorizer.build_result(categorized)
+
+        # 🔥 캐시 저장 (24시간)
+        AICache.set_cached_response(cache_key, json.dumps(result, ensure_ascii=False), ttl=86400,
+                                    session_id=session_id)
+        return result
+
+    async def _request_category_json(self, prompt: str, max_tokens: int, session_id: str | None = None) -> Dict:
+        """분류 프롬프트 호출 후 JSON 파싱 (파싱 실패 시 json.JSONDecodeError)"""
+        result_text = (await self.llm.chat(
+            messages=[{"role": "user", "content": prompt}],
+            model="gpt-4o-mini",
+            max_tokens=max_tokens,
+            temperature=0,
+            seed=12345,
+            session_id=session_id
+        )).strip()
+
+        # JSON 추출
+        if "```json" in result_text:
+            result_text = result_text.split("```json")[1].split("```")[0].strip()
+        elif "```" in result_text:
+            result_text = result_text.split("```")[1].split("```")[0].strip()
+
+        # JSON 수정 (잘못된 문법 자동 수정)
+        result_text = self._fix_json_string(result_text)
+
+        try:
+            result = json.loads(result_text)
+        except json.JSONDecodeError as json_err:
+            logger.error(f"[ERROR] JSON parsing failed: {json_err}")
+            logger.error(f"[ERROR] Raw response text: {result_text}")
+            raise
+
+        # 언더스코어를 띄어쓰기로 변환
+        return self._clean_item_names(result)
+
     @log_util.logging_decorator
-    def _categorize_income(self, income_items: Dict[str, str]) -> Dict[str, Any]:
+    async def _categorize_income(self, income_items: Dict[str, str], session_id: str | None = None) -> Dict[str, Any]:
         """소득을 카테고리별로 분류"""
         if not income_items:
             return {}
@@ -112,20 +217,18 @@ class FinancialAnalyzerService:
         # 🔥 캐시 키 생성 (데이터 기반)
         data_str = json.dumps(income_items, ensure_ascii=False, sort_keys=True)
         cache_key = AICache.generate_cache_key(data_str, "categorize-income")
-        
-        # 🔥 캐시 확인
-        cached_response = AICache.get_cached_response(cache_key)
-        if cached_response:
-            try:
-                return json.loads(cached_response)
-            except json.JSONDecodeError:
-                logger.warning("[CACHE] Failed to parse cached income data, re-analyzing")
 
+        return await self._categorize_with_rules(
+            income_items, INCOME_CATEGORIZER, self._llm_categorize_income, cache_key, "income", session_id=session_id
+        )
+
+    async def _llm_categorize_income(self, items: Dict[str, str], session_id: str | None = None) -> Dict[str, Any]:
+        """규칙에 없는 소득 항목을 LLM으로 분류"""
         prompt = f"""
 다음 소득 항목들을 분석하여 아래 카테고리로 정확하게 분류해줘:
 
 소득 항목:
-{json.dumps(income_items, ensure_ascii=False, indent=2)}
+{json.dumps(items, ensure_ascii=False, indent=2)}
 
 **엄격한 분류 기준:**
 
@@ -176,71 +279,10 @@ class FinancialAnalyzerService:
 중요: 위 형식을 정확히 따라야 합니다. JSON 코드블록(```)은 제외하고 순수 JSON만 반환하세요.
 """
 
-        try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=1500,
-                temperature=0,
-                seed=12345
-            )
-
-            result_text = response.choices[0].message.content.strip()
-
-            # JSON 추출
-            if "```json" in result_text:
-                result_text = result_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in result_text:
-                result_text = result_text.split("```")[1].split("```")[0].strip()
-
-            # JSON 수정 (잘못된 문법 자동 수정)
-            result_text = self._fix_json_string(result_text)
-
-            # JSON 파싱 시도
-            try:
-                result = json.loads(result_text)
-                # 언더스코어를 띄어쓰기로 변환
-                cleaned_result = self._clean_item_names(result)
-                
-                # 🔥 캐시 저장 (24시간)
-                AICache.set_cached_response(cache_key, json.dumps(cleaned_result, ensure_ascii=False), ttl=86400)
-                
-                return cleaned_result
-            except json.JSONDecodeError as json_err:
-                logger.error(f"[ERROR] JSON parsing failed: {json_err}")
-                logger.error(f"[ERROR] Raw response text: {result_text}")
-                # JSON 파싱 실패 시 원본 데이터 반환
-                return {
-                    "error": f"AI 응답을 파싱할 수 없습니다: {str(json_err)}",
-                    "raw_items": income_items,
-                    "고정소득": {},
-                    "변동소득": {},
-                    "기타소득": {},
-                    "카테고리별 합계": {
-                        "고정소득": 0,
-                        "변동소득": 0,
-                        "기타소득": 0
-                    },
-                    "총소득": sum(int(v) for v in income_items.values() if v.isdigit())
-                }
-        except Exception as e:
-            logger.error(f"[ERROR] Income categorization failed: {str(e)}")
-            return {
-                "error": str(e),
-                "raw_items": income_items,
-                "고정소득": {},
-                "변동소득": {},
-                "기타소득": {},
-                "카테고리별 합계": {
-                    "고정소득": 0,
-                    "변동소득": 0,
-                    "기타소득": 0
-                },
-                "총소득": sum(int(v) for v in income_items.values() if v.isdigit())
-            }
+        return await self._request_category_json(prompt, max_tokens=1500, session_id=session_id)
 
     @log_util.logging_decorator
-    def _categorize_expense(self, expense_items: Dict[str, str]) -> Dict[str, Any]:
+    async def _categorize_expense(self, expense_items: Dict[str, str], session_id: str | None = None) -> Dict[str, Any]:
         """지출을 카테고리별로 분류"""
         if not expense_items:
             return {}
@@ -248,20 +290,18 @@ class FinancialAnalyzerService:
         # 🔥 캐시 키 생성 (데이터 기반)
         data_str = json.dumps(expense_items, ensure_ascii=False, sort_keys=True)
         cache_key = AICache.generate_cache_key(data_str, "categorize-expense")
-        
-        # 🔥 캐시 확인
-        cached_response = AICache.get_cached_response(cache_key)
-        if cached_response:
-            try:
-                return json.loads(cached_response)
-            except json.JSONDecodeError:
-                logger.warning("[CACHE] Failed to parse cached expense data, re-analyzing")
 
+        return await self._categorize_with_rules(
+            expense_items, EXPENSE_CATEGORIZER, self._llm_categorize_expense, cache_key, "expense", session_id=session_id
+        )
+
+    async def _llm_categorize_expense(self, items: Dict[str, str], session_id: str | None = None) -> Dict[str, Any]:
+        """규칙에 없는 지출 항목을 LLM으로 분류"""
         prompt = f"""
 다음 지출 항목들을 분석하여 아래 카테고리로 정확하게 분류해줘:
 
 지출 항목:
-{json.dumps(expense_items, ensure_ascii=False, indent=2)}
+{json.dumps(items, ensure_ascii=False, indent=2)}
 
 **엄격한 분류 기준:**
 
@@ -333,75 +373,10 @@ class FinancialAnalyzerService:
 중요: 위 형식을 정확히 따라야 합니다. JSON 코드블록(```)은 제외하고 순수 JSON만 반환하세요.
 """
 
-        try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=2000,
-                temperature=0,
-                seed=12345
-            )
-
-            result_text = response.choices[0].message.content.strip()
-
-            # JSON 추출
-            if "```json" in result_text:
-                result_text = result_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in result_text:
-                result_text = result_text.split("```")[1].split("```")[0].strip()
-
-            # JSON 수정 (잘못된 문법 자동 수정)
-            result_text = self._fix_json_string(result_text)
-
-            # JSON 파싱 시도
-            try:
-                result = json.loads(result_text)
-                # 언더스코어를 띄어쓰기로 변환
-                cleaned_result = self._clean_item_names(result)
-                
-                # 🔥 캐시 저장 (24시간)
-                AICache.set_cached_response(cache_key, json.dumps(cleaned_result, ensure_ascii=False), ttl=86400)
-                
-                return cleaned_result
-            except json.JSONDecodeError as json_err:
-                logger.error(f"[ERROR] JSON parsing failed: {json_err}")
-                logger.error(f"[ERROR] Raw response text: {result_text}")
-                # JSON 파싱 실패 시 원본 데이터 반환
-                return {
-                    "error": f"AI 응답을 파싱할 수 없습니다: {str(json_err)}",
-                    "raw_items": expense_items,
-                    "고정지출": {},
-                    "변동지출": {},
-                    "저축 및 투자": {},
-                    "기타 및 예비비": {},
-                    "카테고리별 합계": {
-                        "고정지출": 0,
-                        "변동지출": 0,
-                        "저축 및 투자": 0,
-                        "기타 및 예비비": 0
-                    },
-                    "총지출": sum(int(v) for v in expense_items.values() if v.isdigit())
-                }
-        except Exception as e:
-            logger.error(f"[ERROR] Expense categorization failed: {str(e)}")
-            return {
-                "error": str(e),
-                "raw_items": expense_items,
-                "고정지출": {},
-                "변동지출": {},
-                "저축 및 투자": {},
-                "기타 및 예비비": {},
-                "카테고리별 합계": {
-                    "고정지출": 0,
-                    "변동지출": 0,
-                    "저축 및 투자": 0,
-                    "기타 및 예비비": 0
-                },
-                "총지출": sum(int(v) for v in expense_items.values() if v.isdigit())
-            }
+        return await self._request_category_json(prompt, max_tokens=2000, session_id=session_id)
 
     @log_util.logging_decorator
-    def _generate_recommendations(self, income_data: Dict, expense_data: Dict) -> Dict[str, Any]:
+    async def _generate_recommendations(self, income_data: Dict, expense_data: Dict, session_id: str | None = None) -> Dict[str, Any]:
         """소득/지출 데이터를 기반으로 자산 분배 추천"""
         if not income_data or not expense_data:
             return {"message": "소득 또는 지출 데이터가 부족합니다"}
@@ -480,15 +455,14 @@ class FinancialAnalyzerService:
 """
 
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
+            result_text = (await self.llm.chat(
                 messages=[{"role": "user", "content": prompt}],
+                model="gpt-4o-mini",
                 max_tokens=2500,
                 temperature=0,  # 일관성을 위해 0으로 변경
-                seed=12345  # 동일한 입력에 대해 일관된 결과 보장
-            )
-
-            result_text = response.choices[0].message.content.strip()
+                seed=12345,  # 동일한 입력에 대해 일관된 결과 보장
+                session_id=session_id
+            )).strip()
             if "```json" in result_text:
                 result_text = result_text.split("```json")[1].split("```")[0].strip()
             elif "```" in result_text:
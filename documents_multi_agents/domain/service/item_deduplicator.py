@@ -0,0 +1,67 @@
+from collections import Counter
+from typing import Dict, Iterable, Tuple
+
+from documents_multi_agents.domain.service.category_rules import is_aggregate_field
+
+
+def normalize_amount(value: str) -> str:
+    """금액 비교용 정규화 ("1,000,000" / " 01000000 " → "1000000")"""
+    text = str(value).replace(",", "").strip()
+    return str(int(text)) if text.isdigit() else text
+
+
+class ItemDeduplicator:
+    """
+    추출 항목 중복 제거 (항목당 O(1))
+
+    같은 금액의 항목이 이미 있고, 둘 중 하나가 합계성 항목(총급여, 합계, 총액 ...)이면
+    새 항목을 중복으로 간주해 버린다.
+
+    금액별로 "보관 중인 항목 수"와 "그중 합계성 항목 수"만 유지하므로
+    기존 항목 전체를 다시 훑지 않는다.
+    """
+
+    def __init__(self):
+        self.items: Dict[str, str] = {}
+        self._amount_keys: Dict[str, str] = {}
+        self._count_by_amount: Counter = Counter()
+        self._aggregate_count_by_amount: Counter = Counter()
+
+    def _forget(self, field: str) -> None:
+        # 같은 항목명이 다시 들어오면 이전 값은 덮어쓰이므로 집계에서 제외
+        amount_key = self._amount_keys.pop(field)
+        self._count_by_amount[amount_key] -= 1
+        if is_aggregate_field(field):
+            self._aggregate_count_by_amount[amount_key] -= 1
+
+    def add(self, field: str, value: str) -> bool:
+        """
+        항목 추가
+
+        Returns:
+            저장했으면 True, 중복으로 버렸으면 False
+        """
+        amount_key = normalize_amount(value)
+        is_aggregate = is_aggregate_field(field)
+
+        if is_aggregate and self._count_by_amount[amount_key] > 0:
+            return False
+        if self._aggregate_count_by_amount[amount_key] > 0:
+            return False
+
+        if field in self.items:
+            self._forget(field)
+        self.items[field] = value
+        self._amount_keys[field] = amount_key
+        self._count_by_amount[amount_key] += 1
+        if is_aggregate:
+            self._aggregate_count_by_amount[amount_key] += 1
+        return True
+
+
+def deduplicate_items(items: Iterable[Tuple[str, str]]) -> Dict[str, str]:
+    """(항목명, 금액) 목록을 순서대로 중복 제거한 dict 반환"""
+    deduplicator = ItemDeduplicator()
+    for field, value in items:
+        deduplicator.add(field, value)
+    return deduplicator.items
@@ -194,3 +194,86 @@ class PromptTemplates:
         )
 
         return question, role
+
+    @staticmethod
+    def get_financial_guide_prompt(now_mon: int, tar_mon: int) -> tuple[str, str]:
+        """
+        목표 금액 재무 가이드 프롬프트
+        Args:
+            now_mon: 현재 자산
+            tar_mon: 목표 금액
+        Returns:
+            tuple[str, str]: (question, role)
+        """
+        question = (
+            f"주어진 문서 본문을 활용하여 현재 내 자산이 {now_mon}이고, "
+            f"내가 목표로 하는 금액이 {tar_mon}일 때"
+            "현재 자산이 목표 금액을 달성하기 위해 할 수 있는 방법을 분석 해줘. "
+            "이 때 목표를 단기, 중기, 장기 목표로 나누고 "
+            "각 목표를 달성하기 위한 방법으로 리스크가 없는 방법, 리스크가 있는 방법, 리스크가 큰 방법으로 나눠서 설명해줘. "
+        )
+
+        role = (
+            "주어진 문서 본문의 자료를 토대로 질문에 답변하라."
+            "추가적인 질문을 요구하는 문장은 제외하라."
+            "-- 등으로 불필요한 줄나눔은 없게 하라."
+        )
+
+        return question, role
+
+    @staticmethod
+    def get_extraction_prompt(document_type: str) -> tuple[str, str]:
+        """
+        문서 항목/금액 추출 프롬프트 (문서 타입에 따라 분기)
+        Args:
+            document_type: 문서 타입 (소득/지출 등)
+        Returns:
+            tuple[str, str]: (question, role)
+        """
+        if "소득" in document_type or "income" in document_type.lower():
+            question = (
+                "PDF에서 소득 관련 항목과 금액만 추출해줘. "
+                "반드시 다음 형식으로만 답변: 항목명: 금액 (한 줄에 하나씩) "
+                "설명, 주석, 별표, 마크다운 등 절대 사용 금지 "
+                "예시: "
+                "급여: 3000000 "
+                "식대: 200000 "
+                "상여: 500000"
+            )
+            role = (
+                "소득 항목만 포함: 급여, 상여, 식대, 수당, 총급여, 이자소득, 배당소득 "
+                "절대 제외: 보험료, 세금, 공제액 등 차감/지출 항목 "
+                "추론 금지, 문서 내 데이터만 사용 "
+                "월별 구분 있으면 합계만 사용 "
+                "설명문, 주석 절대 금지 - 순수 데이터만 반환"
+            )
+        elif "지출" in document_type or "expense" in document_type.lower():
+            question = (
+                "PDF에서 지출 관련 항목과 금액만 추출해줘. "
+                "반드시 다음 형식으로만 답변: 항목명: 금액 (한 줄에 하나씩) "
+                "설명, 주석, 별표, 마크다운 등 절대 사용 금지 "
+                "예시: "
+                "국민연금보험료: 500000 "
+                "신용카드: 1000000 "
+                "건강보험료: 300000"
+            )
+            role = (
+                "지출 항목만 포함: 보험료, 카드사용액, 세금, 공과금, 대출, 월세, 통신비 "
+                "절대 제외: 급여, 소득, 수당 등 수입 항목 "
+                "추론 금지, 문서 내 데이터만 사용 "
+                "월별 구분 있으면 합계만 사용 "
+                "설명문, 주석 절대 금지 - 순수 데이터만 반환"
+            )
+        else:
+            # 타입을 모를 경우 기본 프롬프트
+            question = (
+                "PDF의 항목과 금액을 추출해줘. "
+                "형식: 항목명: 금액 (한 줄에 하나씩)"
+            )
+            role = (
+                "문서 내 모든 금액 찾기 "
+                "월별 구분 있으면 합계만 사용 "
+                "설명문 금지 - 순수 데이터만"
+            )
+
+        return question, role
@@ -0,0 +1,35 @@
+import os
+from typing import Optional
+
+from config.crypto import Crypto
+from documents_multi_agents.application.port.analysis_job_queue_port import AnalysisJobQueuePort
+from documents_multi_agents.infrastructure.queue.in_memory_analysis_job_queue import InMemoryAnalysisJobQueue
+from documents_multi_agents.infrastructure.queue.redis_analysis_job_queue import RedisAnalysisJobQueue
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+_queue: Optional[AnalysisJobQueuePort] = None
+
+
+def get_analysis_job_queue() -> AnalysisJobQueuePort:
+    """
+    ANALYSIS_JOB_QUEUE 환경 변수에 따라 작업 큐 구현 선택 (기본: redis)
+
+    - redis: 별도 워커 프로세스와 공유 가능
+    - memory: 같은 프로세스의 내장 워커만 소비 가능
+
+    redis 라도 CRYPTO_KEY / CRYPTO_IV 가 없으면(프로세스마다 임의 키) 다른 프로세스가
+    작업 입력을 복호화할 수 없으므로 경고 후 memory 로 대체한다.
+    """
+    global _queue
+    if _queue is None:
+        backend = os.getenv("ANALYSIS_JOB_QUEUE", "redis").lower()
+        if backend != "memory" and not Crypto.is_shared_key():
+            logger.warning(
+                "[WARN] CRYPTO_KEY / CRYPTO_IV not set - analysis job queue falls back to in-memory "
+                "(external analysis workers will not receive jobs)"
+            )
+            backend = "memory"
+        _queue = InMemoryAnalysisJobQueue() if backend == "memory" else RedisAnalysisJobQueue()
+    return _queue
@@ -0,0 +1,24 @@
+import asyncio
+from typing import Optional
+
+from documents_multi_agents.application.port.analysis_job_queue_port import AnalysisJobQueuePort
+
+
+class InMemoryAnalysisJobQueue(AnalysisJobQueuePort):
+    """
+    프로세스 내 asyncio.Queue 기반 작업 큐
+
+    단일 프로세스(로컬 개발, 워커 내장 모드)에서만 사용 가능
+    """
+
+    def __init__(self):
+        self._queue: asyncio.Queue = asyncio.Queue()
+
+    async def enqueue(self, job_id: str) -> None:
+        await self._queue.put(job_id)
+
+    async def dequeue(self, timeout: float) -> Optional[str]:
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
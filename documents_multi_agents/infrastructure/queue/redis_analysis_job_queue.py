@@ -0,0 +1,34 @@
+from typing import Optional
+
+from config.crypto import Crypto
+from config.redis_config import get_async_redis, get_redis
+from documents_multi_agents.application.port.analysis_job_queue_port import AnalysisJobQueuePort
+
+
+class RedisAnalysisJobQueue(AnalysisJobQueuePort):
+    """
+    Redis List 기반 작업 큐 (LPUSH → BRPOP, FIFO)
+
+    API 서버와 분리된 워커 프로세스/서버에서도 같은 큐를 소비할 수 있다.
+    작업 입력이 암호화 저장되므로 모든 프로세스에 같은 CRYPTO_KEY / CRYPTO_IV 가 필요하다.
+    """
+
+    QUEUE_KEY = "analysis_job_queue"
+    PERSISTENT = True
+
+    def __init__(self):
+        # 프로세스마다 임의 키가 생성되면 다른 프로세스가 만든 작업을 복호화할 수 없음
+        if not Crypto.is_shared_key():
+            raise RuntimeError("CRYPTO_KEY / CRYPTO_IV must be set when ANALYSIS_JOB_QUEUE=redis")
+        self.redis_client = get_redis()
+
+    async def enqueue(self, job_id: str) -> None:
+        self.redis_client.lpush(self.QUEUE_KEY, job_id)
+
+    async def dequeue(self, timeout: float) -> Optional[str]:
+        # BRPOP은 asyncio 클라이언트로 대기 (기본 스레드 풀을 점유하지 않음)
+        result = await get_async_redis().brpop(self.QUEUE_KEY, timeout=max(1, int(timeout)))
+        if result is None:
+            return None
+        _, job_id = result
+        return job_id.decode() if isinstance(job_id, bytes) else job_id
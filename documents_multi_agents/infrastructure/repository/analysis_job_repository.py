@@ -0,0 +1,150 @@
+import base64
+import json
+import time
+import uuid
+from typing import Optional
+
+from config.crypto import Crypto
+from config.redis_config import get_redis
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+
+class AnalysisJobRepository:
+    """
+    문서 분석 작업 상태 / 입력 저장소 (Redis)
+
+    - analysis_job:{job_id}       -> Hash {status, stage, progress, session_id, document_type,
+                                           result(암호화 JSON), error, created_at, updated_at}
+    - analysis_job_input:{job_id} -> 암호화된 PDF(base64), 워커가 가져가면 삭제
+    """
+
+    JOB_PREFIX = "analysis_job:"
+    INPUT_PREFIX = "analysis_job_input:"
+    JOB_TTL = 24 * 60 * 60
+    INPUT_TTL = 60 * 60
+
+    STATUS_QUEUED = "queued"
+    STATUS_RUNNING = "running"
+    STATUS_SUCCEEDED = "succeeded"
+    STATUS_FAILED = "failed"
+
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self):
+        if not hasattr(self, "redis_client"):
+            self.redis_client = get_redis()
+            self.crypto = Crypto.get_instance()
+
+    def create(self, session_id: str, document_type: str, content: bytes, file_hash: str) -> str:
+        """작업 생성 (상태 + 입력 파일을 한 번에 저장) 후 job_id 반환"""
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        job_key = f"{self.JOB_PREFIX}{job_id}"
+        input_payload = json.dumps({
+            "file_hash": file_hash,
+            "content": base64.b64encode(content).decode("ascii")
+        })
+
+        pipe = self.redis_client.pipeline(transaction=True)
+        pipe.hset(job_key, mapping={
+            "job_id": job_id,
+            "session_id": session_id,
+            "document_type": document_type,
+            "status": self.STATUS_QUEUED,
+            "stage": self.STATUS_QUEUED,
+            "progress": 0,
+            "created_at": now,
+            "updated_at": now
+        })
+        pipe.expire(job_key, self.JOB_TTL)
+        # 업로드 파일에는 개인 재무 정보가 포함되므로 암호화 저장
+        pipe.setex(f"{self.INPUT_PREFIX}{job_id}", self.INPUT_TTL, self.crypto.enc_data(input_payload))
+        pipe.execute()
+        return job_id
+
+    def pop_input(self, job_id: str) -> Optional[tuple]:
+        """
+        작업 입력 조회 후 삭제
+
+        Returns:
+            (파일 바이트, 파일 해시) 또는 None (만료/이미 처리됨)
+        """
+        input_key = f"{self.INPUT_PREFIX}{job_id}"
+        pipe = self.redis_client.pipeline(transaction=True)
+        pipe.get(input_key)
+        pipe.delete(input_key)
+        stored, _ = pipe.execute()
+        if stored is None:
+            return None
+
+        payload = json.loads(self.crypto.dec_data(stored))
+        return base64.b64decode(payload["content"]), payload["file_hash"]
+
+    def requeue(self, job_id: str, content: bytes, file_hash: str) -> None:
+        """처리 중 중단된 작업을 대기 상태로 되돌리고 입력을 다시 저장 (큐에는 호출 측이 다시 넣음)"""
+        input_payload = json.dumps({
+            "file_hash": file_hash,
+            "content": base64.b64encode(content).decode("ascii")
+        })
+
+        pipe = self.redis_client.pipeline(transaction=True)
+        pipe.hset(f"{self.JOB_PREFIX}{job_id}", mapping={
+            "status": self.STATUS_QUEUED,
+            "stage": self.STATUS_QUEUED,
+            "progress": 0,
+            "updated_at": time.time()
+        })
+        pipe.setex(f"{self.INPUT_PREFIX}{job_id}", self.INPUT_TTL, self.crypto.enc_data(input_payload))
+        pipe.execute()
+
+    def get(self, job_id: str) -> Optional[dict]:
+        job = self.redis_client.hgetall(f"{self.JOB_PREFIX}{job_id}")
+        if not job:
+            return None
+
+        job["progress"] = int(job.get("progress", 0))
+        if "result" in job:
+            try:
+                job["result"] = json.loads(self.crypto.dec_data(job["result"]))
+            except Exception as e:
+                # 다른 키로 암호화된 결과 (CRYPTO_KEY 변경 등)
+                logger.error(f"[ERROR] Analysis job {job_id} result decrypt failed: {e}")
+                job["result"] = None
+                job["status"] = self.STATUS_FAILED
+                job["error"] = "Analysis result is no longer readable"
+        return job
+
+    def _update(self, job_id: str, fields: dict) -> None:
+        fields["updated_at"] = time.time()
+        self.redis_client.hset(f"{self.JOB_PREFIX}{job_id}", mapping=fields)
+
+    def mark_running(self, job_id: str) -> None:
+        self._update(job_id, {"status": self.STATUS_RUNNING})
+
+    def update_progress(self, job_id: str, stage: str, progress: int) -> None:
+        self._update(job_id, {"stage": stage, "progress": progress})
+
+    def mark_succeeded(self, job_id: str, result: dict) -> None:
+        self._update(job_id, {
+            "status": self.STATUS_SUCCEEDED,
+            "stage": "done",
+            "progress": 100,
+            # 분석 결과도 세션 데이터와 동일하게 암호화 저장
+            "result": self.crypto.enc_data(json.dumps(result, ensure_ascii=False))
+        })
+
+    def mark_failed(self, job_id: str, error: str) -> None:
+        self._update(job_id, {"status": self.STATUS_FAILED, "error": error})
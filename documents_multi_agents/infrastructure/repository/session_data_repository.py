@@ -0,0 +1,193 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Dict, Iterator, Optional
+
+from config.crypto import Crypto
+from config.redis_config import get_redis
+from documents_multi_agents.domain.model.session_financial_data import FinancialItem, SessionFinancialData
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+# 요청 단위 메모 (요청 Task마다 별도 컨텍스트, session_data_memo 블록 안에서만 사용)
+_request_memo: ContextVar[Optional[Dict]] = ContextVar("session_data_memo", default=None)
+
+
+@contextmanager
+def session_data_memo() -> Iterator[None]:
+    """블록 동안 복호화 결과를 메모하고, 끝나면 이전 상태로 되돌림"""
+    token = _request_memo.set({})
+    try:
+        yield
+    finally:
+        _request_memo.reset(token)
+
+
+async def request_session_data_memo() -> AsyncIterator[None]:
+    """
+    FastAPI 의존성 - 요청 하나 동안만 SessionDataRepository.load 결과를 메모
+
+    router의 dependencies에 등록하면 요청이 끝날 때 메모가 비워진다.
+    (메모 범위 밖의 호출은 L1만 사용)
+    """
+    with session_data_memo():
+        yield
+
+
+class SessionDataRepository:
+    """
+    세션(Redis Hash)에 저장되는 암호화된 재무 데이터 저장소
+
+    Hash 구조: session_id -> {
+        enc("문서타입:항목명"): enc("금액"),
+        "USER_TOKEN": ...,     # 평문
+        "DATA_VERSION": n      # 평문, 재무 데이터가 저장될 때마다 증가
+    }
+    """
+
+    SESSION_EXPIRE_SECONDS = 24 * 60 * 60
+    USER_TOKEN_FIELD = "USER_TOKEN"
+    VERSION_FIELD = "DATA_VERSION"
+    PLAIN_FIELDS = (USER_TOKEN_FIELD, VERSION_FIELD)
+
+    # 복호화 결과 L1 (session_id, version) 기준 - 0이면 비활성화
+    L1_MAX_ENTRIES = int(os.getenv("SESSION_DATA_L1_MAX_ENTRIES", 1024))
+    L1_TTL = int(os.getenv("SESSION_DATA_L1_TTL", 60))
+
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self):
+        if not hasattr(self, "redis_client"):
+            self.redis_client = get_redis()
+            self.crypto = Crypto.get_instance()
+            self._l1: "OrderedDict[tuple, tuple[float, SessionFinancialData]]" = OrderedDict()
+            self._l1_lock = threading.Lock()
+
+    def save_items(self, session_id: str, document_type: str, items: Dict[str, str],
+                   expire_seconds: int = SESSION_EXPIRE_SECONDS) -> bool:
+        """
+        항목 전체를 암호화해 한 번의 MULTI(HSET mapping + 버전 증가 + EXPIRE)로 저장
+
+        Args:
+            session_id: 세션 ID
+            document_type: 문서 타입 (키 prefix)
+            items: {항목명: 금액}
+            expire_seconds: 세션 만료 시간 (초)
+
+        Returns:
+            저장 성공 여부 (파이프라인 결과 기준)
+        """
+        if not items:
+            return True
+
+        # 키/값 전체를 한 번에 암호화 (키1, 값1, 키2, 값2, ...)
+        plain = []
+        for field, value in items.items():
+            plain.append(f"{document_type}:{field}")
+            plain.append(value)
+        encrypted = self.crypto.enc_data_batch(plain)
+        mapping = dict(zip(encrypted[0::2], encrypted[1::2]))
+
+        try:
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.hset(session_id, mapping=mapping)
+            pipe.hincrby(session_id, self.VERSION_FIELD, 1)
+            pipe.expire(session_id, expire_seconds)
+            added, version, expired = pipe.execute()
+        except Exception as e:
+            logger.error(f"[ERROR] Failed to save session data: {str(e)}")
+            return False
+
+        logger.info(f"Saved {len(mapping)} items ({added} new fields, version {version}), expire set: {bool(expired)}")
+        return bool(expired)
+
+    def load(self, session_id: str) -> SessionFinancialData:
+        """
+        세션의 재무 데이터를 복호화해 반환
+
+        같은 요청 안에서는 (session_id, 데이터 버전)당 한 번만 복호화하고,
+        짧은 TTL의 L1을 통해 동시에 들어온 다른 분석 요청과도 결과를 공유한다.
+        """
+        version = self.redis_client.hget(session_id, self.VERSION_FIELD)
+        memo_key = (session_id, version)
+
+        # 메모 범위 밖(워커 / 스크립트 등)에서는 같은 Task 안에 결과가 계속 남지 않도록 메모하지 않음
+        memo = _request_memo.get()
+        if memo is not None and memo_key in memo:
+            return memo[memo_key]
+
+        # 버전이 없는 세션(데이터 미저장/구버전)은 L1을 쓰지 않음
+        data = self._l1_get(memo_key) if version is not None else None
+        if data is None:
+            data = self._load_from_redis(session_id)
+            if data.version is not None:
+                self._l1_set((session_id, data.version), data)
+
+        if memo is not None:
+            memo[memo_key] = data
+        return data
+
+    def _load_from_redis(self, session_id: str) -> SessionFinancialData:
+        content = self.redis_client.hgetall(session_id)
+        version = content.get(self.VERSION_FIELD)
+
+        # 키/값 전체를 한 번에 복호화 (키1, 값1, 키2, 값2, ...)
+        encrypted = []
+        for k_str, v_str in content.items():
+            if k_str in self.PLAIN_FIELDS:
+                continue
+            encrypted.append(k_str)
+            encrypted.append(v_str)
+        decrypted = self.crypto.dec_data_batch(encrypted)
+
+        items = []
+        failed = 0
+        for key_plain, val_plain in zip(decrypted[0::2], decrypted[1::2]):
+            # 복호화 실패 또는 "type:field" 형태가 아니면 무시
+            if key_plain is None or val_plain is None or ":" not in key_plain:
+                failed += 1
+                continue
+            document_type, field_name = key_plain.split(":", 1)
+            items.append(FinancialItem(document_type=document_type, field=field_name, amount=val_plain))
+
+        if failed:
+            logger.warning(f"[WARN] Skipped {failed} undecryptable session fields")
+        return SessionFinancialData(session_id=session_id, version=version, items=items)
+
+    def _l1_get(self, key: tuple) -> Optional[SessionFinancialData]:
+        if self.L1_MAX_ENTRIES <= 0:
+            return None
+        with self._l1_lock:
+            entry = self._l1.get(key)
+            if entry is None:
+                return None
+            expires_at, data = entry
+            if expires_at <= time.monotonic():
+                del self._l1[key]
+                return None
+            self._l1.move_to_end(key)
+            return data
+
+    def _l1_set(self, key: tuple, data: SessionFinancialData) -> None:
+        if self.L1_MAX_ENTRIES <= 0:
+            return
+        with self._l1_lock:
+            self._l1[key] = (time.monotonic() + self.L1_TTL, data)
+            self._l1.move_to_end(key)
+            while len(self._l1) > self.L1_MAX_ENTRIES:
+                self._l1.popitem(last=False)
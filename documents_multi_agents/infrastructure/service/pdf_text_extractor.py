@@ -0,0 +1,174 @@
+import asyncio
+import hashlib
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from config.crypto import Crypto
+from config.redis_config import get_redis
+from documents_multi_agents.infrastructure.service import pdf_text_worker
+from util.cache.cache_codec import CacheCodec
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+
+class PdfExtractionError(ValueError):
+    """PDF 파싱 실패 (손상된 파일, 시간 초과 등)"""
+
+
+class PdfTooManyPagesError(PdfExtractionError):
+    """최대 페이지 수 초과"""
+
+
+class PdfTextExtractor:
+    """
+    PDF 텍스트 추출 서비스
+
+    - CPU 작업(pypdf)을 프로세스 풀에서 실행해 이벤트 루프를 막지 않음
+    - 페이지가 많은 문서는 페이지 구간을 나눠 여러 워커에서 병렬 파싱
+    - 추출 결과는 파일 바이트의 SHA-256 기준으로 Redis에 캐싱 (암호화 저장)
+      CRYPTO_KEY / CRYPTO_IV 가 없으면(프로세스마다 임의 키) 다른 프로세스가 읽을 수 없으므로 캐시 사용 안 함
+    - 시간 초과 시 풀을 새로 만들어 다음 요청이 멈춘 워커를 기다리지 않게 함
+    """
+
+    CACHE_PREFIX = "pdf_text:"
+    CACHE_TTL = int(os.getenv("PDF_TEXT_CACHE_TTL", 60 * 60))
+    MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", 50))
+    TIMEOUT = float(os.getenv("PDF_EXTRACT_TIMEOUT", 30))
+    WORKERS = int(os.getenv("PDF_WORKERS", min(4, os.cpu_count() or 1)))
+    PAGES_PER_CHUNK = int(os.getenv("PDF_PAGES_PER_CHUNK", 8))
+
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self):
+        if not hasattr(self, "redis_client"):
+            self.redis_client = get_redis()
+            self.crypto = Crypto.get_instance()
+            self._pool: Optional[ProcessPoolExecutor] = None
+            self.cache_enabled = Crypto.is_shared_key()
+            if not self.cache_enabled:
+                logger.warning("[WARN] CRYPTO_KEY / CRYPTO_IV not set - PDF text cache disabled")
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn: 부모 프로세스의 스레드/커넥션 상태를 물려받지 않음
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._pool
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _recycle_pool(self) -> None:
+        """
+        기존 풀은 대기 중인 작업만 취소하고 새 풀로 교체
+
+        실행 중인 워커는 중단할 수 없으므로 기존 풀에서 끝까지 실행된 뒤 종료되고,
+        이후 요청은 새 풀을 사용한다.
+        """
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_pool(), func, *args)
+
+    @staticmethod
+    def hash_bytes(file_bytes: bytes) -> str:
+        return hashlib.sha256(file_bytes).hexdigest()
+
+    async def extract_text(self, file_bytes: bytes, file_hash: Optional[str] = None) -> str:
+        """
+        PDF 텍스트 추출 (페이지별 공백/페이지 번호 정리)
+
+        Args:
+            file_bytes: PDF 파일 바이트
+            file_hash: 파일 SHA-256 (업로드 중 이미 계산했다면 전달)
+
+        Returns:
+            페이지 텍스트를 줄바꿈으로 연결한 문자열
+        """
+        file_hash = file_hash or self.hash_bytes(file_bytes)
+        cache_key = f"{self.CACHE_PREFIX}{file_hash}"
+
+        cached_text = self._get_cached(cache_key)
+        if cached_text is not None:
+            logger.info(f"✅ PDF text cache HIT: {file_hash[:12]}")
+            return cached_text
+
+        try:
+            text = await asyncio.wait_for(self._extract(file_bytes), timeout=self.TIMEOUT)
+        except asyncio.TimeoutError:
+            # 시간 초과된 작업이 풀 슬롯을 계속 점유하므로 풀을 교체
+            self._recycle_pool()
+            raise PdfExtractionError(f"PDF parsing timed out after {self.TIMEOUT:.0f}s")
+        except BrokenProcessPool as e:
+            # 워커가 비정상 종료되면 다음 요청을 위해 풀을 새로 만든다
+            self._recycle_pool()
+            raise PdfExtractionError(f"PDF worker crashed: {str(e)}")
+        except PdfExtractionError:
+            raise
+        except Exception as e:
+            raise PdfExtractionError(str(e))
+
+        self._set_cached(cache_key, text)
+        return text
+
+    async def _extract(self, file_bytes: bytes) -> str:
+        page_count = await self._run(pdf_text_worker.count_pages, file_bytes)
+        if page_count > self.MAX_PAGES:
+            raise PdfTooManyPagesError(f"PDF has {page_count} pages (max {self.MAX_PAGES})")
+
+        # 페이지 구간 분할 (작은 문서는 한 번에)
+        chunk_count = min(self.WORKERS, math.ceil(page_count / self.PAGES_PER_CHUNK)) or 1
+        chunk_size = math.ceil(page_count / chunk_count) if page_count else 1
+        ranges = [(start, min(start + chunk_size, page_count)) for start in range(0, page_count, chunk_size)]
+
+        chunks = await asyncio.gather(*[
+            self._run(pdf_text_worker.extract_page_range, file_bytes, start, end)
+            for start, end in ranges
+        ])
+        logger.info(f"PDF parsed: {page_count} pages in {len(ranges)} chunk(s)")
+        return "\n".join(text for chunk in chunks for text in chunk)
+
+    def _get_cached(self, cache_key: str) -> Optional[str]:
+        if not self.cache_enabled:
+            return None
+        try:
+            stored = self.redis_client.get(cache_key)
+            if stored is None:
+                return None
+            return CacheCodec.decode(self.crypto.dec_data(stored))
+        except Exception as e:
+            logger.error(f"PDF text cache read error: {e}")
+            return None
+
+    def _set_cached(self, cache_key: str, text: str) -> None:
+        if not self.cache_enabled:
+            return
+        try:
+            # 압축 후 암호화 (추출 텍스트에 개인 재무 정보가 포함됨)
+            encoded, _ = CacheCodec.encode(text)
+            self.redis_client.setex(cache_key, self.CACHE_TTL, self.crypto.enc_data(encoded))
+        except Exception as e:
+            logger.error(f"PDF text cache write error: {e}")
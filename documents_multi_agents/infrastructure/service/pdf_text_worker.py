@@ -0,0 +1,31 @@
+"""
+프로세스 풀 워커에서 실행되는 PDF 파싱 함수
+
+워커 프로세스가 가볍게 뜨도록 pypdf 외의 의존성(redis, openai 등)은 import 하지 않는다.
+"""
+import io
+import re
+from typing import List
+
+from pypdf import PdfReader
+
+
+def clean_page_text(text: str) -> str:
+    text = re.sub(r'\s+', ' ', text)  # 공백 정리
+    text = re.sub(r'\d+\s*$', '', text)  # 페이지 번호 제거 (행 끝 숫자)
+    return text.strip()
+
+
+def count_pages(file_bytes: bytes) -> int:
+    return len(PdfReader(io.BytesIO(file_bytes)).pages)
+
+
+def extract_page_range(file_bytes: bytes, start: int, end: int) -> List[str]:
+    """[start, end) 범위 페이지의 정리된 텍스트 (빈 페이지 제외)"""
+    reader = PdfReader(io.BytesIO(file_bytes))
+    texts = []
+    for page in reader.pages[start:end]:
+        t = clean_page_text(page.extract_text() or "")
+        if t:
+            texts.append(t)
+    return texts
@@ -1,74 +1,93 @@
-from fastapi import APIRouter
+import json
+from typing import Literal, Optional, Tuple
 
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+
+from account.adapter.input.web.session_helper import get_current_user
+from kftc.application.usecase.kftc_usecase import KftcUseCase
 from kftc.infrastructure.service.kftc_service import KftcService
 from util.log.log import Log
 
 kftc_router = APIRouter()
 svc = KftcService.get_instance()
+usecase = KftcUseCase.get_instance()
 logger = Log.get_logger()
 
-@kftc_router.get("/redirect")
-def auth_callback(code: str):
-    token_data = svc.get_access_token(code)
-    access_token = token_data["access_token"]
-    user_seq_no = token_data["user_seq_no"]
+def _set_session_cookie(response: Response, session_id: str) -> None:
+    response.set_cookie(
+        key="session_id",
+        value=session_id,
+        max_age=24 * 60 * 60,
+        httponly=True,
+        samesite="lax"
+    )
 
-    svc.access_token = access_token
-    svc.user_seq_no = user_seq_no
+
+async def _exchange_token(code: str, session_id: str, redirect_uri_env: str) -> Tuple[str, str]:
+    """인가 코드로 토큰 교환 후 (access_token, user_seq_no) 반환, 실패 시 502"""
+    try:
+        token_data = await svc.get_access_token(code, redirect_uri_env)
+        access_token = token_data["access_token"]
+        user_seq_no = token_data["user_seq_no"]
+    except Exception as e:
+        logger.error(f"[ERROR] KFTC token exchange failed: {str(e)}")
+        raise HTTPException(status_code=502, detail="KFTC token exchange failed")
 
     logger.debug("Access token fetched")
+    # 저장된 거래 조회(/kftc/transactions)용으로 세션과 오픈뱅킹 사용자 연결
+    usecase.link_user(session_id, user_seq_no)
+    return access_token, user_seq_no
+
+
+@kftc_router.get("/redirect")
+async def auth_callback(code: str, response: Response, session_id: str = Depends(get_current_user)):
+    access_token, user_seq_no = await _exchange_token(code, session_id, "KFTC_REDIRECT_URI")
+
+    # 사용자 정보 / 카드 목록 조회 후 계좌별 / 카드별로 지난 동기화 이후의 새 거래만 동시에 조회
+    # (일부 기관 실패 시 해당 항목만 error로 표시)
+    result = await usecase.sync_transactions(access_token=access_token, user_seq_no=user_seq_no)
+    logger.debug(f"KFTC transactions synced: accounts={len(result['accounts'])}, cards={len(result['cards'])}")
+
+    _set_session_cookie(response, session_id)
+    return result
+
+
+@kftc_router.get("/redirect/stream")
+async def auth_callback_stream(code: str, session_id: str = Depends(get_current_user)):
+    """
+    /redirect 와 같은 동기화를 NDJSON(한 줄에 이벤트 하나)으로 전송
+
+    거래내역 전체를 모으지 않고 도착하는 대로 보내므로 이력이 길어도 메모리 사용량이 일정하다.
+    이벤트: user_info → transaction ... / source_done (계좌 / 카드별) → done
+    인증 요청의 redirect_uri 로 이 엔드포인트를 지정하고 KFTC_STREAM_REDIRECT_URI 에 같은 값을 설정해야 한다.
+    """
+    access_token, user_seq_no = await _exchange_token(code, session_id, "KFTC_STREAM_REDIRECT_URI")
+
+    async def event_stream():
+        async for event in usecase.stream_transactions(access_token=access_token, user_seq_no=user_seq_no):
+            yield json.dumps(event, ensure_ascii=False) + "\n"
+
+    response = StreamingResponse(event_stream(), media_type="application/x-ndjson")
+    _set_session_cookie(response, session_id)
+    return response
+
+
+@kftc_router.get("/transactions")
+async def get_transactions(
+    source: Optional[Literal["account", "card"]] = None,
+    source_id: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    session_id: str = Depends(get_current_user)
+):
+    """
+    동기화로 저장된 거래 전체 이력 조회 (최신순)
 
-    # 2) 사용자 정보 조회 → 계좌 목록 포함
-    user_info = svc.get_user_info(access_token, user_seq_no)
-    logger.debug("User info fetched")
-
-    # 3) 계좌 목록 기반 거래내역 조회
-    account_results = []
-    for acc in user_info.get("res_list", []):
-        fintech_num = acc["fintech_use_num"]
-        bank_tran_id = svc.generate_bank_tran_id()
-
-        tx_list = svc.get_account_transactions(
-            access_token=access_token,
-            bank_tran_id=bank_tran_id,
-            fintech_use_num=fintech_num,
-            from_date="20251001",
-            to_date="20251030"
-        )
-
-        account_results.append({
-            "bank_name": acc["bank_name"],
-            "account_num": acc["account_num_masked"],
-            "transactions": tx_list
-        })
-
-    logger.debug("Account transactions fetched")
-
-    # 4) 카드 목록 조회
-    card_list = svc.get_card_list(access_token, user_seq_no)
-    logger.debug("Card list fetched")
-
-    # 5) 카드별 승인내역 조회
-    card_results = []
-    for card in card_list.get("card_list", []):
-        org_code = card["org_code"]
-
-        approval_list = svc.get_card_transactions(
-            access_token=access_token,
-            user_seq_no=user_seq_no,
-            org_code=org_code,
-            from_datetime="20240101",
-            to_datetime="20240201"
-        )
-
-        card_results.append({
-            "card_name": card["card_name"],
-            "org_code": org_code,
-            "approvals": approval_list
-        })
-
-    return {
-        "user_info": user_info,
-        "accounts": account_results,
-        "cards": card_results
-    }
+    /kftc/redirect 는 지난 동기화 이후의 새 거래만 반환하므로, 이전 거래는 여기서 조회한다.
+    호출자의 세션에 연결된 user_seq_no 기준이며, 연결되지 않았으면 404
+    """
+    transactions = await usecase.get_transactions(session_id, source, source_id, limit, offset)
+    if transactions is None:
+        raise HTTPException(status_code=404, detail="KFTC account is not linked to this session")
+    return {"transactions": transactions, "limit": limit, "offset": offset}
@@ -0,0 +1,290 @@
+import asyncio
+import os
+from datetime import date, datetime, timedelta
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Tuple
+
+from kftc.domain.model.kftc_transaction import KftcTransaction
+from kftc.domain.service.incremental_sync_filter import IncrementalSyncFilter
+from kftc.infrastructure.repository.kftc_sync_state_repository import KftcSyncStateRepository
+from kftc.infrastructure.repository.kftc_transaction_repository import KftcTransactionRepository
+from kftc.infrastructure.repository.kftc_user_link_repository import KftcUserLinkRepository
+from kftc.infrastructure.service.kftc_service import KftcService
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+
+class KftcUseCase:
+    """
+    계좌 / 카드 거래내역 증분 동기화 (이벤트 스트림)
+
+    - 기관별 조회를 동시에 실행 (동시 호출 수 / 타임아웃 제한은 KftcService에서 적용)
+    - 거래내역은 페이지 단위 스트림으로 받아 공통 레코드로 정규화하고, 모으지 않고 바로 내보냄
+      (기관별 조회 결과는 크기가 제한된 큐 하나로 합쳐지므로 소비가 느리면 조회도 멈춤)
+    - 계좌(fintech_use_num) / 카드(org_code)별 high-water mark 이후 거래만 조회하고 새 거래만 반환
+    - 새 거래는 kftc_transaction 테이블에 먼저 저장하고, mark는 해당 거래 이벤트를 모두 내보낸 뒤에 갱신
+      (중간에 연결이 끊기면 mark가 그대로라 다음 동기화에서 다시 받음, 전체 이력은 테이블에서 조회)
+    - 조회 기간은 KFTC_SYNC_WINDOW_DAYS 일 단위로 나눠 구간마다 mark를 갱신
+      (기간이 길어 페이지 제한에 걸려도 다음 동기화가 이어서 받으므로 계속 같은 곳에서 멈추지 않음)
+    - 한 기관이 실패해도 나머지 결과는 반환 (실패 항목은 source_done 이벤트의 error에 사유 기록)
+    - 저장된 전체 이력은 로그인 세션에 연결된 user_seq_no 기준으로 조회 (get_transactions)
+    """
+
+    INITIAL_SYNC_DAYS = int(os.getenv("KFTC_INITIAL_SYNC_DAYS", 90))  # 첫 동기화 조회 기간
+    STREAM_BUFFER = int(os.getenv("KFTC_STREAM_BUFFER", 100))  # 소비 대기 중인 최대 이벤트 수
+    SAVE_BATCH_SIZE = int(os.getenv("KFTC_SAVE_BATCH_SIZE", 100))  # 거래 저장 단위 (INSERT 한 번)
+    SYNC_WINDOW_DAYS = int(os.getenv("KFTC_SYNC_WINDOW_DAYS", 30))  # 조회 구간 단위 (구간마다 mark 갱신)
+
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+            cls.__instance.service = KftcService.get_instance()
+            cls.__instance.sync_state = KftcSyncStateRepository.get_instance()
+            cls.__instance.transaction_repository = KftcTransactionRepository.get_instance()
+            cls.__instance.user_link = KftcUserLinkRepository.get_instance()
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def link_user(self, session_id: str, user_seq_no: str) -> None:
+        """토큰 교환에 성공한 세션을 오픈뱅킹 사용자와 연결"""
+        self.user_link.save(session_id, user_seq_no)
+
+    async def get_transactions(self, session_id: str, source: Optional[str] = None, source_id: Optional[str] = None,
+                               limit: int = 100, offset: int = 0) -> Optional[List[dict]]:
+        """세션에 연결된 사용자의 저장된 거래 (최신순), 연결된 사용자가 없으면 None"""
+        user_seq_no = self.user_link.get(session_id)
+        if not user_seq_no:
+            return None
+        transactions = await self.transaction_repository.find_by_user(user_seq_no, source, source_id, limit, offset)
+        return [transaction.to_dict() for transaction in transactions]
+
+    @staticmethod
+    def _error_message(e: Exception) -> str:
+        return "timeout" if isinstance(e, asyncio.TimeoutError) else f"{type(e).__name__}: {str(e)}"
+
+    async def _call(self, label: str, call: Callable[[], Awaitable[dict]]) -> Tuple[Optional[dict], Optional[str]]:
+        """(결과, 에러 메시지) 반환 - 예외를 올리지 않음"""
+        try:
+            return await call(), None
+        except Exception as e:
+            error = self._error_message(e)
+        logger.error(f"[ERROR] KFTC {label} failed: {error}")
+        return None, error
+
+    def _sync_start(self, high_water_mark: Optional[str], today: date) -> date:
+        """high-water mark 날짜부터 다시 조회 (없거나 형식이 잘못됐으면 첫 동기화 기간)"""
+        if high_water_mark:
+            try:
+                return datetime.strptime(high_water_mark[:8], "%Y%m%d").date()
+            except ValueError:
+                logger.warning(f"[WARN] Invalid KFTC high-water mark: {high_water_mark}")
+        return today - timedelta(days=self.INITIAL_SYNC_DAYS)
+
+    def _windows(self, start: date, end: date) -> List[Tuple[str, str]]:
+        """start ~ end 를 SYNC_WINDOW_DAYS 일 단위 (from_date, to_date) 구간으로 분할 (과거 구간부터)"""
+        windows = []
+        while True:
+            window_end = min(start + timedelta(days=self.SYNC_WINDOW_DAYS - 1), end)
+            windows.append((start.strftime("%Y%m%d"), window_end.strftime("%Y%m%d")))
+            if window_end >= end:
+                return windows
+            start = window_end + timedelta(days=1)
+
+    async def _checkpoint(self, queue: asyncio.Queue, user_seq_no: str, source: str, source_id: str,
+                          sync_filter: IncrementalSyncFilter, batch: List[KftcTransaction],
+                          save_mark: bool = True) -> None:
+        """
+        저장 대기 중인 거래를 저장한 뒤, 지금까지 받은 데까지의 동기화 상태를 checkpoint 이벤트로 큐에 넣음
+
+        상태는 소비 측(stream_transactions)이 앞선 거래 이벤트를 모두 내보낸 뒤에 저장한다.
+        """
+        await self.transaction_repository.save_all(user_seq_no, batch)
+        batch.clear()
+        if save_mark and sync_filter.changed:
+            await queue.put({
+                "type": "checkpoint",
+                "source": source,
+                "source_id": source_id,
+                "high_water_mark": sync_filter.new_high_water_mark,
+                # 조회가 계속되면서 바뀌므로 복사
+                "boundary_ids": set(sync_filter.new_boundary_ids)
+            })
+
+    async def _sync_source(self, queue: asyncio.Queue, user_seq_no: str, source: str, source_id: str,
+                           info: dict, open_stream: Callable[[str, str], AsyncIterator[KftcTransaction]],
+                           ascending: bool = False) -> None:
+        """
+        high-water mark 날짜부터 오늘까지 구간별로 조회해 새 거래를 저장하고 큐로 내보냄
+
+        - 구간 하나를 끝까지 받으면 거래를 저장하고 mark 갱신 (checkpoint 이벤트)
+        - 구간 도중 실패(페이지 제한, 타임아웃 등)하면 받은 거래는 저장하고,
+          과거순 조회(ascending)면 마지막으로 받은 거래까지 mark 갱신 / 아니면 이전 구간까지만 유지
+        - 어느 경우든 다음 동기화는 저장된 mark부터 이어서 받는다. (이미 저장된 거래는 유니크 키로 무시)
+        """
+        count = 0
+        error = None
+        batch: List[KftcTransaction] = []
+        try:
+            high_water_mark, boundary_ids = self.sync_state.get(user_seq_no, source, source_id)
+            sync_filter = IncrementalSyncFilter(high_water_mark, boundary_ids)
+
+            today = datetime.now().date()
+            for from_date, to_date in self._windows(self._sync_start(high_water_mark, today), today):
+                try:
+                    async for transaction in open_stream(from_date, to_date):
+                        if sync_filter.accept(transaction):
+                            count += 1
+                            batch.append(transaction)
+                            if len(batch) >= self.SAVE_BATCH_SIZE:
+                                await self.transaction_repository.save_all(user_seq_no, batch)
+                                batch = []
+                            await queue.put({"type": "transaction", **transaction.to_dict()})
+                except Exception:
+                    await self._checkpoint(queue, user_seq_no, source, source_id, sync_filter, batch, save_mark=ascending)
+                    raise
+                await self._checkpoint(queue, user_seq_no, source, source_id, sync_filter, batch)
+
+            logger.debug(
+                f"KFTC {source} sync from {high_water_mark or 'initial'}: "
+                f"new={sync_filter.accepted_count}, skipped={sync_filter.skipped_count}"
+            )
+        except Exception as e:
+            error = self._error_message(e)
+            logger.error(f"[ERROR] KFTC {source} {source_id} sync failed: {error}")
+
+        await queue.put({"type": "source_done", "source": source, "source_id": source_id, **info,
+                         "count": count, "error": error})
+
+    def _account_producer(self, queue: asyncio.Queue, access_token: str, user_seq_no: str, acc: dict) -> Awaitable[None]:
+        fintech_use_num = acc["fintech_use_num"]
+        return self._sync_source(
+            queue, user_seq_no, "account", fintech_use_num,
+            {"bank_name": acc["bank_name"], "account_num": acc["account_num_masked"]},
+            lambda from_date, to_date: self.service.iter_account_transactions(
+                access_token=access_token,
+                fintech_use_num=fintech_use_num,
+                from_date=from_date,
+                to_date=to_date
+            ),
+            ascending=True
+        )
+
+    def _card_producer(self, queue: asyncio.Queue, access_token: str, user_seq_no: str, card: dict) -> Awaitable[None]:
+        org_code = card["org_code"]
+        return self._sync_source(
+            queue, user_seq_no, "card", org_code,
+            {"card_name": card["card_name"]},
+            lambda from_date, to_date: self.service.iter_card_transactions(
+                access_token=access_token,
+                user_seq_no=user_seq_no,
+                org_code=org_code,
+                from_date=from_date,
+                to_date=to_date
+            )
+        )
+
+    async def stream_transactions(self, access_token: str, user_seq_no: str) -> AsyncIterator[dict]:
+        """
+        동기화 이벤트를 순서대로 반환
+
+        - {"type": "user_info", ...}    계좌 목록 조회 결과
+        - {"type": "transaction", ...}  새 거래 (KftcTransaction 필드)
+        - {"type": "source_done", ...}  계좌 / 카드 하나 완료 (count, error)
+        - {"type": "done", "errors"}    전체 완료 (계좌 / 카드 목록 조회 실패 사유)
+
+        동기화 상태(mark)는 그 앞의 거래 이벤트가 모두 소비된 뒤에 저장하므로,
+        소비 도중 중단되면(클라이언트 연결 종료 등) 전달하지 못한 거래는 다음 동기화에서 다시 받는다.
+        """
+        # 1) 사용자 정보(계좌 목록)와 카드 목록을 동시에 조회
+        (user_info, user_info_error), (card_list, card_list_error) = await asyncio.gather(
+            self._call("user info", lambda: self.service.get_user_info(access_token, user_seq_no)),
+            self._call("card list", lambda: self.service.get_card_list(access_token, user_seq_no))
+        )
+        user_info = user_info or {}
+        card_list = card_list or {}
+        yield {"type": "user_info", "user_info": user_info}
+
+        # 2) 계좌별 / 카드별 새 거래내역을 동시에 조회하며 도착하는 대로 반환
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.STREAM_BUFFER)
+        producers = [
+            self._account_producer(queue, access_token, user_seq_no, acc)
+            for acc in user_info.get("res_list", [])
+        ] + [
+            self._card_producer(queue, access_token, user_seq_no, card)
+            for card in card_list.get("card_list", [])
+        ]
+        tasks = [asyncio.create_task(producer) for producer in producers]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                event = await queue.get()
+                if event["type"] == "checkpoint":
+                    # 큐는 생산자별로 순서가 유지되므로 이 시점에는 앞선 거래 이벤트가 모두 소비됨
+                    self.sync_state.save(user_seq_no, event["source"], event["source_id"],
+                                         event["high_water_mark"], event["boundary_ids"])
+                    continue
+                if event["type"] == "source_done":
+                    remaining -= 1
+                yield event
+        finally:
+            # 클라이언트 연결 종료 등으로 중단되면 남은 조회도 취소
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        errors = {
+            name: error
+            for name, error in (("user_info", user_info_error), ("card_list", card_list_error))
+            if error
+        }
+        yield {"type": "done", "errors": errors}
+
+    async def sync_transactions(self, access_token: str, user_seq_no: str) -> dict:
+        """
+        stream_transactions 결과를 계좌 / 카드별로 모아 한 번에 반환 (JSON 응답용)
+
+        {"user_info", "accounts": [{bank_name, account_num, transactions, error}],
+         "cards": [{card_name, org_code, approvals, error}], "errors"}
+        새 거래 전체를 메모리에 모으므로, 거래가 많으면 stream_transactions(NDJSON)를 사용
+        """
+        result = {"user_info": {}, "accounts": [], "cards": [], "errors": {}}
+        entries = {}
+
+        def entry_for(source: str, source_id: str) -> dict:
+            # 거래 이벤트가 source_done 보다 먼저 오므로 처음 나온 시점에 항목 생성
+            key = (source, source_id)
+            if key not in entries:
+                if source == "account":
+                    entries[key] = {"bank_name": None, "account_num": None, "transactions": [], "error": None}
+                    result["accounts"].append(entries[key])
+                else:
+                    entries[key] = {"card_name": None, "org_code": source_id, "approvals": [], "error": None}
+                    result["cards"].append(entries[key])
+            return entries[key]
+
+        async for event in self.stream_transactions(access_token, user_seq_no):
+            event_type = event["type"]
+            if event_type == "user_info":
+                result["user_info"] = event["user_info"]
+            elif event_type == "transaction":
+                entry = entry_for(event["source"], event["source_id"])
+                entry["transactions" if event["source"] == "account" else "approvals"].append(
+                    {key: value for key, value in event.items() if key != "type"}
+                )
+            elif event_type == "source_done":
+                entry = entry_for(event["source"], event["source_id"])
+                if event["source"] == "account":
+                    entry.update(bank_name=event["bank_name"], account_num=event["account_num"])
+                else:
+                    entry["card_name"] = event["card_name"]
+                entry["error"] = event["error"]
+            elif event_type == "done":
+                result["errors"] = event["errors"]
+        return result
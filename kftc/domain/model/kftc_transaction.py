@@ -0,0 +1,59 @@
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+
+def _to_int(value) -> int:
+    try:
+        return int(str(value).replace(",", "").strip() or 0)
+    except ValueError:
+        return 0
+
+
+@dataclass(frozen=True)
+class KftcTransaction:
+    """오픈뱅킹 계좌 거래 / 카드 승인 내역 공통 레코드"""
+    source: str             # "account" | "card"
+    source_id: str          # 계좌: fintech_use_num, 카드: org_code
+    transaction_id: str     # 원천 기준 고유 키 (중복 제거용)
+    transacted_at: str      # YYYYMMDDHHMMSS
+    amount: int
+    direction: str          # "in" | "out"
+    description: str
+    balance: Optional[int] = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_account_record(cls, fintech_use_num: str, record: dict) -> "KftcTransaction":
+        transacted_at = f"{record.get('tran_date', '')}{record.get('tran_time', '')}"
+        balance = _to_int(record.get("after_balance_amt"))
+        amount = _to_int(record.get("tran_amt"))
+        # 계좌 거래내역에는 거래 고유번호가 없어 시각 + 금액 + 거래후잔액으로 식별
+        transaction_id = f"{transacted_at}:{record.get('inout_type', '')}:{amount}:{balance}"
+        return cls(
+            source="account",
+            source_id=fintech_use_num,
+            transaction_id=transaction_id,
+            transacted_at=transacted_at,
+            amount=amount,
+            direction="in" if record.get("inout_type") == "입금" else "out",
+            description=record.get("print_content") or record.get("branch_name") or "",
+            balance=balance
+        )
+
+    @classmethod
+    def from_card_record(cls, org_code: str, record: dict) -> "KftcTransaction":
+        transacted_at = record.get("approved_dtime") or f"{record.get('approved_date', '')}{record.get('approved_time', '')}"
+        amount = _to_int(record.get("approved_amt"))
+        transaction_id = record.get("approved_num") or f"{transacted_at}:{amount}:{record.get('merchant_name', '')}"
+        return cls(
+            source="card",
+            source_id=org_code,
+            transaction_id=str(transaction_id),
+            transacted_at=transacted_at,
+            amount=amount,
+            # 승인 취소는 환입으로 처리
+            direction="in" if record.get("cancel_yn") == "Y" else "out",
+            description=record.get("merchant_name") or ""
+        )
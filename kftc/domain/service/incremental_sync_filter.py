@@ -0,0 +1,58 @@
+from typing import Optional, Set
+
+from kftc.domain.model.kftc_transaction import KftcTransaction
+
+
+class IncrementalSyncFilter:
+    """
+    증분 동기화 필터 (계좌 / 카드 하나 단위)
+
+    오픈뱅킹 조회는 일 단위라 다음 동기화는 high-water mark 날짜부터 다시 받는다.
+    그래서 그 날짜의 거래 id만 기억해 두고, 다시 내려온 거래를 id로 걸러낸다.
+    (기억하는 id는 마지막 하루치뿐이라 크기가 일정함)
+
+    조회 순서(최신순 / 과거순)와 무관하게 판단하도록, 비교 기준(저장된 mark / id)은 실행 중 바꾸지 않고
+    새 mark / id는 별도로 모아 두었다가 조회가 끝난 뒤 저장한다.
+    """
+
+    def __init__(self, high_water_mark: Optional[str] = None, boundary_ids: Optional[Set[str]] = None):
+        # 비교 기준 (이번 실행 동안 고정)
+        self.high_water_mark = high_water_mark
+        self.boundary_date = high_water_mark[:8] if high_water_mark else ""
+        self.boundary_ids: Set[str] = set(boundary_ids or ()) if high_water_mark else set()
+
+        # 조회가 끝나면 저장할 다음 상태
+        self.new_high_water_mark = self.high_water_mark
+        self.new_boundary_date = self.boundary_date
+        self.new_boundary_ids: Set[str] = set(self.boundary_ids)
+
+        self._accepted: Set[str] = set()
+        self.accepted_count = 0
+        self.skipped_count = 0
+
+    def accept(self, transaction: KftcTransaction) -> bool:
+        transacted_date = transaction.transacted_at[:8]
+        if (
+            transacted_date < self.boundary_date
+            or transaction.transaction_id in self.boundary_ids
+            or transaction.transaction_id in self._accepted
+        ):
+            self.skipped_count += 1
+            return False
+
+        self._accepted.add(transaction.transaction_id)
+        self.accepted_count += 1
+
+        if transacted_date > self.new_boundary_date:
+            self.new_boundary_date = transacted_date
+            self.new_boundary_ids = {transaction.transaction_id}
+        elif transacted_date == self.new_boundary_date:
+            self.new_boundary_ids.add(transaction.transaction_id)
+
+        if self.new_high_water_mark is None or transaction.transacted_at > self.new_high_water_mark:
+            self.new_high_water_mark = transaction.transacted_at
+        return True
+
+    @property
+    def changed(self) -> bool:
+        return self.accepted_count > 0
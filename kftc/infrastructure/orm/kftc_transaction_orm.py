@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Column, DateTime, Integer, String, UniqueConstraint
+
+from config.database.session import Base
+
+
+class KftcTransactionORM(Base):
+    __tablename__ = "kftc_transaction"
+    # 같은 거래가 다시 내려와도 한 번만 저장 (INSERT IGNORE)
+    __table_args__ = (
+        UniqueConstraint("user_seq_no", "source", "source_id", "transaction_id", name="uq_kftc_transaction_source_tx"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_seq_no = Column(String(20), nullable=False)
+    source = Column(String(10), nullable=False)          # account | card
+    source_id = Column(String(64), nullable=False)       # fintech_use_num | org_code
+    transaction_id = Column(String(128), nullable=False)
+    transacted_at = Column(String(14), nullable=False, index=True)  # YYYYMMDDHHMMSS
+    amount = Column(BigInteger, nullable=False)
+    direction = Column(String(3), nullable=False)        # in | out
+    description = Column(String(255), nullable=True)
+    balance = Column(BigInteger, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<KftcTransactionORM id={self.id} source={self.source}:{self.source_id} tx={self.transaction_id}>"
@@ -0,0 +1,63 @@
+import os
+from typing import Optional, Set, Tuple
+
+from config.redis_config import get_redis
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+
+class KftcSyncStateRepository:
+    """
+    KFTC 증분 동기화 상태 (Redis)
+
+    - kftc_sync:hwm:{user_seq_no}:{source}:{source_id}  마지막으로 받은 거래 시각 (YYYYMMDDHHMMSS)
+    - kftc_sync:ids:{user_seq_no}:{source}:{source_id}  high-water mark 날짜의 거래 id 집합
+    """
+
+    HWM_KEY_PREFIX = "kftc_sync:hwm:"
+    IDS_KEY_PREFIX = "kftc_sync:ids:"
+    STATE_TTL = int(os.getenv("KFTC_SYNC_STATE_TTL", 400 * 24 * 60 * 60))
+
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self):
+        if not hasattr(self, "redis_client"):
+            self.redis_client = get_redis()
+
+    @staticmethod
+    def _suffix(user_seq_no: str, source: str, source_id: str) -> str:
+        return f"{user_seq_no}:{source}:{source_id}"
+
+    def get(self, user_seq_no: str, source: str, source_id: str) -> Tuple[Optional[str], Set[str]]:
+        suffix = self._suffix(user_seq_no, source, source_id)
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.get(f"{self.HWM_KEY_PREFIX}{suffix}")
+        pipe.smembers(f"{self.IDS_KEY_PREFIX}{suffix}")
+        high_water_mark, boundary_ids = pipe.execute()
+        return high_water_mark, set(boundary_ids or ())
+
+    def save(self, user_seq_no: str, source: str, source_id: str,
+             high_water_mark: str, boundary_ids: Set[str]) -> None:
+        suffix = self._suffix(user_seq_no, source, source_id)
+        hwm_key = f"{self.HWM_KEY_PREFIX}{suffix}"
+        ids_key = f"{self.IDS_KEY_PREFIX}{suffix}"
+
+        pipe = self.redis_client.pipeline(transaction=True)
+        pipe.setex(hwm_key, self.STATE_TTL, high_water_mark)
+        pipe.delete(ids_key)
+        if boundary_ids:
+            pipe.sadd(ids_key, *boundary_ids)
+            pipe.expire(ids_key, self.STATE_TTL)
+        pipe.execute()
@@ -0,0 +1,78 @@
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import insert, select
+
+from config.database.session import db_session
+from kftc.domain.model.kftc_transaction import KftcTransaction
+from kftc.infrastructure.orm.kftc_transaction_orm import KftcTransactionORM
+
+
+class KftcTransactionRepository:
+    """동기화로 받은 거래 저장 / 조회 (MySQL) - 이미 저장된 거래는 유니크 키로 무시"""
+
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    async def save_all(self, user_seq_no: str, transactions: List[KftcTransaction]) -> None:
+        if not transactions:
+            return
+
+        now = datetime.utcnow()
+        rows = [
+            {
+                "user_seq_no": user_seq_no,
+                "source": transaction.source,
+                "source_id": transaction.source_id,
+                "transaction_id": transaction.transaction_id,
+                "transacted_at": transaction.transacted_at,
+                "amount": transaction.amount,
+                "direction": transaction.direction,
+                "description": transaction.description[:255],
+                "balance": transaction.balance,
+                "created_at": now
+            }
+            for transaction in transactions
+        ]
+        async with db_session() as db:
+            await db.execute(insert(KftcTransactionORM).prefix_with("IGNORE"), rows)
+            await db.commit()
+
+    @staticmethod
+    def _to_domain(orm_transaction: KftcTransactionORM) -> KftcTransaction:
+        return KftcTransaction(
+            source=orm_transaction.source,
+            source_id=orm_transaction.source_id,
+            transaction_id=orm_transaction.transaction_id,
+            transacted_at=orm_transaction.transacted_at,
+            amount=orm_transaction.amount,
+            direction=orm_transaction.direction,
+            description=orm_transaction.description or "",
+            balance=orm_transaction.balance
+        )
+
+    async def find_by_user(self, user_seq_no: str, source: Optional[str] = None, source_id: Optional[str] = None,
+                           limit: int = 100, offset: int = 0) -> List[KftcTransaction]:
+        """사용자의 저장된 거래를 최신순으로 조회 (source / source_id 로 계좌 / 카드 하나만 조회 가능)"""
+        query = select(KftcTransactionORM).where(KftcTransactionORM.user_seq_no == user_seq_no)
+        if source:
+            query = query.where(KftcTransactionORM.source == source)
+        if source_id:
+            query = query.where(KftcTransactionORM.source_id == source_id)
+        query = query.order_by(
+            KftcTransactionORM.transacted_at.desc(), KftcTransactionORM.id.desc()
+        ).limit(limit).offset(offset)
+
+        async with db_session() as db:
+            result = await db.execute(query)
+            return [self._to_domain(row) for row in result.scalars().all()]
@@ -0,0 +1,38 @@
+from typing import Optional
+
+from config.redis_config import get_redis
+
+
+class KftcUserLinkRepository:
+    """
+    로그인 세션 ↔ 오픈뱅킹 사용자(user_seq_no) 연결 (Redis)
+
+    - kftc_user:{session_id} -> user_seq_no (세션과 같은 24시간 유지)
+    - /kftc/redirect 에서 토큰 교환 후 저장하고, 저장된 거래 조회 시 호출자의 user_seq_no 를 찾는 데 사용
+    """
+
+    KEY_PREFIX = "kftc_user:"
+    LINK_TTL = 24 * 60 * 60
+
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self):
+        if not hasattr(self, "redis_client"):
+            self.redis_client = get_redis()
+
+    def save(self, session_id: str, user_seq_no: str) -> None:
+        self.redis_client.setex(f"{self.KEY_PREFIX}{session_id}", self.LINK_TTL, user_seq_no)
+
+    def get(self, session_id: str) -> Optional[str]:
+        return self.redis_client.get(f"{self.KEY_PREFIX}{session_id}")
@@ -1,12 +1,38 @@
+import asyncio
 import os
 import uuid
 
-import requests
 from datetime import datetime
+from typing import AsyncIterator, Optional
+
+from kftc.domain.model.kftc_transaction import KftcTransaction
+from util.http.shared_http_client import SharedHttpClient
 from util.log.log import Log
 
 logger = Log.get_logger()
+
+
+class KftcPageLimitExceeded(Exception):
+    """KFTC_MAX_PAGES 까지 읽고도 다음 페이지가 남음 (조회 결과가 잘림)"""
+    pass
+
+
 class KftcService:
+    """
+    오픈뱅킹(KFTC) API 클라이언트
+
+    - 공유 AsyncClient(keep-alive 커넥션 풀) 사용
+    - 호출마다 KFTC_CALL_TIMEOUT(초) 타임아웃 적용
+    - 프로세스 전체 동시 호출 수를 KFTC_MAX_CONCURRENCY로 제한 (오픈뱅킹 호출 제한)
+    """
+
+    BASE_URL = os.getenv("KFTC_API_BASE_URL", "https://testapi.openbanking.or.kr")
+    CALL_TIMEOUT = float(os.getenv("KFTC_CALL_TIMEOUT", 10))
+    MAX_CONCURRENCY = int(os.getenv("KFTC_MAX_CONCURRENCY", 5))
+    MAX_PAGES = int(os.getenv("KFTC_MAX_PAGES", 100))  # 조회 1건당 최대 페이지 수 (무한 반복 방지)
+
+    _semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+
     __instance = None
 
     def __new__(cls, *args, **kwargs):
@@ -30,30 +56,38 @@ class KftcService:
         return value
 
     @staticmethod
-    def get_access_token(auth_code: str):
-        url = "https://testapi.openbanking.or.kr/oauth/2.0/token"
+    async def _request(method: str, path: str, **kwargs) -> dict:
+        client = SharedHttpClient.get_instance().get()
+        async with KftcService._semaphore:
+            resp = await asyncio.wait_for(
+                client.request(method, f"{KftcService.BASE_URL}{path}", **kwargs),
+                timeout=KftcService.CALL_TIMEOUT
+            )
+        resp.raise_for_status()
+        return resp.json()
+
+    @staticmethod
+    async def get_access_token(auth_code: str, redirect_uri_env: str = "KFTC_REDIRECT_URI"):
+        # redirect_uri 는 인증 요청 때와 같아야 하므로 콜백 엔드포인트별 환경 변수를 사용
         data = {
             "grant_type": "authorization_code",
             "client_id": KftcService._get_env_var("KFTC_CLIENT_ID"),
             "client_secret": KftcService._get_env_var("KFTC_CLIENT_SECRET"),
             "code": auth_code,
-            "redirect_uri": KftcService._get_env_var("KFTC_REDIRECT_URI")
+            "redirect_uri": KftcService._get_env_var(redirect_uri_env)
         }
         logger.debug("[DEBUG] data fetched")
-        resp = requests.post(url, data=data)
-        return resp.json()  # access_token, refresh_token 등 포함
+        return await KftcService._request("POST", "/oauth/2.0/token", data=data)  # access_token, refresh_token 등 포함
 
     # -----------------------------
     # 2) 사용자 정보 조회 (계좌 목록)
     # -----------------------------
     @staticmethod
-    def get_user_info(access_token: str, user_seq_no: str):
-        url = "https://testapi.openbanking.or.kr/v2.0/user/me"
-
+    async def get_user_info(access_token: str, user_seq_no: str):
         headers = {"Authorization": f"Bearer {access_token}"}
         params = {"user_seq_no": user_seq_no}
 
-        return requests.get(url, headers=headers, params=params).json()
+        return await KftcService._request("GET", "/v2.0/user/me", headers=headers, params=params)
 
     # -----------------------------
     # 계좌 거래 내역 조회
@@ -63,10 +97,9 @@ class KftcService:
         return f"M202300000U{uuid.uuid4().hex[:9]}"
 
     @staticmethod
-    def get_account_transactions(access_token, bank_tran_id,
-                                 fintech_use_num, from_date, to_date):
-
-        url = "https://testapi.openbanking.or.kr/v2.0/account/transaction_list/fin_num"
+    async def get_account_transactions(access_token, bank_tran_id,
+                                       fintech_use_num, from_date, to_date,
+                                       befor_inquiry_trace_info: Optional[str] = None):
 
         headers = {
             "Authorization": f"Bearer {access_token}",
@@ -80,33 +113,34 @@ class KftcService:
             "inquiry_base": "D",
             "from_date": from_date,
             "to_date": to_date,
-            "sort_order": "D",
+            "sort_order": "A",  # 과거순 - 중간에 끊겨도 받은 데까지는 빠짐없이 연속됨
             "tran_dtime": datetime.now().strftime("%Y%m%d%H%M%S")
         }
+        if befor_inquiry_trace_info:
+            payload["befor_inquiry_trace_info"] = befor_inquiry_trace_info
 
-        return requests.post(url, data=payload, headers=headers).json()
+        return await KftcService._request(
+            "POST", "/v2.0/account/transaction_list/fin_num", data=payload, headers=headers
+        )
 
     # -----------------------------
     # 3) 카드 목록 조회
     # -----------------------------
     @staticmethod
-    def get_card_list(access_token: str, user_seq_no: str):
-        url = "https://testapi.openbanking.or.kr/v2.0/user/card-info"
-
+    async def get_card_list(access_token: str, user_seq_no: str):
         headers = {"Authorization": f"Bearer {access_token}"}
         params = {"user_seq_no": user_seq_no}
 
-        return requests.get(url, headers=headers, params=params).json()
-
-        # -----------------------------
-        # 4) 카드 승인 내역 조회
-        # -----------------------------
+        return await KftcService._request("GET", "/v2.0/user/card-info", headers=headers, params=params)
 
+    # -----------------------------
+    # 4) 카드 승인 내역 조회
+    # -----------------------------
     @staticmethod
-    def get_card_transactions(access_token, user_seq_no,
-                              org_code, from_datetime, to_datetime):
-
-        url = "https://testapi.openbanking.or.kr/v2.0/card/approval_list"
+    async def get_card_transactions(access_token, user_seq_no,
+                                    org_code, from_datetime, to_datetime,
+                                    next_page: str = "0001",
+                                    befor_inquiry_trace_info: Optional[str] = None):
 
         headers = {
             "Authorization": f"Bearer {access_token}",
@@ -119,7 +153,81 @@ class KftcService:
             "from_date": from_datetime,
             "to_date": to_datetime,
             "tran_dtime": datetime.now().strftime("%Y%m%d%H%M%S"),
-            "next_page": "0001"
+            "next_page": next_page
         }
+        if befor_inquiry_trace_info:
+            payload["befor_inquiry_trace_info"] = befor_inquiry_trace_info
+
+        return await KftcService._request("POST", "/v2.0/card/approval_list", json=payload, headers=headers)
 
-        return requests.post(url, json=payload, headers=headers).json()
\ No newline at end of file
+    # -----------------------------
+    # 5) 페이지 단위 스트리밍 조회
+    # -----------------------------
+    @staticmethod
+    def _has_next_page(page: dict) -> bool:
+        return page.get("next_page_yn") == "Y"
+
+    @staticmethod
+    async def iter_account_transactions(access_token, fintech_use_num,
+                                        from_date, to_date) -> AsyncIterator[KftcTransaction]:
+        """
+        계좌 거래내역을 과거순으로 befor_inquiry_trace_info 를 따라가며 한 건씩 반환
+
+        메모리에는 한 페이지만 유지되므로 기간이 길어도 사용량이 일정하다.
+        KFTC_MAX_PAGES 를 넘으면 KftcPageLimitExceeded (그때까지 반환한 거래 이후를 읽지 못함)
+        """
+        trace_info = None
+        for _ in range(KftcService.MAX_PAGES):
+            page = await KftcService.get_account_transactions(
+                access_token=access_token,
+                bank_tran_id=KftcService.generate_bank_tran_id(),
+                fintech_use_num=fintech_use_num,
+                from_date=from_date,
+                to_date=to_date,
+                befor_inquiry_trace_info=trace_info
+            )
+            for record in page.get("res_list", []):
+                yield KftcTransaction.from_account_record(fintech_use_num, record)
+
+            next_trace_info = page.get("befor_inquiry_trace_info")
+            if not KftcService._has_next_page(page) or not next_trace_info or next_trace_info == trace_info:
+                return
+            trace_info = next_trace_info
+
+        # 과거순 조회라 잘린 쪽은 최근 거래 - 호출 측은 받은 데까지만 동기화 상태를 갱신
+        raise KftcPageLimitExceeded(f"account transactions exceed {KftcService.MAX_PAGES} pages")
+
+    @staticmethod
+    async def iter_card_transactions(access_token, user_seq_no, org_code,
+                                     from_date, to_date) -> AsyncIterator[KftcTransaction]:
+        """
+        카드 승인내역을 next_page / befor_inquiry_trace_info 로 따라가며 한 건씩 반환 (페이지 제한은 계좌와 동일)
+
+        정렬 순서를 지정할 수 없으므로, 잘리면 이 구간에서 받은 거래가 연속된다고 볼 수 없음
+        """
+        next_page = "0001"
+        trace_info = None
+        for _ in range(KftcService.MAX_PAGES):
+            page = await KftcService.get_card_transactions(
+                access_token=access_token,
+                user_seq_no=user_seq_no,
+                org_code=org_code,
+                from_datetime=from_date,
+                to_datetime=to_date,
+                next_page=next_page,
+                befor_inquiry_trace_info=trace_info
+            )
+            for record in page.get("approval_list", []):
+                yield KftcTransaction.from_card_record(org_code, record)
+
+            if not KftcService._has_next_page(page):
+                return
+            following_page = page.get("next_page") or f"{int(next_page) + 1:04d}"
+            next_trace_info = page.get("befor_inquiry_trace_info")
+            # 서버가 같은 페이지 / 같은 trace 값을 계속 안내하면 중복 조회가 되므로 중단
+            if following_page == next_page or (next_trace_info and next_trace_info == trace_info):
+                return
+            next_page = following_page
+            trace_info = next_trace_info or trace_info
+
+        raise KftcPageLimitExceeded(f"card transactions exceed {KftcService.MAX_PAGES} pages")
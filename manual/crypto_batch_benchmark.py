@@ -0,0 +1,44 @@
+"""
+Crypto 단건/배치 암복호화 필드당 비용 측정
+
+실행: python -m manual.crypto_batch_benchmark
+"""
+import random
+import timeit
+
+from config.crypto import Crypto
+
+FIELD_COUNTS = (10, 100, 1000)
+REPEAT = 5
+
+
+def _sample_fields(count: int) -> list[str]:
+    names = ["급여", "식대", "국민연금보험료", "건강보험료", "고용보험료", "소득세", "지방소득세", "월세"]
+    fields = []
+    for i in range(count):
+        fields.append(f"소득:{random.choice(names)} {i}")
+        fields.append(str(random.randint(10_000, 10_000_000)))
+    return fields
+
+
+def _per_field_us(func, count: int) -> float:
+    best = min(timeit.repeat(func, number=1, repeat=REPEAT))
+    return best / count * 1_000_000
+
+
+def main():
+    print(f"{'fields':>8} | {'enc':>9} | {'enc_batch':>9} | {'dec':>9} | {'dec_batch':>9}  (us/field)")
+    for count in FIELD_COUNTS:
+        plain = _sample_fields(count // 2 or 1)
+        encrypted = Crypto.enc_data_batch(plain)
+
+        enc = _per_field_us(lambda: [Crypto.enc_data(t) for t in plain], len(plain))
+        enc_batch = _per_field_us(lambda: Crypto.enc_data_batch(plain), len(plain))
+        dec = _per_field_us(lambda: [Crypto.dec_data(t) for t in encrypted], len(plain))
+        dec_batch = _per_field_us(lambda: Crypto.dec_data_batch(encrypted), len(plain))
+
+        print(f"{len(plain):>8} | {enc:>9.2f} | {enc_batch:>9.2f} | {dec:>9.2f} | {dec_batch:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
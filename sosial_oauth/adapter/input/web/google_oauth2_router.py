@@ -1,9 +1,9 @@
 import uuid
-import httpx
 
-from fastapi import APIRouter, Request, Cookie, Header
+from fastapi import APIRouter, Request, Cookie, Header, Depends
 from fastapi.responses import RedirectResponse, JSONResponse
 
+from config.database.session import request_db_session
 from config.redis_config import get_redis
 from sosial_oauth.application.usecase.google_oauth2_usecase import GoogleOAuth2UseCase
 from util.log.log import Log
@@ -56,7 +56,7 @@ async def logout_to_google(request: Request, session_id: str | None = Cookie(Non
     logger.debug("Cookie deleted from response")
     return response
 
-@authentication_router.get("/google/redirect")
+@authentication_router.get("/google/redirect", dependencies=[Depends(request_db_session)])
 async def process_google_redirect(
         code: str | None = None,
         state: str | None = None,
@@ -76,8 +76,6 @@ async def process_google_redirect(
     access_token, session_id = await usecase.login_and_fetch_user(state or "", code, session_id)
 
     logger.debug("Access token fetched")
-    r = httpx.get("https://oauth2.googleapis.com/tokeninfo", params={"access_token": access_token.access_token})
-    logger.debug(f"Tokeninfo fetched from Google text: {r.text}, status: {r.status_code}")
 
     # Redis에 session 저장 (1시간 TTL)
     redis_client.hset(
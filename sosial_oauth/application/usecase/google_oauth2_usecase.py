@@ -1,10 +1,13 @@
 from typing import Any, Coroutine
 
-from account.adapter.input.web.request.create_account_request import CreateAccountRequest
 from account.application.usecase.account_usecase import AccountUseCase
 from sosial_oauth.adapter.input.web.request.get_access_token_request import GetAccessTokenRequest
 from sosial_oauth.adapter.input.web.response.access_token import AccessToken
+from sosial_oauth.infrastructure.service.google_id_token_verifier import GoogleIdTokenVerifier
 from sosial_oauth.infrastructure.service.google_oauth2_service import GoogleOAuth2Service
+from util.log.log import Log
+
+logger = Log.get_logger()
 
 account_usecase = AccountUseCase().get_instance()
 
@@ -29,10 +32,10 @@ class GoogleOAuth2UseCase:
     async def login_and_fetch_user(self, state: str, code: str, session_id: str) -> tuple[AccessToken, str]:
         try:
             # 1. Access token 획득
-            access_token = self._fetch_access_token(state, code)
+            access_token = await self._fetch_access_token(state, code)
 
             # 2. 사용자 프로필 조회
-            user_profile = self._fetch_user_profile(access_token)
+            user_profile = await self._fetch_user_profile(access_token)
 
             # 3. 계정 생성 또는 업데이트
             session_id = await self._create_or_update_account(user_profile, session_id)
@@ -42,15 +45,25 @@ class GoogleOAuth2UseCase:
             raise Exception(f"Failed to login and fetch user: {str(e)}") from e
 
     @staticmethod
-    def _fetch_access_token(state: str, code: str) -> AccessToken:
+    async def _fetch_access_token(state: str, code: str) -> AccessToken:
         # OAuth 인증 코드를 사용하여 액세스 토큰을 획득
         token_request = GetAccessTokenRequest(state=state, code=code)
-        return GoogleOAuth2Service.refresh_access_token(token_request)
+        return await GoogleOAuth2Service.refresh_access_token(token_request)
 
     @staticmethod
-    def _fetch_user_profile(access_token: AccessToken) -> dict:
+    async def _fetch_user_profile(access_token: AccessToken) -> dict:
+        # ID token을 로컬 검증해 claims를 프로필로 사용 (userinfo 호출 생략)
+        if access_token.id_token:
+            try:
+                claims = await GoogleIdTokenVerifier.get_instance().verify(access_token.id_token)
+                if claims.get("email") and claims.get("name"):
+                    return claims
+                logger.debug("ID token has no profile claims, falling back to userinfo")
+            except Exception as e:
+                logger.warning(f"ID token verification failed, falling back to userinfo: {e}")
+
         # 액세스 토큰을 사용하여 사용자 프로필을 조회
-        return GoogleOAuth2Service.fetch_user_profile(access_token)
+        return await GoogleOAuth2Service.fetch_user_profile(access_token)
 
     async def _create_or_update_account(self, user_profile: dict, session_id: str) -> str:
         # 사용자 프로필 정보를 기반으로 계정을 생성하거나 업데이트
@@ -58,11 +71,11 @@ class GoogleOAuth2UseCase:
         if not sso_id:
             raise ValueError("User profile does not contain 'sub' or 'id' field")
 
-        existing_account = account_usecase.get_account_by_oauth_id("GOOGLE", sso_id)
+        existing_account = await account_usecase.get_account_by_oauth_id("GOOGLE", sso_id)
 
         if existing_account:
             # 기존 계정이 있는 경우, 변경된 필드만 업데이트
-            self._update_account_if_changed(existing_account, user_profile)
+            await self._update_account_if_changed(existing_account, user_profile)
             session_id = existing_account.session_id
         else:
             # 새 계정 생성
@@ -70,7 +83,7 @@ class GoogleOAuth2UseCase:
 
         return session_id
     @staticmethod
-    def _update_account_if_changed(existing_account, user_profile: dict) -> None:
+    async def _update_account_if_changed(existing_account, user_profile: dict) -> None:
         # 기존 계정의 정보가 변경된 경우에만 업데이트
         name = user_profile.get("name") or ""
         profile_image = user_profile.get("picture") or ""
@@ -84,18 +97,10 @@ class GoogleOAuth2UseCase:
         )
 
         if has_changes:
-            update_request = CreateAccountRequest(
-                oauth_id=existing_account.oauth_id,
-                oauth_type=existing_account.oauth_type,
-                nickname=existing_account.nickname,
-                name=name,
-                profile_image=profile_image,
-                email=email,
-                phone_number=existing_account.phone_number,
-                active_status=existing_account.active_status,
-                role_id=existing_account.role_id,
-            )
-            account_usecase.update(update_request)
+            existing_account.name = name
+            existing_account.profile_image = profile_image
+            existing_account.email = email
+            await account_usecase.update_profile(existing_account)
 
     @staticmethod
     async def _create_new_account(user_profile: dict, sso_id: str, session_id:str) -> None:
@@ -0,0 +1,181 @@
+import asyncio
+import base64
+import binascii
+import json
+import os
+import re
+import time
+from typing import Dict, Optional, Tuple
+
+from Crypto.Hash import SHA256
+from Crypto.PublicKey import RSA
+from Crypto.Signature import pkcs1_15
+
+from config.redis_config import get_redis
+from util.http.shared_http_client import SharedHttpClient
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+
+class IdTokenVerificationError(Exception):
+    pass
+
+
+def _b64url_decode(value: str) -> bytes:
+    padding = "=" * (-len(value) % 4)
+    return base64.urlsafe_b64decode(value + padding)
+
+
+class GoogleIdTokenVerifier:
+    """
+    Google ID token(RS256) 로컬 검증
+
+    - 공개키(JWKS)는 프로세스 메모리 → Redis → Google 순으로 조회
+    - 캐시 유효기간은 JWKS 응답의 Cache-Control max-age를 따름
+    - 모르는 kid가 오면(키 교체) 한 번만 다시 받아옴
+    - GOOGLE_JWKS_FILE 을 지정하면 로컬 JWKS 파일 사용 (오프라인 테스트용)
+    """
+
+    JWKS_URL = os.getenv("GOOGLE_JWKS_URL", "https://www.googleapis.com/oauth2/v3/certs")
+    JWKS_FILE = os.getenv("GOOGLE_JWKS_FILE")
+    REDIS_KEY = "google_jwks"
+    DEFAULT_MAX_AGE = 3600
+    MIN_REFRESH_INTERVAL = 60  # kid 불일치로 인한 재조회 최소 간격(초)
+    CLOCK_SKEW = int(os.getenv("GOOGLE_ID_TOKEN_CLOCK_SKEW", 60))
+    ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self):
+        if not hasattr(self, "_keys"):
+            self.client_id = os.getenv("GOOGLE_CLIENT_ID")
+            self.redis_client = get_redis()
+            self._keys: Dict[str, RSA.RsaKey] = {}
+            self._expires_at = 0.0
+            self._fetched_at = 0.0
+            self._lock = asyncio.Lock()
+
+    # -----------------------
+    # JWKS 조회 / 캐시
+    # -----------------------
+    @staticmethod
+    def _parse_max_age(cache_control: Optional[str]) -> int:
+        match = re.search(r"max-age=(\d+)", cache_control or "")
+        return int(match.group(1)) if match else GoogleIdTokenVerifier.DEFAULT_MAX_AGE
+
+    @staticmethod
+    def _parse_jwks(jwks: dict) -> Dict[str, RSA.RsaKey]:
+        keys = {}
+        for jwk in jwks.get("keys", []):
+            if jwk.get("kty") != "RSA" or "kid" not in jwk:
+                continue
+            n = int.from_bytes(_b64url_decode(jwk["n"]), "big")
+            e = int.from_bytes(_b64url_decode(jwk["e"]), "big")
+            keys[jwk["kid"]] = RSA.construct((n, e))
+        return keys
+
+    def _set_keys(self, jwks: dict, max_age: int) -> None:
+        self._keys = self._parse_jwks(jwks)
+        self._expires_at = time.monotonic() + max_age
+        self._fetched_at = time.monotonic()
+
+    async def _download_jwks(self) -> Tuple[dict, int]:
+        if self.JWKS_FILE:
+            with open(self.JWKS_FILE, "r", encoding="utf-8") as f:
+                return json.load(f), self.DEFAULT_MAX_AGE
+
+        resp = await SharedHttpClient.get_instance().get().get(self.JWKS_URL)
+        resp.raise_for_status()
+        return resp.json(), self._parse_max_age(resp.headers.get("Cache-Control"))
+
+    async def _refresh_keys(self, force: bool = False) -> None:
+        async with self._lock:
+            # 대기 중 다른 요청이 이미 갱신했으면 생략
+            if not force and self._keys and time.monotonic() < self._expires_at:
+                return
+            if force and time.monotonic() - self._fetched_at < self.MIN_REFRESH_INTERVAL:
+                return
+
+            if not force:
+                try:
+                    cached = self.redis_client.get(self.REDIS_KEY)
+                    ttl = self.redis_client.ttl(self.REDIS_KEY) if cached else -1
+                    if cached and ttl > 0:
+                        self._set_keys(json.loads(cached), ttl)
+                        return
+                except Exception as e:
+                    logger.error(f"JWKS cache read error: {e}")
+
+            jwks, max_age = await self._download_jwks()
+            self._set_keys(jwks, max_age)
+            logger.info(f"Google JWKS refreshed: {len(self._keys)} keys, max-age={max_age}")
+
+            try:
+                self.redis_client.setex(self.REDIS_KEY, max_age, json.dumps(jwks))
+            except Exception as e:
+                logger.error(f"JWKS cache write error: {e}")
+
+    async def _get_key(self, kid: str) -> RSA.RsaKey:
+        if not self._keys or time.monotonic() >= self._expires_at:
+            await self._refresh_keys()
+
+        key = self._keys.get(kid)
+        if key is None:
+            # Google 키 교체 직후일 수 있음
+            await self._refresh_keys(force=True)
+            key = self._keys.get(kid)
+        if key is None:
+            raise IdTokenVerificationError(f"Unknown signing key: {kid}")
+        return key
+
+    # -----------------------
+    # 검증
+    # -----------------------
+    async def verify(self, id_token: str) -> dict:
+        """서명 / iss / aud / exp 검증 후 claims 반환 (실패 시 IdTokenVerificationError)"""
+        try:
+            header_b64, payload_b64, signature_b64 = id_token.split(".")
+            header = json.loads(_b64url_decode(header_b64))
+            claims = json.loads(_b64url_decode(payload_b64))
+            signature = _b64url_decode(signature_b64)
+        except (ValueError, binascii.Error) as e:
+            raise IdTokenVerificationError(f"Malformed ID token: {e}")
+        # 유효한 JSON이라도 객체가 아니면(배열, 문자열 등) 거부
+        if not isinstance(header, dict) or not isinstance(claims, dict):
+            raise IdTokenVerificationError("Malformed ID token: header and payload must be JSON objects")
+
+        if header.get("alg") != "RS256":
+            raise IdTokenVerificationError(f"Unsupported algorithm: {header.get('alg')}")
+
+        key = await self._get_key(header.get("kid"))
+        digest = SHA256.new(f"{header_b64}.{payload_b64}".encode("ascii"))
+        try:
+            pkcs1_15.new(key).verify(digest, signature)
+        except ValueError:
+            raise IdTokenVerificationError("Invalid ID token signature")
+
+        now = time.time()
+        if claims.get("iss") not in self.ISSUERS:
+            raise IdTokenVerificationError(f"Invalid issuer: {claims.get('iss')}")
+        if claims.get("aud") != self.client_id:
+            raise IdTokenVerificationError("ID token audience mismatch")
+        if float(claims.get("exp", 0)) < now - self.CLOCK_SKEW:
+            raise IdTokenVerificationError("ID token expired")
+        if float(claims.get("iat", 0)) > now + self.CLOCK_SKEW:
+            raise IdTokenVerificationError("ID token issued in the future")
+        if not claims.get("sub"):
+            raise IdTokenVerificationError("ID token has no subject")
+
+        return claims
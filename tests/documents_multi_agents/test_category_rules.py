@@ -0,0 +1,74 @@
+from documents_multi_agents.domain.service.category_rules import (
+    EXPENSE_CATEGORIZER,
+    INCOME_CATEGORIZER,
+)
+
+
+def test_split_separates_rule_matches_from_unmatched_items():
+    categorized, unmatched = INCOME_CATEGORIZER.split({
+        "기본급": "3,000,000",
+        "성과급": 500000,
+        "이자_소득": "12000",
+        "복지포인트": "100000",   # 규칙에 없음
+        "식대": "알 수 없음",      # 금액이 아님
+    })
+
+    assert categorized == {
+        "고정소득": {"기본급": 3000000},
+        "변동소득": {"성과급": 500000},
+        "기타소득": {"이자 소득": 12000},
+    }
+    assert unmatched == {"복지포인트": "100000", "식대": "알 수 없음"}
+
+
+def test_split_applies_rules_in_priority_order():
+    categorized, unmatched = EXPENSE_CATEGORIZER.split({
+        "자동차보험료": "80000",      # 보험 → 고정지출
+        "연금저축보험": "300000",     # 보험이지만 연금저축은 제외 → 저축 및 투자
+        "신용카드 사용액": "1200000",
+        "경조사비": "50000",
+    })
+
+    assert categorized["고정지출"] == {"자동차보험료": 80000}
+    assert categorized["저축 및 투자"] == {"연금저축보험": 300000}
+    assert categorized["변동지출"] == {"신용카드 사용액": 1200000}
+    assert categorized["기타 및 예비비"] == {"경조사비": 50000}
+    assert unmatched == {}
+
+
+def test_merge_adds_llm_result_and_ignores_totals():
+    categorized, _ = INCOME_CATEGORIZER.split({"기본급": "3000000"})
+
+    INCOME_CATEGORIZER.merge(categorized, {
+        "변동소득": {"특근수당": "200,000"},
+        "알수없는소득": {"복지포인트": 100000},   # 모르는 카테고리 → 마지막(기타) 카테고리
+        "카테고리별 합계": {"고정소득": 999},
+        "총소득": 999,
+        "고정소득": {"잘못된금액": "없음"},
+    })
+
+    assert categorized == {
+        "고정소득": {"기본급": 3000000},
+        "변동소득": {"특근수당": 200000},
+        "기타소득": {"복지포인트": 100000},
+    }
+
+
+def test_build_result_totals_include_uncategorized_amounts():
+    categorized, unmatched = EXPENSE_CATEGORIZER.split({
+        "월세": "700000",
+        "관리비": "150000",
+        "배달": "90000",
+        "미분류 항목": "10000",
+    })
+
+    result = EXPENSE_CATEGORIZER.build_result(categorized, unmatched)
+
+    assert result["카테고리별 합계"] == {
+        "고정지출": 850000,
+        "변동지출": 90000,
+        "저축 및 투자": 0,
+        "기타 및 예비비": 0,
+    }
+    assert result["총지출"] == 950000
+    assert result["고정지출"] == {"월세": 700000, "관리비": 150000}
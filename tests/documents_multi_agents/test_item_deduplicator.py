@@ -0,0 +1,88 @@
+from itertools import product
+
+from documents_multi_agents.domain.service.category_rules import is_aggregate_field
+from documents_multi_agents.domain.service.item_deduplicator import (
+    ItemDeduplicator,
+    deduplicate_items,
+    normalize_amount,
+)
+
+
+def _previous_loop(items):
+    """ItemDeduplicator 이전의 O(n²) 중복 제거 (금액은 쉼표 제거 후 문자열 비교)"""
+    extracted_items = {}
+    for field, value in items:
+        value_clean = value.replace(",", "").strip()
+        is_duplicate = False
+        for existing_field, existing_value in extracted_items.items():
+            if value_clean == existing_value:
+                if is_aggregate_field(field) or is_aggregate_field(existing_field):
+                    is_duplicate = True
+                    break
+        if is_duplicate:
+            continue
+        extracted_items[field] = value_clean
+    return extracted_items
+
+
+def test_normalize_amount():
+    assert normalize_amount("1,000,000") == "1000000"
+    assert normalize_amount(" 01000 ") == "1000"
+    assert normalize_amount("01000") == normalize_amount("1000")
+    assert normalize_amount("-500") == "-500"   # 숫자가 아니면 그대로 비교
+    assert normalize_amount("없음") == "없음"
+
+
+def test_aggregate_with_same_amount_is_dropped():
+    items = deduplicate_items([
+        ("기본급", "3,000,000"),
+        ("총급여", "3000000"),    # 개별 항목과 금액이 같은 합계 → 중복
+        ("식대", "200000"),
+    ])
+
+    assert items == {"기본급": "3,000,000", "식대": "200000"}
+
+
+def test_item_after_aggregate_with_same_amount_is_dropped():
+    items = deduplicate_items([("지급합계", "500000"), ("상여금", "500000")])
+
+    assert items == {"지급합계": "500000"}
+
+
+def test_non_aggregate_items_with_same_amount_are_kept():
+    items = deduplicate_items([("식대", "200000"), ("교통비", "200000")])
+
+    assert items == {"식대": "200000", "교통비": "200000"}
+
+
+def test_leading_zero_amounts_are_treated_as_equal():
+    # 이전 반복문은 문자열 그대로 비교해 "01000"과 "1000"을 다른 금액으로 봤음
+    deduplicator = ItemDeduplicator()
+
+    assert deduplicator.add("수당", "1000") is True
+    assert deduplicator.add("수당 합계", "01000") is False
+
+
+def test_overwritten_field_no_longer_counts_for_old_amount():
+    items = deduplicate_items([
+        ("기본급", "100"),
+        ("기본급", "200"),   # 같은 항목명은 덮어씀 → 100은 더 이상 보관 중이 아님
+        ("총액", "100"),
+    ])
+
+    assert items == {"기본급": "200", "총액": "100"}
+
+
+def test_matches_previous_loop_for_all_small_inputs():
+    # 금액 표기가 정규화된 입력(쉼표만 다름)에서는 이전 반복문과 결과가 같아야 함
+    fields = ("기본급", "식대", "총급여", "합계")
+    amounts = ("100", "1,00", "200")
+    pairs = [(field, amount) for field in fields for amount in amounts]
+
+    for length in range(1, 4):
+        for items in product(pairs, repeat=length):
+            expected = _previous_loop(items)
+            actual = deduplicate_items(items)
+
+            assert list(actual) == list(expected), items
+            assert {k: v.replace(",", "") for k, v in actual.items()} == expected, items
@@ -0,0 +1,75 @@
+from kftc.domain.model.kftc_transaction import KftcTransaction
+from kftc.domain.service.incremental_sync_filter import IncrementalSyncFilter
+
+
+def _transaction(transacted_at: str, transaction_id: str = None) -> KftcTransaction:
+    return KftcTransaction(
+        source="account",
+        source_id="F001",
+        transaction_id=transaction_id or transacted_at,
+        transacted_at=transacted_at,
+        amount=1000,
+        direction="out",
+        description=""
+    )
+
+
+def _run(sync_filter: IncrementalSyncFilter, transactions) -> list:
+    return [t.transacted_at for t in transactions if sync_filter.accept(t)]
+
+
+# 카드 승인내역은 정렬 순서를 지정할 수 없어 최신순으로 내려올 수 있음
+NEWEST_FIRST = [
+    _transaction("20251030090000"),
+    _transaction("20251029090000"),
+    _transaction("20251028090000"),
+]
+
+
+def test_first_sync_accepts_newest_first_history():
+    sync_filter = IncrementalSyncFilter()
+
+    assert _run(sync_filter, NEWEST_FIRST) == ["20251030090000", "20251029090000", "20251028090000"]
+    assert sync_filter.new_high_water_mark == "20251030090000"
+    assert sync_filter.new_boundary_ids == {"20251030090000"}
+
+
+def test_incremental_sync_accepts_newest_first_delta():
+    sync_filter = IncrementalSyncFilter("20251027090000", {"20251027090000"})
+
+    accepted = _run(sync_filter, NEWEST_FIRST + [_transaction("20251027090000")])
+
+    assert accepted == ["20251030090000", "20251029090000", "20251028090000"]
+    assert sync_filter.new_high_water_mark == "20251030090000"
+
+
+def test_redelivered_boundary_day_is_deduplicated_by_id():
+    sync_filter = IncrementalSyncFilter("20251030090000", {"20251030090000"})
+    later_same_day = _transaction("20251030180000")
+
+    assert _run(sync_filter, [later_same_day, _transaction("20251030090000"), _transaction("20251029090000")]) == [
+        "20251030180000"
+    ]
+    assert sync_filter.new_high_water_mark == "20251030180000"
+    assert sync_filter.new_boundary_ids == {"20251030090000", "20251030180000"}
+
+
+def test_nothing_new_keeps_state_unchanged():
+    sync_filter = IncrementalSyncFilter("20251030090000", {"20251030090000"})
+
+    assert _run(sync_filter, [_transaction("20251030090000")]) == []
+    assert not sync_filter.changed
+
+
+def test_truncated_oldest_first_sync_resumes_within_boundary_day():
+    # 계좌 조회는 과거순(sort_order=A) - 같은 날 거래 중간에서 잘려도 다음 동기화가 나머지를 받음
+    same_day = [_transaction("20251030090000"), _transaction("20251030120000"), _transaction("20251030180000")]
+    first = IncrementalSyncFilter()
+    assert _run(first, [_transaction("20251029090000")] + same_day[:2]) == [
+        "20251029090000", "20251030090000", "20251030120000"
+    ]
+
+    second = IncrementalSyncFilter(first.new_high_water_mark, first.new_boundary_ids)
+
+    assert _run(second, same_day) == ["20251030180000"]
+    assert second.new_boundary_ids == {"20251030090000", "20251030120000", "20251030180000"}
@@ -0,0 +1,128 @@
+import asyncio
+import base64
+import json
+import os
+import time
+
+import pytest
+from Crypto.Hash import SHA256
+from Crypto.PublicKey import RSA
+from Crypto.Signature import pkcs1_15
+
+# config.redis_config 는 import 시점에 포트/DB 번호를 읽음 (테스트에서는 접속하지 않음)
+os.environ.setdefault("REDIS_PORT", "6379")
+os.environ.setdefault("REDIS_DB", "0")
+
+from sosial_oauth.infrastructure.service.google_id_token_verifier import (  # noqa: E402
+    GoogleIdTokenVerifier,
+    IdTokenVerificationError,
+)
+
+CLIENT_ID = "test-client.apps.googleusercontent.com"
+KID = "test-key"
+SIGNING_KEY = RSA.generate(2048)
+OTHER_KEY = RSA.generate(2048)
+
+
+class _FakeRedis:
+    """JWKS 캐시용 Redis 대역 (항상 캐시 없음)"""
+
+    def get(self, key):
+        return None
+
+    def ttl(self, key):
+        return -2
+
+    def setex(self, key, ttl, value):
+        pass
+
+
+def _b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _int_b64url(value: int) -> str:
+    return _b64url(value.to_bytes((value.bit_length() + 7) // 8, "big"))
+
+
+def _sign(claims: dict, kid: str = KID, key: RSA.RsaKey = SIGNING_KEY) -> str:
+    header_b64 = _b64url(json.dumps({"alg": "RS256", "kid": kid}).encode())
+    payload_b64 = _b64url(json.dumps(claims).encode())
+    digest = SHA256.new(f"{header_b64}.{payload_b64}".encode("ascii"))
+    return f"{header_b64}.{payload_b64}.{_b64url(pkcs1_15.new(key).sign(digest))}"
+
+
+def _claims(**overrides) -> dict:
+    now = int(time.time())
+    claims = {
+        "iss": "https://accounts.google.com",
+        "aud": CLIENT_ID,
+        "sub": "1234567890",
+        "iat": now,
+        "exp": now + 3600,
+    }
+    claims.update(overrides)
+    return claims
+
+
+@pytest.fixture
+def verifier(tmp_path):
+    jwks_file = tmp_path / "jwks.json"
+    jwks_file.write_text(json.dumps({"keys": [{
+        "kty": "RSA",
+        "kid": KID,
+        "alg": "RS256",
+        "n": _int_b64url(SIGNING_KEY.n),
+        "e": _int_b64url(SIGNING_KEY.e),
+    }]}))
+
+    instance = GoogleIdTokenVerifier.get_instance()
+    instance.JWKS_FILE = str(jwks_file)
+    instance.client_id = CLIENT_ID
+    instance.redis_client = _FakeRedis()
+    instance._keys = {}
+    instance._expires_at = 0.0
+    instance._fetched_at = 0.0
+    return instance
+
+
+def _verify(verifier: GoogleIdTokenVerifier, token: str) -> dict:
+    return asyncio.run(verifier.verify(token))
+
+
+def test_accepts_valid_token(verifier):
+    claims = _verify(verifier, _sign(_claims()))
+
+    assert claims["sub"] == "1234567890"
+    assert claims["aud"] == CLIENT_ID
+
+
+def test_rejects_other_audience(verifier):
+    with pytest.raises(IdTokenVerificationError, match="audience"):
+        _verify(verifier, _sign(_claims(aud="other-client.apps.googleusercontent.com")))
+
+
+def test_rejects_expired_token(verifier):
+    expired_at = int(time.time()) - verifier.CLOCK_SKEW - 60
+
+    with pytest.raises(IdTokenVerificationError, match="expired"):
+        _verify(verifier, _sign(_claims(iat=expired_at - 3600, exp=expired_at)))
+
+
+def test_rejects_unknown_kid(verifier):
+    with pytest.raises(IdTokenVerificationError, match="Unknown signing key"):
+        _verify(verifier, _sign(_claims(), kid="rotated-key"))
+
+
+def test_rejects_bad_signature(verifier):
+    # 같은 kid로 다른 키가 서명
+    with pytest.raises(IdTokenVerificationError, match="signature"):
+        _verify(verifier, _sign(_claims(), key=OTHER_KEY))
+
+
+def test_rejects_non_object_payload(verifier):
+    header_b64, _, signature_b64 = _sign(_claims()).split(".")
+    token = f"{header_b64}.{_b64url(b'[1, 2]')}.{signature_b64}"
+
+    with pytest.raises(IdTokenVerificationError, match="Malformed"):
+        _verify(verifier, token)
@@ -1,18 +1,65 @@
+import asyncio
 import hashlib
 import json
-from typing import Optional, Callable, Any
+import os
+import time
+from typing import Optional, Callable, Any, Awaitable, Dict
 from functools import wraps
+from redis.exceptions import LockError
 from config.redis_config import get_redis
+from util.cache.cache_codec import CacheCodec
+from util.cache.local_lru_cache import LocalLRUCache
 from util.log.log import Log
 
 logger = Log.get_logger()
 redis_client = get_redis()
 
+# L1: 프로세스 내 LRU (선택 사항 - AI_CACHE_L1_MAX_BYTES 를 지정해야 활성화, 기본 0 = 비활성화)
+# 다른 워커에서의 무효화는 전파되지 않으므로 AI_CACHE_L1_MAX_TTL로 보관 시간을 제한
+local_cache = LocalLRUCache(
+    max_bytes=int(os.getenv("AI_CACHE_L1_MAX_BYTES", 0)),
+    max_ttl=int(os.getenv("AI_CACHE_L1_MAX_TTL", 300))
+)
+
 
 class AICache:
-    """AI 응답 캐싱을 위한 유틸리티 클래스"""
+    """AI 응답 캐싱을 위한 유틸리티 클래스 (L1: 프로세스 내 LRU, L2: Redis)"""
     
     DEFAULT_TTL = 86400  # 24시간
+    KEY_PREFIX = "ai_cache:"
+    INDEX_PREFIX = "ai_cache_index:"  # 세션별 캐시 키 목록 (Redis Set)
+    STATS_KEY = "ai_cache_stats"  # 전역 hit/miss 카운터 (Redis Hash)
+    LOCK_PREFIX = "ai_cache_lock:"  # 워커 간 single-flight 락
+    LOCK_TTL = 120  # 락 유효 시간 (초) - LLM 호출 최대 소요 시간보다 길게
+    LOCK_POLL_INTERVAL = 0.2  # 다른 워커의 결과 대기 시 폴링 간격 (초)
+
+    # 프로세스 내 진행 중인 계산 (cache_key -> Task)
+    _inflight: Dict[str, "asyncio.Task"] = {}
+
+    @staticmethod
+    def _index_key(session_id: str) -> str:
+        return f"{AICache.INDEX_PREFIX}{session_id}"
+
+    @staticmethod
+    def _incr_stat(field: str, amount: int = 1) -> None:
+        try:
+            redis_client.hincrby(AICache.STATS_KEY, field, amount)
+        except Exception as e:
+            logger.error(f"Cache stats update error: {e}")
+
+    @staticmethod
+    def _track_key(session_id: Optional[str], cache_key: str, ttl: int) -> None:
+        """세션 인덱스에 캐시 키 등록"""
+        if not session_id:
+            return
+        try:
+            index_key = AICache._index_key(session_id)
+            pipe = redis_client.pipeline(transaction=False)
+            pipe.sadd(index_key, cache_key)
+            pipe.expire(index_key, ttl)
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"Cache index update error: {e}")
     
     @staticmethod
     def generate_cache_key(data_str: str, endpoint_name: str) -> str:
@@ -32,7 +79,7 @@ class AICache:
     @staticmethod
     def get_cached_response(cache_key: str) -> Optional[str]:
         """
-        Redis에서 캐시된 응답 조회
+        L1 → Redis 순서로 캐시된 응답 조회
         
         Args:
             cache_key: 캐시 키
@@ -40,20 +87,35 @@ class AICache:
         Returns:
             캐시된 응답 또는 None
         """
+        local_data = local_cache.get(cache_key)
+        if local_data:
+            logger.info(f"✅ Cache HIT (L1): {cache_key}")
+            return local_data
+
         try:
-            cached_data = redis_client.get(cache_key)
+            # 값과 남은 TTL을 한 번의 왕복으로 조회 (L1 만료 시각을 Redis에 맞춤)
+            pipe = redis_client.pipeline(transaction=False)
+            pipe.get(cache_key)
+            pipe.pttl(cache_key)
+            cached_data, remaining_ms = pipe.execute()
             if cached_data:
+                cached_data = CacheCodec.decode(cached_data)
                 logger.info(f"✅ Cache HIT: {cache_key}")
+                AICache._incr_stat("hits")
+                if remaining_ms and remaining_ms > 0:
+                    local_cache.set(cache_key, cached_data, remaining_ms / 1000)
                 return cached_data
             else:
                 logger.info(f"❌ Cache MISS: {cache_key}")
+                AICache._incr_stat("misses")
                 return None
         except Exception as e:
             logger.error(f"Cache read error: {e}")
             return None
     
     @staticmethod
-    def set_cached_response(cache_key: str, response: str, ttl: int = DEFAULT_TTL) -> bool:
+    def set_cached_response(cache_key: str, response: str, ttl: int = DEFAULT_TTL,
+                            session_id: Optional[str] = None) -> bool:
         """
         Redis에 응답 캐싱
         
@@ -61,18 +123,140 @@ class AICache:
             cache_key: 캐시 키
             response: AI 응답
             ttl: 캐시 유효 시간 (초)
+            session_id: 세션 ID (주어지면 세션별 인덱스에 키 등록)
             
         Returns:
             성공 여부
         """
         try:
-            redis_client.setex(cache_key, ttl, response)
-            logger.info(f"💾 Cache STORED: {cache_key} (TTL: {ttl}s)")
+            # 큰 응답은 압축 envelope로 저장
+            stored_value, saved_bytes = CacheCodec.encode(response)
+
+            pipe = redis_client.pipeline(transaction=False)
+            pipe.setex(cache_key, ttl, stored_value)
+            if session_id:
+                # 세션 인덱스에 키 등록 (인덱스 TTL도 캐시 TTL에 맞춰 갱신)
+                index_key = AICache._index_key(session_id)
+                pipe.sadd(index_key, cache_key)
+                pipe.expire(index_key, ttl)
+            pipe.hincrby(AICache.STATS_KEY, "stores", 1)
+            if saved_bytes:
+                pipe.hincrby(AICache.STATS_KEY, "compressed_stores", 1)
+                pipe.hincrby(AICache.STATS_KEY, "bytes_saved", saved_bytes)
+            pipe.execute()
+            local_cache.set(cache_key, response, ttl)
+            logger.info(f"💾 Cache STORED: {cache_key} (TTL: {ttl}s, saved: {saved_bytes} bytes)")
             return True
         except Exception as e:
             logger.error(f"Cache write error: {e}")
             return False
     
+    @staticmethod
+    async def get_or_compute(
+            cache_key: str,
+            compute: Callable[[], Awaitable[str]],
+            ttl: int = DEFAULT_TTL,
+            session_id: Optional[str] = None
+    ) -> str:
+        """
+        캐시 조회 후 미스면 계산 (single-flight)
+
+        같은 캐시 키로 동시에 들어온 요청은 한 번만 계산한다.
+        - 프로세스 내: 진행 중인 Task를 함께 await
+        - 워커 간: Redis 락을 잡은 워커만 계산하고 나머지는 결과 키를 대기
+
+        Args:
+            cache_key: 캐시 키 (generate_cache_key 결과)
+            compute: 캐시 미스 시 응답을 생성하는 코루틴 함수
+            ttl: 캐시 유효 시간 (초)
+            session_id: 세션 ID (세션 인덱스 등록용)
+
+        Returns:
+            캐시된 응답 또는 새로 계산된 응답
+        """
+        cached_response = AICache.get_cached_response(cache_key)
+        if cached_response:
+            return cached_response
+
+        task = AICache._inflight.get(cache_key)
+        is_leader = task is None
+        if is_leader:
+            # 요청이 취소되어도 계산은 끝까지 진행되도록 별도 Task로 실행
+            task = asyncio.create_task(AICache._compute_once(cache_key, compute, ttl, session_id))
+            AICache._inflight[cache_key] = task
+            task.add_done_callback(lambda t: AICache._on_compute_done(cache_key, t))
+        else:
+            logger.info(f"🔗 Cache COALESCED: {cache_key}")
+            AICache._incr_stat("coalesced")
+
+        response = await asyncio.shield(task)
+        if not is_leader:
+            AICache._track_key(session_id, cache_key, ttl)
+        return response
+
+    @staticmethod
+    def _on_compute_done(cache_key: str, task: "asyncio.Task") -> None:
+        AICache._inflight.pop(cache_key, None)
+        # 대기자가 모두 취소된 경우에도 예외가 소비되도록 처리
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Cache compute error: {cache_key}: {task.exception()}")
+
+    @staticmethod
+    async def _compute_once(
+            cache_key: str,
+            compute: Callable[[], Awaitable[str]],
+            ttl: int,
+            session_id: Optional[str]
+    ) -> str:
+        lock_name = f"{AICache.LOCK_PREFIX}{cache_key}"
+        lock = redis_client.lock(lock_name, timeout=AICache.LOCK_TTL)
+
+        try:
+            acquired = lock.acquire(blocking=False)
+        except Exception as e:
+            logger.error(f"Cache lock error: {e}")
+            acquired = False
+            lock = None
+
+        if lock is not None and not acquired:
+            # 다른 워커가 계산 중 → 결과 키 대기
+            logger.info(f"⏳ Cache WAIT (other worker): {cache_key}")
+            cached_response = await AICache._wait_for_result(cache_key, lock_name)
+            if cached_response:
+                AICache._track_key(session_id, cache_key, ttl)
+                return cached_response
+            # 락이 결과 없이 풀렸으면 (실패/만료) 직접 계산
+            acquired = lock.acquire(blocking=False)
+
+        try:
+            response = await compute()
+            if response:
+                AICache.set_cached_response(cache_key, response, ttl, session_id=session_id)
+            return response
+        finally:
+            if acquired:
+                try:
+                    lock.release()
+                except LockError:
+                    # 락이 이미 만료된 경우
+                    pass
+
+    @staticmethod
+    async def _wait_for_result(cache_key: str, lock_name: str) -> Optional[str]:
+        deadline = time.monotonic() + AICache.LOCK_TTL
+        while time.monotonic() < deadline:
+            await asyncio.sleep(AICache.LOCK_POLL_INTERVAL)
+            try:
+                cached_data = redis_client.get(cache_key)
+                if cached_data:
+                    return CacheCodec.decode(cached_data)
+                if not redis_client.exists(lock_name):
+                    return CacheCodec.decode(redis_client.get(cache_key))
+            except Exception as e:
+                logger.error(f"Cache wait error: {e}")
+                return None
+        return None
+
     @staticmethod
     def invalidate_cache(cache_key: str) -> bool:
         """
@@ -85,6 +269,7 @@ class AICache:
             성공 여부
         """
         try:
+            local_cache.delete([cache_key])
             result = redis_client.delete(cache_key)
             logger.info(f"🗑️ Cache INVALIDATED: {cache_key}")
             return result > 0
@@ -104,15 +289,22 @@ class AICache:
             삭제된 캐시 개수
         """
         try:
-            # ai_cache:* 패턴의 모든 키 찾기
-            pattern = f"ai_cache:*"
-            keys = redis_client.keys(pattern)
-            
+            # 세션 인덱스에 등록된 키만 삭제 (O(해당 세션의 캐시 수))
+            index_key = AICache._index_key(session_id)
+            keys = redis_client.smembers(index_key)
+            local_cache.delete(keys)
+
+            pipe = redis_client.pipeline(transaction=False)
             if keys:
-                deleted = redis_client.delete(*keys)
-                logger.info(f"🗑️ User cache INVALIDATED: {deleted} keys deleted")
-                return deleted
-            return 0
+                pipe.delete(*keys)
+            pipe.delete(index_key)
+            results = pipe.execute()
+
+            deleted = results[0] if keys else 0
+            if deleted:
+                AICache._incr_stat("invalidations", deleted)
+            logger.info(f"🗑️ User cache INVALIDATED: {deleted} keys deleted")
+            return deleted
         except Exception as e:
             logger.error(f"User cache invalidation error: {e}")
             return 0
@@ -126,12 +318,31 @@ class AICache:
             캐시 통계 딕셔너리
         """
         try:
-            pattern = "ai_cache:*"
-            keys = redis_client.keys(pattern)
-            
+            # KEYS 대신 SCAN으로 순회 (Redis를 블로킹하지 않음)
+            total_items = 0
+            sample_keys = []
+            for key in redis_client.scan_iter(match=f"{AICache.KEY_PREFIX}*", count=500):
+                total_items += 1
+                if len(sample_keys) < 10:  # 처음 10개만
+                    sample_keys.append(key)
+
+            counters = redis_client.hgetall(AICache.STATS_KEY) or {}
+            hits = int(counters.get("hits", 0))
+            misses = int(counters.get("misses", 0))
+            lookups = hits + misses
+
             stats = {
-                "total_cached_items": len(keys),
-                "cache_keys": keys[:10] if keys else [],  # 처음 10개만
+                "total_cached_items": total_items,
+                "cache_keys": sample_keys,
+                "hits": hits,
+                "misses": misses,
+                "stores": int(counters.get("stores", 0)),
+                "invalidations": int(counters.get("invalidations", 0)),
+                "coalesced": int(counters.get("coalesced", 0)),
+                "compressed_stores": int(counters.get("compressed_stores", 0)),
+                "bytes_saved": int(counters.get("bytes_saved", 0)),
+                "hit_rate": round(hits / lookups * 100, 2) if lookups else 0.0,
+                "l1": local_cache.get_stats(),  # 이 워커의 L1 통계 (위 hits/misses는 Redis 기준)
                 "redis_info": redis_client.info("memory")
             }
             return stats
@@ -155,21 +366,16 @@ def with_cache(endpoint_name: str, ttl: int = AICache.DEFAULT_TTL):
     """
     def decorator(func: Callable) -> Callable:
         @wraps(func)
-        async def wrapper(data_str: str, *args, **kwargs) -> str:
+        async def wrapper(data_str: str, *args, session_id: Optional[str] = None, **kwargs) -> str:
             # 캐시 키 생성
             cache_key = AICache.generate_cache_key(data_str, endpoint_name)
-            
-            # 캐시 조회
-            cached_response = AICache.get_cached_response(cache_key)
-            if cached_response:
-                return cached_response
-            
-            # 캐시 미스 - 원본 함수 실행
-            response = await func(data_str, *args, **kwargs)
-            
-            # 캐시 저장
-            AICache.set_cached_response(cache_key, response, ttl)
-            
-            return response
+
+            # 캐시 조회 → 미스면 원본 함수 실행 (동시 요청은 한 번만 실행)
+            return await AICache.get_or_compute(
+                cache_key,
+                lambda: func(data_str, *args, **kwargs),
+                ttl=ttl,
+                session_id=session_id
+            )
         return wrapper
     return decorator
@@ -0,0 +1,46 @@
+import base64
+import os
+import zlib
+from typing import Tuple
+
+
+class CacheCodec:
+    """
+    AI 캐시 값 인코딩 (버전이 붙은 압축 envelope)
+
+    - 임계값 미만이거나 압축 이득이 없으면 원본 문자열 그대로 저장 (기존 항목과 동일)
+    - 그 이상은 "aic:v1:z:" + base64(zlib(utf-8)) 형태로 저장
+      (Redis 클라이언트가 decode_responses=True 이므로 바이너리 대신 base64 사용)
+    - prefix가 없는 값은 기존 평문 항목으로 간주
+    """
+
+    PREFIX = "aic:v1:"
+    ZLIB_PREFIX = PREFIX + "z:"
+    MIN_BYTES = int(os.getenv("AI_CACHE_COMPRESS_MIN_BYTES", 1024))
+    LEVEL = 6
+
+    @staticmethod
+    def encode(value: str) -> Tuple[str, int]:
+        """
+        Returns:
+            (저장할 문자열, 절약된 바이트 수)
+        """
+        raw = value.encode("utf-8")
+        if len(raw) < CacheCodec.MIN_BYTES:
+            return value, 0
+
+        compressed = base64.b64encode(zlib.compress(raw, CacheCodec.LEVEL)).decode("ascii")
+        encoded = CacheCodec.ZLIB_PREFIX + compressed
+        saved = len(raw) - len(encoded)
+        if saved <= 0:
+            return value, 0
+        return encoded, saved
+
+    @staticmethod
+    def decode(stored: str) -> str:
+        if not stored or not stored.startswith(CacheCodec.PREFIX):
+            return stored
+        if stored.startswith(CacheCodec.ZLIB_PREFIX):
+            payload = base64.b64decode(stored[len(CacheCodec.ZLIB_PREFIX):])
+            return zlib.decompress(payload).decode("utf-8")
+        raise ValueError(f"Unknown cache envelope: {stored[:16]}")
@@ -0,0 +1,94 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Iterable
+
+
+class LocalLRUCache:
+    """
+    프로세스 내 LRU 캐시 (바이트 크기 기준 제한)
+
+    - 전체 값 크기가 max_bytes를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+    - 항목별 만료 시각을 가지며 만료된 항목은 조회 시 제거
+    """
+
+    def __init__(self, max_bytes: int, max_ttl: int):
+        self.max_bytes = max_bytes
+        self.max_ttl = max_ttl
+        self._items: "OrderedDict[str, tuple[str, float, int]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def get(self, key: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+
+            value, expires_at, _ = item
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            self._items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        """ttl(초)은 Redis에 남은 TTL - L1은 max_ttl을 넘겨 보관하지 않음"""
+        if not self.enabled or ttl <= 0:
+            return
+        size = len(value.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._items:
+                self._remove(key)
+
+            expires_at = time.monotonic() + min(ttl, self.max_ttl)
+            self._items[key] = (value, expires_at, size)
+            self._size += size
+
+            while self._size > self.max_bytes:
+                oldest_key = next(iter(self._items))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def delete(self, keys: Iterable[str]) -> int:
+        deleted = 0
+        with self._lock:
+            for key in keys:
+                if key in self._items:
+                    self._remove(key)
+                    deleted += 1
+        return deleted
+
+    def _remove(self, key: str) -> None:
+        _, _, size = self._items.pop(key)
+        self._size -= size
+
+    def get_stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "items": len(self._items),
+            "bytes": self._size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups * 100, 2) if lookups else 0.0
+        }
@@ -0,0 +1,71 @@
+import importlib.util
+import os
+from typing import Optional
+
+import httpx
+
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+
+class SharedHttpClient:
+    """
+    외부 API 호출용 공유 httpx.AsyncClient (프로세스당 하나)
+
+    - keep-alive 커넥션 재사용 (매 요청 TCP/TLS 핸드셰이크 제거)
+    - h2 패키지가 설치되어 있으면 HTTP/2 사용
+    - 앱 lifespan에서 생성/종료
+    """
+
+    DEFAULT_TIMEOUT = 10.0
+    DEFAULT_CONNECT_TIMEOUT = 5.0
+    DEFAULT_MAX_CONNECTIONS = 100
+    DEFAULT_MAX_KEEPALIVE = 20
+
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self):
+        if not hasattr(self, "_client"):
+            self._client: Optional[httpx.AsyncClient] = None
+
+    @staticmethod
+    def _http2_available() -> bool:
+        return importlib.util.find_spec("h2") is not None
+
+    def get(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            http2 = os.getenv("HTTP_CLIENT_HTTP2", "true").lower() == "true"
+            if http2 and not self._http2_available():
+                logger.warning("h2 package not installed, using HTTP/1.1 for shared HTTP client")
+                http2 = False
+
+            timeout = float(os.getenv("HTTP_CLIENT_TIMEOUT", self.DEFAULT_TIMEOUT))
+            self._client = httpx.AsyncClient(
+                http2=http2,
+                timeout=httpx.Timeout(
+                    timeout,
+                    connect=float(os.getenv("HTTP_CLIENT_CONNECT_TIMEOUT", self.DEFAULT_CONNECT_TIMEOUT))
+                ),
+                limits=httpx.Limits(
+                    max_connections=int(os.getenv("HTTP_CLIENT_MAX_CONNECTIONS", self.DEFAULT_MAX_CONNECTIONS)),
+                    max_keepalive_connections=int(os.getenv("HTTP_CLIENT_MAX_KEEPALIVE", self.DEFAULT_MAX_KEEPALIVE))
+                )
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -0,0 +1,246 @@
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Optional, List, Dict, AsyncIterator
+
+import httpx
+from dotenv import load_dotenv
+from openai import AsyncOpenAI
+
+from util.log.log import Log
+
+load_dotenv()
+logger = Log.get_logger()
+
+
+class LLMGateway:
+    """
+    AsyncOpenAI 기반 LLM 호출 게이트웨이
+
+    - 하나의 이벤트 루프에서 공유 HTTP 커넥션 풀로 호출 (스레드풀 미사용)
+    - 전역 동시 호출 수 제한 + 세션별 동시 호출 수 제한
+    - 대기열 길이 / 대기 시간 지표 제공
+    """
+
+    DEFAULT_MAX_CONCURRENCY = 32
+    DEFAULT_MAX_SESSION_CONCURRENCY = 2
+    DEFAULT_TIMEOUT = 120.0
+
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self):
+        if hasattr(self, "max_concurrency"):
+            return
+
+        self.max_concurrency = int(os.getenv("LLM_MAX_CONCURRENCY", self.DEFAULT_MAX_CONCURRENCY))
+        self.max_session_concurrency = int(
+            os.getenv("LLM_MAX_SESSION_CONCURRENCY", self.DEFAULT_MAX_SESSION_CONCURRENCY)
+        )
+        self.timeout = float(os.getenv("LLM_TIMEOUT", self.DEFAULT_TIMEOUT))
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._client: Optional[AsyncOpenAI] = None
+
+        self._global_semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._session_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._session_refcounts: Dict[str, int] = {}
+
+        # 지표
+        self._waiting = 0
+        self._in_flight = 0
+        self._max_queue_depth = 0
+        self._total_calls = 0
+        self._failed_calls = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @property
+    def client(self) -> AsyncOpenAI:
+        # 앱 lifespan 종료(aclose) 후 다시 사용하면 새로 생성
+        if self._client is None or self._http_client is None or self._http_client.is_closed:
+            # 공유 커넥션 풀 (동시 호출 수 만큼 keep-alive 유지)
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency
+                ),
+                timeout=httpx.Timeout(self.timeout, connect=10.0)
+            )
+            self._client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=self._http_client)
+        return self._client
+
+    def _session_semaphore(self, session_id: str) -> asyncio.Semaphore:
+        semaphore = self._session_semaphores.get(session_id)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_session_concurrency)
+            self._session_semaphores[session_id] = semaphore
+        self._session_refcounts[session_id] = self._session_refcounts.get(session_id, 0) + 1
+        return semaphore
+
+    def _release_session(self, session_id: str) -> None:
+        remaining = self._session_refcounts.get(session_id, 1) - 1
+        if remaining <= 0:
+            # 더 이상 사용하는 호출이 없으면 세션 세마포어 정리
+            self._session_refcounts.pop(session_id, None)
+            self._session_semaphores.pop(session_id, None)
+        else:
+            self._session_refcounts[session_id] = remaining
+
+    @asynccontextmanager
+    async def slot(self, session_id: Optional[str] = None):
+        """
+        LLM 호출 슬롯 획득 (세션 제한 → 전역 제한 순서)
+
+        세션 제한을 먼저 통과해야 전역 슬롯을 잡으므로
+        한 사용자가 대기열을 쌓아도 전역 슬롯을 점유하지 않는다.
+        """
+        session_semaphore = self._session_semaphore(session_id) if session_id else None
+
+        self._waiting += 1
+        self._max_queue_depth = max(self._max_queue_depth, self._waiting)
+        wait_start = time.perf_counter()
+        acquired_session = False
+        acquired_global = False
+        try:
+            if session_semaphore is not None:
+                await session_semaphore.acquire()
+                acquired_session = True
+            await self._global_semaphore.acquire()
+            acquired_global = True
+        except BaseException:
+            self._waiting -= 1
+            if acquired_session:
+                session_semaphore.release()
+            if session_id:
+                self._release_session(session_id)
+            raise
+
+        waited = time.perf_counter() - wait_start
+        self._waiting -= 1
+        self._in_flight += 1
+        self._total_wait += waited
+        self._max_wait = max(self._max_wait, waited)
+        if waited > 1.0:
+            logger.info(f"[LLM] waited {waited:.3f}s for a slot (queue depth: {self._waiting})")
+
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            if acquired_global:
+                self._global_semaphore.release()
+            if acquired_session:
+                session_semaphore.release()
+            if session_id:
+                self._release_session(session_id)
+
+    async def chat(
+            self,
+            messages: List[Dict[str, str]],
+            model: str,
+            max_tokens: int,
+            temperature: float = 0,
+            session_id: Optional[str] = None,
+            **kwargs
+    ) -> str:
+        """
+        chat.completions 호출 후 응답 본문 반환
+
+        Args:
+            messages: OpenAI 메시지 목록
+            model: 모델명
+            max_tokens: 최대 토큰 수
+            temperature: 온도
+            session_id: 세션별 동시성 제한에 사용할 세션 ID (없으면 전역 제한만 적용)
+
+        Returns:
+            응답 텍스트
+        """
+        async with self.slot(session_id):
+            self._total_calls += 1
+            try:
+                response = await self.client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    **kwargs
+                )
+            except Exception:
+                self._failed_calls += 1
+                raise
+            return response.choices[0].message.content
+
+    async def stream_chat(
+            self,
+            messages: List[Dict[str, str]],
+            model: str,
+            max_tokens: int,
+            temperature: float = 0,
+            session_id: Optional[str] = None,
+            **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        chat.completions 스트리밍 호출 - 응답 토큰(delta)을 순서대로 yield
+
+        스트림이 끝나거나 호출 측에서 중단할 때까지 호출 슬롯을 점유한다.
+        """
+        async with self.slot(session_id):
+            self._total_calls += 1
+            try:
+                stream = await self.client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    stream=True,
+                    **kwargs
+                )
+            except Exception:
+                self._failed_calls += 1
+                raise
+
+            try:
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            except Exception:
+                self._failed_calls += 1
+                raise
+            finally:
+                # 클라이언트 연결 종료 등으로 중단되면 업스트림 스트림도 닫음
+                await stream.close()
+
+    def get_stats(self) -> dict:
+        """동시성 / 대기 지표 조회"""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_session_concurrency": self.max_session_concurrency,
+            "in_flight": self._in_flight,
+            "queue_depth": self._waiting,
+            "max_queue_depth": self._max_queue_depth,
+            "active_sessions": len(self._session_semaphores),
+            "total_calls": self._total_calls,
+            "failed_calls": self._failed_calls,
+            "avg_wait_seconds": round(self._total_wait / self._total_calls, 4) if self._total_calls else 0.0,
+            "max_wait_seconds": round(self._max_wait, 4)
+        }
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+        if self._http_client is not None:
+            await self._http_client.aclose()
+        self._client = None
+        self._http_client = None
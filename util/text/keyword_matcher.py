@@ -0,0 +1,116 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Generic, Hashable, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, TypeVar
+
+T = TypeVar("T", bound=Hashable)
+
+
+class KeywordMatcher(Generic[T]):
+    """
+    Aho-Corasick 다중 키워드 매처
+
+    키워드 수와 관계없이 문자열을 한 번만 훑어서 포함된 키워드(의 값)를 모두 찾는다.
+    생성 시 오토마타를 한 번 만들어 두고 재사용한다. (생성 후 읽기 전용 → 스레드 안전)
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, T]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[T]] = [[]]
+
+        for keyword, value in entries:
+            if keyword:
+                self._insert(keyword, value)
+        self._build_failure_links()
+
+    @classmethod
+    def from_keywords(cls, keywords: Iterable[str]) -> "KeywordMatcher[str]":
+        """키워드 자체를 값으로 사용하는 매처"""
+        return cls((keyword, keyword) for keyword in keywords)
+
+    def _insert(self, keyword: str, value: T) -> None:
+        state = 0
+        for ch in keyword:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = next_state
+        self._out[state].append(value)
+
+    def _build_failure_links(self) -> None:
+        # 루트의 자식은 실패 시 루트로 (초기값 0), 나머지는 BFS 순서로 계산
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(ch, 0)
+                # 실패 링크 상태의 출력도 함께 매칭됨 (접미사 키워드)
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+
+    def iter_matches(self, text: str) -> Iterator[T]:
+        """text에 포함된 키워드의 값을 등장 순서대로 반환 (중복 포함)"""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                yield from out[state]
+
+    def find(self, text: str) -> Set[T]:
+        return set(self.iter_matches(text))
+
+    def contains_any(self, text: str) -> bool:
+        return next(self.iter_matches(text), None) is not None
+
+
+@dataclass(frozen=True)
+class KeywordRule:
+    """
+    키워드 분류 규칙
+
+    include 중 하나가 포함되고 exclude 는 하나도 포함되지 않으면 label 에 해당
+    """
+    label: str
+    include: Tuple[str, ...]
+    exclude: Tuple[str, ...] = ()
+
+
+class KeywordClassifier:
+    """
+    include/exclude 규칙 목록을 하나의 오토마타로 컴파일한 분류기
+
+    모든 규칙의 키워드를 한 번에 매칭하므로 규칙/키워드가 늘어도 문자열당 한 번만 훑는다.
+    규칙은 순서가 곧 우선순위 (classify는 조건을 만족하는 첫 번째 규칙의 label 반환)
+    """
+
+    def __init__(self, rules: Sequence[KeywordRule]):
+        self.rules = tuple(rules)
+        entries = []
+        for index, rule in enumerate(self.rules):
+            entries.extend((keyword, (index, True)) for keyword in rule.include)
+            entries.extend((keyword, (index, False)) for keyword in rule.exclude)
+        self._matcher: KeywordMatcher[Tuple[int, bool]] = KeywordMatcher(entries)
+
+    def matching_rules(self, text: str) -> List[KeywordRule]:
+        included = set()
+        excluded = set()
+        for index, is_include in self._matcher.iter_matches(text):
+            (included if is_include else excluded).add(index)
+        return [self.rules[index] for index in sorted(included - excluded)]
+
+    def classify(self, text: str) -> Optional[str]:
+        rules = self.matching_rules(text)
+        return rules[0].label if rules else None
+
+    def matches(self, text: str) -> bool:
+        return bool(self.matching_rules(text))
@@ -0,0 +1,81 @@
+import hashlib
+from typing import Iterable, Tuple
+
+from fastapi import HTTPException, UploadFile
+from fastapi.responses import JSONResponse
+
+UPLOAD_CHUNK_SIZE = 64 * 1024  # 64KB
+MULTIPART_OVERHEAD = 64 * 1024  # 폼 필드/경계 문자열 여유분
+
+
+# -----------------------
+# UploadFile 청크 단위 읽기 (크기 제한 + 해시)
+# -----------------------
+async def read_upload_file(file: UploadFile, max_size: int) -> Tuple[bytes, str]:
+    """
+    업로드 파일을 청크 단위로 읽으면서 SHA-256을 계산하고,
+    max_size를 넘는 순간 413으로 중단한다.
+
+    Returns:
+        (파일 바이트, SHA-256 hex)
+    """
+    digest = hashlib.sha256()
+    chunks = []
+    total = 0
+
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        total += len(chunk)
+        if total > max_size:
+            raise HTTPException(413, "File too large")
+        digest.update(chunk)
+        chunks.append(chunk)
+
+    # 청크 목록을 한 번만 합쳐서 그대로 파서에 전달
+    return b"".join(chunks), digest.hexdigest()
+
+
+# -----------------------
+# 요청 본문 크기 제한 미들웨어
+# -----------------------
+class MaxBodySizeMiddleware:
+    """
+    지정한 경로의 요청 본문이 max_body_size를 넘으면 413 반환
+
+    - Content-Length가 있으면 본문을 읽기 전에 바로 거절
+    - 없으면(chunked) 수신한 바이트를 세다가 초과 시점에 중단
+      → multipart 파싱(임시 파일 스풀링) 전에 거절되므로 메모리/디스크 사용이 제한됨
+    """
+
+    def __init__(self, app, max_body_size: int, path_suffixes: Iterable[str]):
+        self.app = app
+        self.max_body_size = max_body_size
+        self.path_suffixes = tuple(path_suffixes)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].endswith(self.path_suffixes):
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        content_length = headers.get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > self.max_body_size:
+            response = JSONResponse({"detail": "File too large"}, status_code=413)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    # 본문 파싱 중 발생한 HTTPException은 FastAPI가 그대로 응답으로 변환
+                    raise HTTPException(413, "File too large")
+            return message
+
+        await self.app(scope, limited_receive, send)